@@ -0,0 +1,519 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+import baml_py
+
+from . import stream_types, types, type_builder
+from .parser import LlmResponseParser, LlmStreamParser
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
+from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME as __runtime__
+
+
+class BamlAsyncClient:
+    __options: DoNotUseDirectlyCallManager
+    __stream_client: "BamlStreamClient"
+    __http_request: "BamlHttpRequestClient"
+    __http_stream_request: "BamlHttpStreamRequestClient"
+    __llm_response_parser: LlmResponseParser
+    __llm_stream_parser: LlmStreamParser
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+        self.__stream_client = BamlStreamClient(options)
+        self.__http_request = BamlHttpRequestClient(options)
+        self.__http_stream_request = BamlHttpStreamRequestClient(options)
+        self.__llm_response_parser = LlmResponseParser(options)
+        self.__llm_stream_parser = LlmStreamParser(options)
+
+    def with_options(self,
+        tb: typing.Optional[type_builder.TypeBuilder] = None,
+        client_registry: typing.Optional[baml_py.baml_py.ClientRegistry] = None,
+        collector: typing.Optional[typing.Union[baml_py.baml_py.Collector, typing.List[baml_py.baml_py.Collector]]] = None,
+        env: typing.Optional[typing.Dict[str, typing.Optional[str]]] = None,
+        tags: typing.Optional[typing.Dict[str, str]] = None,
+        on_tick: typing.Optional[typing.Callable[[str, baml_py.baml_py.FunctionLog], None]] = None,
+    ) -> "BamlAsyncClient":
+        options: BamlCallOptions = {}
+        if tb is not None:
+            options["tb"] = tb
+        if client_registry is not None:
+            options["client_registry"] = client_registry
+        if collector is not None:
+            options["collector"] = collector
+        if env is not None:
+            options["env"] = env
+        if tags is not None:
+            options["tags"] = tags
+        if on_tick is not None:
+            options["on_tick"] = on_tick
+        return BamlAsyncClient(self.__options.merge_options(options))
+
+    @property
+    def stream(self):
+      return self.__stream_client
+
+    @property
+    def request(self):
+      return self.__http_request
+
+    @property
+    def stream_request(self):
+      return self.__http_stream_request
+
+    @property
+    def parse(self):
+      return self.__llm_response_parser
+
+    @property
+    def parse_stream(self):
+      return self.__llm_stream_parser
+    
+    async def CreateAnalysts(self, topic: str,human_analyst_feedback: str,max_analysts: int,
+        baml_options: BamlCallOptions = {},
+    ) -> types.Perspectives:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.CreateAnalysts(topic=topic,human_analyst_feedback=human_analyst_feedback,max_analysts=max_analysts,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="CreateAnalysts", args={
+                "topic": topic,"human_analyst_feedback": human_analyst_feedback,"max_analysts": max_analysts,
+            })
+            return typing.cast(types.Perspectives, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def GenerateAnswer(self, analyst_persona: str,context: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.GenerateAnswer(analyst_persona=analyst_persona,context=context,messages=messages,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="GenerateAnswer", args={
+                "analyst_persona": analyst_persona,"context": context,"messages": messages,
+            })
+            return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def GenerateQuestion(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.GenerateQuestion(analyst_persona=analyst_persona,messages=messages,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="GenerateQuestion", args={
+                "analyst_persona": analyst_persona,"messages": messages,
+            })
+            return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def GenerateQuestionWithQuery(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.InterviewTurn:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.GenerateQuestionWithQuery(analyst_persona=analyst_persona,messages=messages,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="GenerateQuestionWithQuery", args={
+                "analyst_persona": analyst_persona,"messages": messages,
+            })
+            return typing.cast(types.InterviewTurn, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def GenerateSearchQuery(self, messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.SearchQuery:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.GenerateSearchQuery(messages=messages,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="GenerateSearchQuery", args={
+                "messages": messages,
+            })
+            return typing.cast(types.SearchQuery, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def WriteConclusion(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.WriteConclusion(topic=topic,sections=sections,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="WriteConclusion", args={
+                "topic": topic,"sections": sections,
+            })
+            return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def WriteDigestedSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> types.DigestedSection:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.WriteDigestedSection(analyst_description=analyst_description,context=context,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="WriteDigestedSection", args={
+                "analyst_description": analyst_description,"context": context,
+            })
+            return typing.cast(types.DigestedSection, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def WriteIntroduction(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.WriteIntroduction(topic=topic,sections=sections,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="WriteIntroduction", args={
+                "topic": topic,"sections": sections,
+            })
+            return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def WriteReport(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.WriteReport(topic=topic,sections=sections,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="WriteReport", args={
+                "topic": topic,"sections": sections,
+            })
+            return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def WriteSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> types.ReportSection:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.WriteSection(analyst_description=analyst_description,context=context,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="WriteSection", args={
+                "analyst_description": analyst_description,"context": context,
+            })
+            return typing.cast(types.ReportSection, result.cast_to(types, types, stream_types, False, __runtime__))
+    
+
+
+class BamlStreamClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def CreateAnalysts(self, topic: str,human_analyst_feedback: str,max_analysts: int,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.Perspectives, types.Perspectives]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="CreateAnalysts", args={
+            "topic": topic,"human_analyst_feedback": human_analyst_feedback,"max_analysts": max_analysts,
+        })
+        return baml_py.BamlStream[stream_types.Perspectives, types.Perspectives](
+          result,
+          lambda x: typing.cast(stream_types.Perspectives, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.Perspectives, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def GenerateAnswer(self, analyst_persona: str,context: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="GenerateAnswer", args={
+            "analyst_persona": analyst_persona,"context": context,"messages": messages,
+        })
+        return baml_py.BamlStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def GenerateQuestion(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="GenerateQuestion", args={
+            "analyst_persona": analyst_persona,"messages": messages,
+        })
+        return baml_py.BamlStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def GenerateQuestionWithQuery(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.InterviewTurn, types.InterviewTurn]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="GenerateQuestionWithQuery", args={
+            "analyst_persona": analyst_persona,"messages": messages,
+        })
+        return baml_py.BamlStream[stream_types.InterviewTurn, types.InterviewTurn](
+          result,
+          lambda x: typing.cast(stream_types.InterviewTurn, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.InterviewTurn, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def GenerateSearchQuery(self, messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.SearchQuery, types.SearchQuery]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="GenerateSearchQuery", args={
+            "messages": messages,
+        })
+        return baml_py.BamlStream[stream_types.SearchQuery, types.SearchQuery](
+          result,
+          lambda x: typing.cast(stream_types.SearchQuery, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.SearchQuery, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def WriteConclusion(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="WriteConclusion", args={
+            "topic": topic,"sections": sections,
+        })
+        return baml_py.BamlStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def WriteDigestedSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.DigestedSection, types.DigestedSection]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="WriteDigestedSection", args={
+            "analyst_description": analyst_description,"context": context,
+        })
+        return baml_py.BamlStream[stream_types.DigestedSection, types.DigestedSection](
+          result,
+          lambda x: typing.cast(stream_types.DigestedSection, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.DigestedSection, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def WriteIntroduction(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="WriteIntroduction", args={
+            "topic": topic,"sections": sections,
+        })
+        return baml_py.BamlStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def WriteReport(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="WriteReport", args={
+            "topic": topic,"sections": sections,
+        })
+        return baml_py.BamlStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def WriteSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.ReportSection, types.ReportSection]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="WriteSection", args={
+            "analyst_description": analyst_description,"context": context,
+        })
+        return baml_py.BamlStream[stream_types.ReportSection, types.ReportSection](
+          result,
+          lambda x: typing.cast(stream_types.ReportSection, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.ReportSection, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    
+
+class BamlHttpRequestClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    async def CreateAnalysts(self, topic: str,human_analyst_feedback: str,max_analysts: int,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="CreateAnalysts", args={
+            "topic": topic,"human_analyst_feedback": human_analyst_feedback,"max_analysts": max_analysts,
+        }, mode="request")
+        return result
+    async def GenerateAnswer(self, analyst_persona: str,context: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateAnswer", args={
+            "analyst_persona": analyst_persona,"context": context,"messages": messages,
+        }, mode="request")
+        return result
+    async def GenerateQuestion(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateQuestion", args={
+            "analyst_persona": analyst_persona,"messages": messages,
+        }, mode="request")
+        return result
+    async def GenerateQuestionWithQuery(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateQuestionWithQuery", args={
+            "analyst_persona": analyst_persona,"messages": messages,
+        }, mode="request")
+        return result
+    async def GenerateSearchQuery(self, messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateSearchQuery", args={
+            "messages": messages,
+        }, mode="request")
+        return result
+    async def WriteConclusion(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteConclusion", args={
+            "topic": topic,"sections": sections,
+        }, mode="request")
+        return result
+    async def WriteDigestedSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteDigestedSection", args={
+            "analyst_description": analyst_description,"context": context,
+        }, mode="request")
+        return result
+    async def WriteIntroduction(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteIntroduction", args={
+            "topic": topic,"sections": sections,
+        }, mode="request")
+        return result
+    async def WriteReport(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteReport", args={
+            "topic": topic,"sections": sections,
+        }, mode="request")
+        return result
+    async def WriteSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteSection", args={
+            "analyst_description": analyst_description,"context": context,
+        }, mode="request")
+        return result
+    
+
+class BamlHttpStreamRequestClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    async def CreateAnalysts(self, topic: str,human_analyst_feedback: str,max_analysts: int,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="CreateAnalysts", args={
+            "topic": topic,"human_analyst_feedback": human_analyst_feedback,"max_analysts": max_analysts,
+        }, mode="stream")
+        return result
+    async def GenerateAnswer(self, analyst_persona: str,context: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateAnswer", args={
+            "analyst_persona": analyst_persona,"context": context,"messages": messages,
+        }, mode="stream")
+        return result
+    async def GenerateQuestion(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateQuestion", args={
+            "analyst_persona": analyst_persona,"messages": messages,
+        }, mode="stream")
+        return result
+    async def GenerateQuestionWithQuery(self, analyst_persona: str,messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateQuestionWithQuery", args={
+            "analyst_persona": analyst_persona,"messages": messages,
+        }, mode="stream")
+        return result
+    async def GenerateSearchQuery(self, messages: typing.List["types.Message"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="GenerateSearchQuery", args={
+            "messages": messages,
+        }, mode="stream")
+        return result
+    async def WriteConclusion(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteConclusion", args={
+            "topic": topic,"sections": sections,
+        }, mode="stream")
+        return result
+    async def WriteDigestedSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteDigestedSection", args={
+            "analyst_description": analyst_description,"context": context,
+        }, mode="stream")
+        return result
+    async def WriteIntroduction(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteIntroduction", args={
+            "topic": topic,"sections": sections,
+        }, mode="stream")
+        return result
+    async def WriteReport(self, topic: str,sections: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteReport", args={
+            "topic": topic,"sections": sections,
+        }, mode="stream")
+        return result
+    async def WriteSection(self, analyst_description: str,context: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="WriteSection", args={
+            "analyst_description": analyst_description,"context": context,
+        }, mode="stream")
+        return result
+    
+
+b = BamlAsyncClient(DoNotUseDirectlyCallManager({}))
\ No newline at end of file
@@ -0,0 +1,23 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+_file_map = {
+
+    "clients.baml": "// Learn more about clients at https://docs.boundaryml.com/docs/snippets/clients/overview\n\n// Using the new OpenAI Responses API for enhanced formatting\nclient<llm> CustomGPT5 {\n  provider openai-responses\n  options {\n    model \"gpt-5\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\nclient<llm> CustomGPT5Mini {\n  provider openai-responses\n  retry_policy Exponential\n  options {\n    model \"gpt-5-mini\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\n// Openai with chat completion\nclient<llm> CustomGPT5Chat {\n  provider openai\n  options {\n    model \"gpt-5\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\n// Latest Anthropic Claude 4 models\nclient<llm> CustomOpus4 {\n  provider anthropic\n  options {\n    model \"claude-opus-4-1-20250805\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\nclient<llm> CustomSonnet4 {\n  provider anthropic\n  options {\n    model \"claude-sonnet-4-20250514\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\nclient<llm> CustomHaiku {\n  provider anthropic\n  retry_policy Constant\n  options {\n    model \"claude-3-5-haiku-20241022\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\n// Example Google AI client (uncomment to use)\n// client<llm> CustomGemini {\n//   provider google-ai\n//   options {\n//     model \"gemini-2.5-pro\"\n//     api_key env.GOOGLE_API_KEY\n//   }\n// }\n\n// Example AWS Bedrock client (uncomment to use)\n// client<llm> CustomBedrock {\n//   provider aws-bedrock\n//   options {\n//     model \"anthropic.claude-sonnet-4-20250514-v1:0\"\n//     region \"us-east-1\"\n//     // AWS credentials are auto-detected from env vars\n//   }\n// }\n\n// Example Azure OpenAI client (uncomment to use)\n// client<llm> CustomAzure {\n//   provider azure-openai\n//   options {\n//     model \"gpt-5\"\n//     api_key env.AZURE_OPENAI_API_KEY\n//     base_url \"https://MY_RESOURCE_NAME.openai.azure.com/openai/deployments/MY_DEPLOYMENT_ID\"\n//     api_version \"2024-10-01-preview\"\n//   }\n// }\n\n// Example Vertex AI client (uncomment to use)\n// client<llm> CustomVertex {\n//   provider vertex-ai\n//   options {\n//     model \"gemini-2.5-pro\"\n//     location \"us-central1\"\n//     // Uses Google Cloud Application Default Credentials\n//   }\n// }\n\n// Example Ollama client for local models (uncomment to use)\n// client<llm> CustomOllama {\n//   provider openai-generic\n//   options {\n//     base_url \"http://localhost:11434/v1\"\n//     model \"llama4\"\n//     default_role \"user\" // Most local models prefer the user role\n//     // No API key needed for local Ollama\n//   }\n// }\n\n// https://docs.boundaryml.com/docs/snippets/clients/round-robin\nclient<llm> CustomFast {\n  provider round-robin\n  options {\n    // This will alternate between the two clients\n    strategy [CustomGPT5Mini, CustomHaiku]\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/fallback\nclient<llm> OpenaiFallback {\n  provider fallback\n  options {\n    // This will try the clients in order until one succeeds\n    strategy [CustomGPT5Mini, CustomGPT5]\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/retry\nretry_policy Constant {\n  max_retries 3\n  strategy {\n    type constant_delay\n    delay_ms 200\n  }\n}\n\nretry_policy Exponential {\n  max_retries 2\n  strategy {\n    type exponential_backoff\n    delay_ms 300\n    multiplier 1.5\n    max_delay_ms 10000\n  }\n}",
+    "generators.baml": "// This helps use auto generate libraries you can use in the language of\n// your choice. You can have multiple generators if you use multiple languages.\n// Just ensure that the output_dir is different for each generator.\ngenerator target {\n    // Valid values: \"python/pydantic\", \"typescript\", \"ruby/sorbet\", \"rest/openapi\"\n    output_type \"python/pydantic\"\n\n    // Where the generated code will be saved (relative to baml_src/)\n    output_dir \"../\"\n\n    // The version of the BAML package you have installed (e.g. same version as your baml-py or @boundaryml/baml).\n    // The BAML VSCode extension version should also match this version.\n    version \"0.212.0\"\n\n    // Valid values: \"sync\", \"async\"\n    // This controls what `b.FunctionName()` will be (sync or async).\n    default_client_mode sync\n}\n",
+    "interview.baml": "// Interview Graph Functions\n\nfunction CreateAnalysts(topic: string, human_analyst_feedback: string, max_analysts: int) -> Perspectives {\n  client GPT4o\n  prompt #\"\n    You are tasked with creating a set of AI analyst personas. Follow these instructions carefully:\n\n    1. First, review the research topic:\n    {{ topic }}\n            \n    2. Examine any editorial feedback that has been optionally provided to guide creation of the analysts: \n    {{ human_analyst_feedback }}\n        \n    3. Determine the most interesting themes based upon documents and/or feedback above.\n                        \n    4. Pick the top {{ max_analysts }} themes.\n\n    5. Assign one analyst to each theme.\n\n    Generate the set of analysts with their roles, affiliations, and descriptions.\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest create_analysts_test() {\n  functions [CreateAnalysts]\n  args {\n    topic #\"\n      best player of peñarol club\n    \"#\n    human_analyst_feedback \"\"\n    max_analysts 1\n  }\n  @@check(correct_count, {{ this.analysts|length == 1 }})\n  @@check(has_name, {{ this.analysts[0].name|length > 0 }})\n  @@check(has_role, {{ this.analysts[0].role|length > 0 }})\n  @@check(has_affiliation, {{ this.analysts[0].affiliation|length > 0 }})\n  @@check(has_description, {{ this.analysts[0].description|length > 0 }})\n  @@assert({{ _.checks.correct_count and _.checks.has_name and _.checks.has_role }})\n}\n\nfunction GenerateQuestion(analyst_persona: string, messages: Message[]) -> string {\n  client GPT4o\n  // Static instructions first, then persona, then the append-only conversation, so every\n  // turn of an interview shares the longest possible prompt prefix (provider prompt caching)\n  prompt #\"\n    {{ _.role(\"system\") }}\n    You are an analyst tasked with interviewing an expert to learn about a specific topic. \n\n    Your goal is boil down to interesting and specific insights related to your topic.\n\n    1. Interesting: Insights that people will find surprising or non-obvious.\n            \n    2. Specific: Insights that avoid generalities and include specific examples from the expert.\n\n    Begin by introducing yourself using a name that fits your persona, and then ask your question.\n\n    Continue to ask questions to drill down and refine your understanding of the topic.\n            \n    When you are satisfied with your understanding, complete the interview with: \"Thank you so much for your help!\"\n\n    Remember to stay in character throughout your response, reflecting the persona and goals provided to you.\n\n    {{ ctx.output_format }}\n\n    {{ _.role(\"user\") }}\n    Here is your persona and goals: {{ analyst_persona }}\n\n    Previous conversation:\n    {% for message in messages %}\n    {{ message.role }}: {{ message.content }}\n    {% endfor %}\n  \"#\n}\n\ntest generate_question_test() {\n  functions [GenerateQuestion]\n  args {\n    analyst_persona #\"\n      You are Dr. Sarah Chen, a sports historian and analyst specializing in South American football history. \n      Your affiliation is with the Institute of Football Culture at Universidad de la República, Uruguay. \n      You focus on legendary players and their impact on club culture, particularly interested in technical skills, \n      leadership qualities, and cultural significance within club traditions.\n    \"#\n    messages [\n      {\n        role: \"system\"\n        content: \"You are an expert on Peñarol football club history and players.\"\n      },\n      {\n        role: \"assistant\"\n        content: \"Hello, I'm Dr. Sarah Chen from the Institute of Football Culture. I'm researching the greatest players in Peñarol's history.\"\n      }\n    ]\n  }\n  @@check(substantial, {{ this|length > 20 }})\n  @@check(has_question_mark, {{ \"?\" in this }})\n  @@check(introduces_herself, {{ \"Sarah\" in this or \"Dr.\" in this }})\n  @@check(not_ending_interview, {{ \"Thank you so much for your help!\" not in this }})\n  @@assert({{ _.checks.substantial and _.checks.has_question_mark }})\n}\n\nfunction GenerateSearchQuery(messages: Message[]) -> SearchQuery {\n  client GPT4o\n  prompt #\"\n    {{ _.role(\"system\") }}\n    You will be given a conversation between an analyst and an expert. \n\n    Your goal is to generate a well-structured query for use in retrieval and/or web-search related to the conversation.\n            \n    First, analyze the full conversation.\n\n    Pay particular attention to the final question posed by the analyst.\n\n    Convert this final question into a well-structured web search query.\n\n    {{ ctx.output_format }}\n\n    {{ _.role(\"user\") }}\n    Conversation:\n    {% for message in messages %}\n    {{ message.role }}: {{ message.content }}\n    {% endfor %}\n  \"#\n}\n\ntest generate_search_query_test() {\n  functions [GenerateSearchQuery]\n  args {\n    messages [\n      {\n        role: \"assistant\"\n        content: \"I'm researching the greatest Peñarol players of all time.\"\n      },\n      {\n        role: \"user\"\n        content: \"Many consider Diego Forlán to be one of the most talented players to come from Peñarol's youth system.\"\n      },\n      {\n        role: \"assistant\"\n        content: \"Can you tell me more about Diego Forlán's early career at Peñarol and what made him stand out from other young talents?\"\n      }\n    ]\n  }\n  @@check(has_query, {{ this.search_query|length > 0 }})\n  @@check(substantial_query, {{ this.search_query|length > 10 }})\n  @@check(includes_forlan, {{ \"Forlán\" in this.search_query or \"Forlan\" in this.search_query }})\n  @@check(includes_penarol, {{ \"Peñarol\" in this.search_query or \"Penarol\" in this.search_query }})\n  @@assert({{ _.checks.has_query and _.checks.substantial_query }})\n}\n\nfunction GenerateQuestionWithQuery(analyst_persona: string, messages: Message[]) -> InterviewTurn {\n  client GPT4o\n  prompt #\"\n    {{ _.role(\"system\") }}\n    You are an analyst tasked with interviewing an expert to learn about a specific topic. \n\n    Your goal is boil down to interesting and specific insights related to your topic.\n\n    1. Interesting: Insights that people will find surprising or non-obvious.\n            \n    2. Specific: Insights that avoid generalities and include specific examples from the expert.\n\n    Begin by introducing yourself using a name that fits your persona, and then ask your question.\n\n    Continue to ask questions to drill down and refine your understanding of the topic.\n            \n    When you are satisfied with your understanding, complete the interview with: \"Thank you so much for your help!\"\n\n    Remember to stay in character throughout your response, reflecting the persona and goals provided to you.\n\n    Decide on your next question first. Then, before writing it out, convert it into a well-structured\n    web search query that will retrieve the documents the expert needs to answer it.\n\n    {{ ctx.output_format }}\n\n    {{ _.role(\"user\") }}\n    Here is your persona and goals: {{ analyst_persona }}\n\n    Previous conversation:\n    {% for message in messages %}\n    {{ message.role }}: {{ message.content }}\n    {% endfor %}\n  \"#\n}\n\ntest generate_question_with_query_test() {\n  functions [GenerateQuestionWithQuery]\n  args {\n    analyst_persona #\"\n      You are Dr. Sarah Chen, a sports historian and analyst specializing in South American football history. \n      Your affiliation is with the Institute of Football Culture at Universidad de la República, Uruguay. \n      You focus on legendary players and their impact on club culture.\n    \"#\n    messages [\n      {\n        role: \"user\"\n        content: \"So you said you were writing an article on the best players of Peñarol?\"\n      }\n    ]\n  }\n  @@check(has_query, {{ this.search_query|length > 10 }})\n  @@check(query_mentions_penarol, {{ \"Peñarol\" in this.search_query or \"Penarol\" in this.search_query }})\n  @@check(has_question_mark, {{ \"?\" in this.question }})\n  @@check(not_ending_interview, {{ \"Thank you so much for your help!\" not in this.question }})\n  @@assert({{ _.checks.has_query and _.checks.has_question_mark }})\n}\n\nfunction GenerateAnswer(analyst_persona: string, context: string, messages: Message[]) -> string {\n  client GPT4o\n  // Static instructions, persona, then the append-only context and the conversation last,\n  // so the shared prefix grows with the retrieved documents across turns (provider prompt caching)\n  prompt #\"\n    {{ _.role(\"system\") }}\n    You are an expert being interviewed by an analyst.\n            \n    You goal is to answer a question posed by the interviewer, using the context that precedes the conversation.\n\n    When answering questions, follow these guidelines:\n            \n    1. Use only the information provided in the context. \n            \n    2. Do not introduce external information or make assumptions beyond what is explicitly stated in the context.\n\n    3. The context contain sources at the topic of each individual document.\n\n    4. Include these sources your answer next to any relevant statements. For example, for source # 1 use [1]. \n\n    5. List your sources in order at the bottom of your answer. [1] Source 1, [2] Source 2, etc\n            \n    6. If the source is: <Document source=\"assistant/docs/llama3_1.pdf\" page=\"7\"/>' then just list: \n            \n    [1] assistant/docs/llama3_1.pdf, page 7 \n\n    7. Do not forget wikipedia links!\n            \n    And skip the addition of the brackets as well as the Document source preamble in your citation.\n\n    {{ ctx.output_format }}\n\n    {{ _.role(\"user\") }}\n    Here is analyst area of focus: {{ analyst_persona }}\n\n    ---------------------------------\n    To answer question, use this context:\n    {{ context }}\n    ---------------------------------\n    The question is taken from: \n    {% for message in messages %}\n      {{ message.role }}: {{ message.content }}\n    {% endfor %}\n  \"#\n}\n\ntest generate_answer_test() {\n  functions [GenerateAnswer]\n  args {\n    analyst_persona #\"\n      Sports historian focusing on South American football legends, particularly interested in \n      technical skills and cultural impact of players within their clubs.\n    \"#\n    context #\"\n      <Document source=\"peñarol_history.pdf\" page=\"15\">\n      Diego Forlán joined Peñarol's youth academy at age 12 in 1991. He quickly distinguished himself \n      with exceptional ball control and vision. His grandfather, Juan Carlos Corazzo, was also a former \n      Peñarol player, creating a family legacy. Forlán made his first-team debut in 1997 at age 18, \n      scoring 11 goals in his first season.\n      </Document>\n      \n      <Document source=\"https://wikipedia.org/wiki/Diego_Forlan\">\n      Diego Forlán Corazzo is a Uruguayan former professional footballer who played as a forward. \n      He is regarded as one of the greatest Uruguayan players of all time. Forlán had a successful \n      international career, winning the Golden Ball at the 2010 FIFA World Cup.\n      </Document>\n    \"#\n    messages [\n      {\n        role: \"assistant\"\n        content: \"I'm researching the greatest Peñarol players of all time.\"\n      },\n      {\n        role: \"user\"\n        content: \"Many consider Diego Forlán to be one of the most talented players to come from Peñarol's youth system.\"\n      },\n      {\n        role: \"assistant\"\n        content: \"Can you tell me more about Diego Forlán's early career at Peñarol and what made him stand out from other young talents?\"\n      }\n    ]\n  }\n  @@check(substantial, {{ this|length > 100 }})\n  @@check(has_citations, {{ \"[1]\" in this or \"[2]\" in this }})\n  @@check(mentions_forlan, {{ \"Diego Forlán\" in this or \"Forlan\" in this }})\n  @@check(has_sources_section, {{ \"peñarol_history.pdf\" in this and \"wikipedia.org\" in this }})\n  @@assert({{ _.checks.substantial and _.checks.has_citations }})\n}\n\n// Shared by WriteSection and WriteDigestedSection\ntemplate_string SectionInstructions(analyst_description: string) #\"\n    You are an expert technical writer. \n                \n    Your task is to create a short, easily digestible section of a report based on a set of source documents.\n\n    1. Analyze the content of the source documents: \n    - The name of each source document is at the start of the document, with the <Document tag.\n            \n    2. Create a report structure using markdown formatting:\n    - Use ## for the section title\n    - Use ### for sub-section headers\n            \n    3. Write the report following this structure:\n    a. Title (## header)\n    b. Summary (### header)\n    c. Sources (### header)\n\n    4. Make your title engaging based upon the focus area of the analyst: \n    {{ analyst_description }}\n\n    5. For the summary section:\n    - Set up summary with general background / context related to the focus area of the analyst\n    - Emphasize what is novel, interesting, or surprising about insights gathered from the interview\n    - Create a numbered list of source documents, as you use them\n    - Do not mention the names of interviewers or experts\n    - Aim for approximately 400 words maximum\n    - Use numbered sources in your report (e.g., [1], [2]) based on information from source documents\n            \n    6. In the Sources section:\n    - Include all sources used in your report\n    - Provide full links to relevant websites or specific document paths\n    - Separate each source by a newline. Use two spaces at the end of each line to create a newline in Markdown.\n    - It will look like:\n\n    ### Sources\n    [1] Link or Document name\n    [2] Link or Document name\n\n    7. Be sure to combine sources. For example this is not correct:\n\n    [3] https://ai.meta.com/blog/meta-llama-3-1/\n    [4] https://ai.meta.com/blog/meta-llama-3-1/\n\n    There should be no redundant sources. It should simply be:\n\n    [3] https://ai.meta.com/blog/meta-llama-3-1/\n            \n    8. Final review:\n    - Ensure the report follows the required structure\n    - Include no preamble before the title of the report\n    - Check that all guidelines have been followed\n\"#\n\nfunction WriteSection(analyst_description: string, context: string) -> ReportSection {\n  client GPT4o\n  prompt #\"\n    {{ SectionInstructions(analyst_description) }}\n\n    Source material:\n    {{ context }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest write_section_test() {\n  functions [WriteSection]\n  args {\n    analyst_description #\"\n      Sports historian and cultural analyst focusing on legendary South American football players, \n      their technical abilities, leadership qualities, and lasting impact on club traditions and culture.\n    \"#\n    context #\"\n      <Document source=\"peñarol_legends.pdf\" page=\"23\">\n      Diego Forlán's time at Peñarol (1997-2001) established him as one of the most promising talents \n      in Uruguayan football. His 11 goals in his debut season broke the club's record for a teenage player. \n      His technical skills, particularly his first touch and ability to create space, were exceptional for his age.\n      </Document>\n      \n      <Document source=\"https://en.wikipedia.org/wiki/Diego_Forlan\">\n      Forlán won the Pichichi Trophy twice in La Liga and was the top scorer at the 2010 World Cup. \n      His success internationally brought global recognition to Peñarol's youth development system.\n      </Document>\n      \n      <Document source=\"club_culture_study.pdf\" page=\"41\">\n      Former teammates describe Forlán as a natural leader despite his young age, often staying after \n      training to work on technique. His dedication became legendary among the youth academy players \n      who followed his example.\n      </Document>\n    \"#\n  }\n  @@check(has_main_header, {{ \"##\" in this.content }})\n  @@check(has_sub_headers, {{ \"###\" in this.content }})\n  @@check(has_summary, {{ \"### Summary\" in this.content }})\n  @@check(has_sources, {{ \"### Sources\" in this.content }})\n  @@check(has_citations, {{ \"[1]\" in this.content }})\n  @@check(reasonable_length, {{ this.content|length < 10000 }})\n  @@assert({{ _.checks.has_main_header and _.checks.has_summary and _.checks.has_sources }})\n}\n\nfunction WriteDigestedSection(analyst_description: string, context: string) -> DigestedSection {\n  client GPT4o\n  prompt #\"\n    {{ SectionInstructions(analyst_description) }}\n\n    9. Put the section in content, then digest it for the final report:\n    - title: the section title, without the leading # characters\n    - summary: around 60 words with the most novel or surprising insights, without citations\n    - insights: one or two paragraphs (around 150 words) that can be placed directly into the report's\n      narrative. Use no headers, do not mention analyst names, and keep the citations exactly as they\n      are numbered in this section's Sources.\n\n    Source material:\n    {{ context }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest write_digested_section_test() {\n  functions [WriteDigestedSection]\n  args {\n    analyst_description #\"\n      Sports historian and cultural analyst focusing on legendary South American football players.\n    \"#\n    context #\"\n      <Document source=\"peñarol_legends.pdf\" page=\"23\">\n      Diego Forlán's time at Peñarol (1997-2001) established him as one of the most promising talents \n      in Uruguayan football. His 11 goals in his debut season broke the club's record for a teenage player.\n      </Document>\n      \n      <Document source=\"https://en.wikipedia.org/wiki/Diego_Forlan\">\n      Forlán won the Pichichi Trophy twice in La Liga and was the top scorer at the 2010 World Cup.\n      </Document>\n    \"#\n  }\n  @@check(has_sources, {{ \"### Sources\" in this.content }})\n  @@check(has_title, {{ this.digest.title|length > 0 and \"#\" not in this.digest.title }})\n  @@check(has_summary, {{ this.digest.summary|length > 20 }})\n  @@check(insights_cite, {{ \"[1]\" in this.digest.insights }})\n  @@check(insights_no_headers, {{ \"#\" not in this.digest.insights }})\n  @@assert({{ _.checks.has_sources and _.checks.has_title and _.checks.insights_cite }})\n}",
+    "researcher.baml": "// Researcher Graph Functions\n\nfunction WriteReport(topic: string, sections: string) -> string {\n  client GPT4o\n  prompt #\"\n    You are a technical writer creating a report on this overall topic: \n    {{ topic }}\n        \n    You have a team of analysts. Each analyst has done two things: \n\n    1. They conducted an interview with an expert on a specific sub-topic.\n    2. They write up their finding into a memo.\n\n    Your task: \n\n    1. You will be given a collection of memos from your analysts.\n    2. Think carefully about the insights from each memo.\n    3. Consolidate these into a crisp overall summary that ties together the central ideas from all of the memos. \n    4. Summarize the central points in each memo into a cohesive single narrative.\n\n    To format your report:\n     \n    1. Use markdown formatting. \n    2. Include no pre-amble for the report.\n    3. Use no sub-heading. \n    4. Start your report with a single title header: ## Insights\n    5. Do not mention any analyst names in your report.\n    6. Preserve any citations in the memos exactly as written, for example [1] or [2]. They are already numbered consistently across all memos.\n    7. Do not add a Sources section; the list of sources is added to the report separately.\n\n    Here are the memos from your analysts to build your report from: \n    {{ sections }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest write_report_test() {\n  functions [WriteReport]\n  args {\n    topic \"Greatest Players in Peñarol Football Club History\"\n    sections #\"\n      ## Technical Excellence and Youth Development\n      \n      ### Summary\n      Diego Forlán's emergence from Peñarol's youth academy represents one of the most successful \n      talent development stories in Uruguayan football [1]. His record-breaking debut season with \n      11 goals established new benchmarks for teenage players [1]. The technical foundation he \n      developed at Peñarol became the cornerstone of his later international success [2].\n      \n      ## Cultural Impact and Leadership\n      \n      ### Summary\n      Beyond technical skills, Forlán's influence on club culture was profound [3]. His dedication \n      to extra training sessions inspired younger players and established new standards within the \n      academy [3]. This cultural legacy continues to influence Peñarol's player development approach.\n    \"#\n  }\n  @@check(starts_with_insights, {{ \"## Insights\" in this }})\n  @@check(no_sources_section, {{ \"## Sources\" not in this }})\n  @@check(preserves_citations, {{ \"[1]\" in this and \"[3]\" in this }})\n  @@check(no_analyst_names, {{ \"Dr.\" not in this and \"Sarah\" not in this }})\n  @@check(consolidated_content, {{ this|length > 100 }})\n  @@assert({{ _.checks.starts_with_insights and _.checks.no_sources_section }})\n}\n\nfunction WriteIntroduction(topic: string, sections: string) -> string {\n  client GPT4o\n  prompt #\"\n    You are a technical writer finishing a report on {{ topic }}\n\n    You will be given all of the sections of the report.\n\n    You job is to write a crisp and compelling introduction section.\n\n    Include no pre-amble for the section.\n\n    Target around 100 words, crisply previewing all of the sections of the report.\n\n    Use markdown formatting. \n\n    Create a compelling title and use the # header for the title.\n\n    Use ## Introduction as the section header. \n\n    Here are the sections to reflect on for writing: \n    {{ sections }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest write_introduction_test() {\n  functions [WriteIntroduction]\n  args {\n    topic \"Greatest Players in Peñarol Football Club History\"\n    sections #\"\n      ## Technical Excellence and Youth Development\n      Diego Forlán's emergence from Peñarol's youth academy represents a masterclass in talent development, \n      setting records and establishing new benchmarks for future generations.\n      \n      ## Cultural Impact and Leadership  \n      Beyond individual achievements, these legendary players shaped the very culture of the club, \n      creating lasting traditions that continue to influence Peñarol today.\n      \n      ## International Recognition and Legacy\n      The global success of Peñarol-developed players has elevated the club's reputation worldwide, \n      attracting international attention to Uruguay's football heritage.\n    \"#\n  }\n  @@check(has_main_title, {{ \"# \" in this }})\n  @@check(has_introduction_header, {{ \"## Introduction\" in this }})\n  @@check(appropriate_length, {{ this|length >= 50 and this|length <= 1000 }})\n  @@check(no_preamble, {{ not (this[:7] == \"Here is\" or this[:7] == \"This is\") }})\n  @@assert({{ _.checks.has_main_title and _.checks.has_introduction_header }})\n}\n\nfunction WriteConclusion(topic: string, sections: string) -> string {\n  client GPT4o\n  prompt #\"\n    You are a technical writer finishing a report on {{ topic }}\n\n    You will be given all of the sections of the report.\n\n    You job is to write a crisp and compelling conclusion section.\n\n    Include no pre-amble for the section.\n\n    Target around 100 words, crisply recapping all of the sections of the report.\n\n    Use markdown formatting. \n\n    Use ## Conclusion as the section header.\n\n    Here are the sections to reflect on for writing: \n    {{ sections }}\n\n    {{ ctx.output_format }}\n  \"#\n}\n\ntest write_conclusion_test() {\n  functions [WriteConclusion]\n  args {\n    topic \"Greatest Players in Peñarol Football Club History\"\n    sections #\"\n      ## Technical Excellence and Youth Development\n      The analysis reveals how Peñarol's systematic approach to youth development has consistently \n      produced world-class talent, with players like Diego Forlán serving as prime examples of \n      the club's technical excellence standards.\n      \n      ## Cultural Impact and Leadership\n      These legendary figures didn't just excel individually but fundamentally shaped the club's \n      identity, creating a culture of dedication and excellence that continues to inspire new generations.\n      \n      ## International Recognition and Legacy\n      The global achievements of Peñarol-developed players have established the club as a prestigious \n      institution in world football, cementing its place in international football history.\n    \"#\n  }\n  @@check(has_conclusion_header, {{ \"## Conclusion\" in this }})\n  @@check(appropriate_length, {{ this|length >= 50 and this|length <= 1000 }})\n  @@check(no_preamble, {{ not (this[:7] == \"Here is\" or this[:7] == \"This is\") }})\n  @@check(recaps_content, {{ \"Peñarol\" in this }})\n  @@assert({{ _.checks.has_conclusion_header and _.checks.appropriate_length }})\n}",
+    "shared.baml": "// Shared Schema Definitions\nclient<llm> GPT4o {\n  provider \"openai\"\n  options {\n    model \"gpt-4o\"\n    // api_key defaults to env.OPENAI_API_KEY\n  }\n}\n\nclass Analyst {\n  affiliation string @description(\"Primary affiliation of the analyst\")\n  name string @description(\"Name of the analyst\")\n  role string @description(\"Role of the analyst in the context of the topic\")\n  description string @description(\"Description of the analyst focus, concerns, and motives\")\n}\n\nclass Perspectives {\n  analysts Analyst[] @description(\"Comprehensive list of analysts with their roles and affiliations\")\n}\n\nclass SearchQuery {\n  search_query string @description(\"Search query for retrieval\")\n}\n\nclass InterviewTurn {\n  search_query string @stream.done @description(\"Search query for retrieval, written for the question below\")\n  question string @description(\"The analyst's next message to the expert, ending with the question\")\n}\n\nclass Message {\n  role string @description(\"user, assistant, or system\")\n  content string @description(\"The message content\")\n  name string? @description(\"Optional name of the message sender\")\n}\n\nclass InterviewResponse {\n  response string @description(\"The response content\")\n  should_continue bool @description(\"Whether the interview should continue\")\n}\n\nclass ReportSection {\n  content string @description(\"The section content in markdown format\")\n}\nclass SectionDigest {\n  title string @description(\"The section title, without markdown header markers\")\n  summary string @description(\"A short summary of the section's key insights\")\n  insights string @description(\"Report-ready paragraphs of the section's insights, keeping its [n] citations\")\n}\n\nclass DigestedSection {\n  content string @description(\"The section content in markdown format\")\n  digest SectionDigest\n}\n",
+}
+
+def get_baml_files():
+    return _file_map
\ No newline at end of file
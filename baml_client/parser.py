@@ -0,0 +1,155 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+
+import baml_py
+
+from . import stream_types, types
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
+
+class LlmResponseParser:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def CreateAnalysts(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.Perspectives:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="CreateAnalysts", llm_response=llm_response, mode="request")
+        return typing.cast(types.Perspectives, result)
+
+    def GenerateAnswer(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateAnswer", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    def GenerateQuestion(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateQuestion", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    def GenerateQuestionWithQuery(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.InterviewTurn:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateQuestionWithQuery", llm_response=llm_response, mode="request")
+        return typing.cast(types.InterviewTurn, result)
+
+    def GenerateSearchQuery(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.SearchQuery:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateSearchQuery", llm_response=llm_response, mode="request")
+        return typing.cast(types.SearchQuery, result)
+
+    def WriteConclusion(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteConclusion", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    def WriteDigestedSection(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.DigestedSection:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteDigestedSection", llm_response=llm_response, mode="request")
+        return typing.cast(types.DigestedSection, result)
+
+    def WriteIntroduction(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteIntroduction", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    def WriteReport(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteReport", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    def WriteSection(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.ReportSection:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteSection", llm_response=llm_response, mode="request")
+        return typing.cast(types.ReportSection, result)
+
+    
+
+class LlmStreamParser:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def CreateAnalysts(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.Perspectives:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="CreateAnalysts", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.Perspectives, result)
+
+    def GenerateAnswer(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateAnswer", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    def GenerateQuestion(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateQuestion", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    def GenerateQuestionWithQuery(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.InterviewTurn:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateQuestionWithQuery", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.InterviewTurn, result)
+
+    def GenerateSearchQuery(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.SearchQuery:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="GenerateSearchQuery", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.SearchQuery, result)
+
+    def WriteConclusion(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteConclusion", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    def WriteDigestedSection(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.DigestedSection:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteDigestedSection", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.DigestedSection, result)
+
+    def WriteIntroduction(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteIntroduction", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    def WriteReport(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteReport", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    def WriteSection(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.ReportSection:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="WriteSection", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.ReportSection, result)
+
+    
\ No newline at end of file
@@ -0,0 +1,68 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from pydantic import BaseModel, ConfigDict
+
+import baml_py
+
+from . import types
+
+StreamStateValueT = typing.TypeVar('StreamStateValueT')
+class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
+    value: StreamStateValueT
+    state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
+# #########################################################################
+# Generated classes (9)
+# #########################################################################
+
+class Analyst(BaseModel):
+    affiliation: typing.Optional[str] = None
+    name: typing.Optional[str] = None
+    role: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+
+class DigestedSection(BaseModel):
+    content: typing.Optional[str] = None
+    digest: typing.Optional["SectionDigest"] = None
+
+class InterviewResponse(BaseModel):
+    response: typing.Optional[str] = None
+    should_continue: typing.Optional[bool] = None
+
+class InterviewTurn(BaseModel):
+    search_query: typing.Optional[str] = None
+    question: typing.Optional[str] = None
+
+class Message(BaseModel):
+    role: typing.Optional[str] = None
+    content: typing.Optional[str] = None
+    name: typing.Optional[str] = None
+
+class Perspectives(BaseModel):
+    analysts: typing.List["Analyst"]
+
+class ReportSection(BaseModel):
+    content: typing.Optional[str] = None
+
+class SearchQuery(BaseModel):
+    search_query: typing.Optional[str] = None
+
+class SectionDigest(BaseModel):
+    title: typing.Optional[str] = None
+    summary: typing.Optional[str] = None
+    insights: typing.Optional[str] = None
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
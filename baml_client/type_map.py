@@ -0,0 +1,47 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+from . import types
+from . import stream_types
+
+
+type_map = {
+
+    "types.Analyst": types.Analyst,
+    "stream_types.Analyst": stream_types.Analyst,
+
+    "types.DigestedSection": types.DigestedSection,
+    "stream_types.DigestedSection": stream_types.DigestedSection,
+
+    "types.InterviewResponse": types.InterviewResponse,
+    "stream_types.InterviewResponse": stream_types.InterviewResponse,
+
+    "types.InterviewTurn": types.InterviewTurn,
+    "stream_types.InterviewTurn": stream_types.InterviewTurn,
+
+    "types.Message": types.Message,
+    "stream_types.Message": stream_types.Message,
+
+    "types.Perspectives": types.Perspectives,
+    "stream_types.Perspectives": stream_types.Perspectives,
+
+    "types.ReportSection": types.ReportSection,
+    "stream_types.ReportSection": stream_types.ReportSection,
+
+    "types.SearchQuery": types.SearchQuery,
+    "stream_types.SearchQuery": stream_types.SearchQuery,
+
+    "types.SectionDigest": types.SectionDigest,
+    "stream_types.SectionDigest": stream_types.SectionDigest,
+
+
+}
\ No newline at end of file
@@ -0,0 +1,86 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from enum import Enum
+
+
+from pydantic import BaseModel, ConfigDict
+
+
+import baml_py
+
+CheckT = typing_extensions.TypeVar('CheckT')
+CheckName = typing_extensions.TypeVar('CheckName', bound=str)
+
+class Check(BaseModel):
+    name: str
+    expression: str
+    status: str
+class Checked(BaseModel, typing.Generic[CheckT, CheckName]):
+    value: CheckT
+    checks: typing.Dict[CheckName, Check]
+
+def get_checks(checks: typing.Dict[CheckName, Check]) -> typing.List[Check]:
+    return list(checks.values())
+
+def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
+    return all(check.status == "succeeded" for check in get_checks(checks))
+# #########################################################################
+# Generated enums (0)
+# #########################################################################
+
+# #########################################################################
+# Generated classes (9)
+# #########################################################################
+
+class Analyst(BaseModel):
+    affiliation: str
+    name: str
+    role: str
+    description: str
+
+class DigestedSection(BaseModel):
+    content: str
+    digest: "SectionDigest"
+
+class InterviewResponse(BaseModel):
+    response: str
+    should_continue: bool
+
+class InterviewTurn(BaseModel):
+    search_query: str
+    question: str
+
+class Message(BaseModel):
+    role: str
+    content: str
+    name: typing.Optional[str] = None
+
+class Perspectives(BaseModel):
+    analysts: typing.List["Analyst"]
+
+class ReportSection(BaseModel):
+    content: str
+
+class SearchQuery(BaseModel):
+    search_query: str
+
+class SectionDigest(BaseModel):
+    title: str
+    summary: str
+    insights: str
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
@@ -0,0 +1,53 @@
+# Offline/nightly research: run many topics with every LLM call sent through a provider batch API
+import argparse
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables before the graphs read their settings
+load_dotenv()
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+from graphs.batch import BatchRunner, BatchStore
+from graphs.researcher_graph import get_research_graph_builder
+
+def main():
+    parser = argparse.ArgumentParser(description="Run research topics in batch mode")
+    parser.add_argument("topics", help="Text file with one topic per line")
+    parser.add_argument("--max-analysts", type=int, default=2)
+    parser.add_argument("--out", default="reports", help="Directory for the final reports")
+    parser.add_argument("--state", default=".research_cache/batch.sqlite", help="SQLite file for checkpoints and submitted batches")
+    parser.add_argument("--resume", metavar="JOB_ID", help="Continue an interrupted job with the same topics file")
+    args = parser.parse_args()
+
+    topics = [line.strip() for line in Path(args.topics).read_text().splitlines() if line.strip()]
+    run_id = args.resume or datetime.now().strftime("%Y%m%d_%H%M%S")
+    inputs = {
+        f"batch_{run_id}_{i}": {"topic": topic, "max_analysts": args.max_analysts, "human_analyst_feedback": "approve"}
+        for i, topic in enumerate(topics)
+    }
+
+    # Checkpoints and submitted batch ids survive a restart; jobs wait on provider batches for hours
+    Path(args.state).parent.mkdir(parents=True, exist_ok=True)
+    checkpointer = SqliteSaver(sqlite3.connect(args.state, check_same_thread=False))
+
+    # Speculative turns run outside the graph and cannot be batched
+    graph = get_research_graph_builder(speculative=False).compile(checkpointer=checkpointer)
+    runner = BatchRunner(graph, store=BatchStore(args.state))
+
+    print(f"🔬 Batch research {run_id}: {len(topics)} topics (resume with --resume {run_id})")
+    results = runner.run(inputs)
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for thread_id, result in results.items():
+        if "error" in result:
+            print(f"❌ {inputs[thread_id]['topic']}: {result['error']}")
+            continue
+        (out_dir / f"{thread_id}.md").write_text(result.get("final_report", ""))
+        print(f"✅ {inputs[thread_id]['topic']}")
+    print(f"📄 Reports in {out_dir}/ after {runner.rounds} batch rounds")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+# Batch execution - LLM calls of many queued runs go through a provider batch endpoint
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from urllib.parse import urlparse
+from langgraph.config import get_config
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Command, interrupt
+from graphs.prompt_cache import prompt_cache_stats, response_usage
+from graphs.settings import env_float, env_str
+
+# Batches that reached one of these states will not change any more
+BATCH_FINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+class BatchRequest(TypedDict):
+    function: str # BAML function name
+    url: str # Provider URL the request would have been sent to
+    body: dict # Rendered request body
+
+class BatchRequestError(Exception):
+    """Raised inside a node when its batched LLM request failed"""
+
+def batch_requested() -> bool:
+    """True when the current graph run was started with configurable batch_llm=True"""
+    try:
+        config = get_config()
+    except RuntimeError:
+        # Not inside a graph run (e.g. speculative turns)
+        return False
+    return bool(config.get("configurable", {}).get("batch_llm"))
+
+def batched_llm_call(client: Any, function_name: str, args: tuple, kwargs: dict) -> Tuple[Any, BatchRequest, str]:
+    """
+    Render a BAML call and pause the run until the batch runner resumes it with the output.
+
+    The first execution interrupts with the rendered request; when the node is
+    replayed on resume, interrupt() returns the raw completion text, which BAML
+    parses into the function's return type. Returns (result, request, text).
+    """
+    http_request = getattr(client.request, function_name)(*args, **kwargs)
+    request: BatchRequest = {"function": function_name, "url": http_request.url, "body": http_request.body.json()}
+
+    response = interrupt({"batch_request": request})
+    if isinstance(response, dict) and "error" in response:
+        raise BatchRequestError(f"{function_name} batch request failed: {response['error']}")
+
+    return getattr(client.parse, function_name)(response), request, response
+
+def completion_text(body: dict) -> str:
+    """Output text of a chat completions or responses API body"""
+    if body.get("choices"):
+        return body["choices"][0]["message"].get("content") or ""
+    if body.get("output_text"):
+        return body["output_text"]
+    return "".join(
+        part.get("text", "")
+        for item in body.get("output", []) if item.get("type") == "message"
+        for part in item.get("content", [])
+    )
+
+class OpenAIBatchClient:
+    """
+    Submits requests through an OpenAI-compatible Files + Batches API and waits for the results.
+
+    RESEARCH_BATCH_BASE_URL points it at another compatible server, such as the
+    local stand-in in tests/batch_server.py; RESEARCH_BATCH_API_KEY overrides OPENAI_API_KEY.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, poll_seconds: Optional[float] = None, completion_window: str = "24h"):
+        from openai import OpenAI
+        self.client = OpenAI(
+            base_url=base_url or env_str("RESEARCH_BATCH_BASE_URL") or None,
+            api_key=env_str("RESEARCH_BATCH_API_KEY") or None,
+        )
+        self.poll_seconds = poll_seconds or env_float("RESEARCH_BATCH_POLL_SECONDS", 30.0)
+        self.completion_window = completion_window
+
+    def submit(self, requests: Dict[str, BatchRequest]) -> Dict[str, Dict[str, str]]:
+        """Submit one batch per endpoint; returns batch id -> {custom_id: BAML function}"""
+        by_endpoint: Dict[str, Dict[str, BatchRequest]] = {}
+        for custom_id, request in requests.items():
+            by_endpoint.setdefault(urlparse(request["url"]).path, {})[custom_id] = request
+
+        submitted: Dict[str, Dict[str, str]] = {}
+        for endpoint, endpoint_requests in by_endpoint.items():
+            lines = [
+                json.dumps({"custom_id": custom_id, "method": "POST", "url": endpoint, "body": request["body"]})
+                for custom_id, request in endpoint_requests.items()
+            ]
+            input_file = self.client.files.create(file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+            batch = self.client.batches.create(input_file_id=input_file.id, endpoint=endpoint, completion_window=self.completion_window)
+            print(f"📦 Submitted batch {batch.id}: {len(lines)} requests to {endpoint}")
+            submitted[batch.id] = {custom_id: request["function"] for custom_id, request in endpoint_requests.items()}
+        return submitted
+
+    def wait(self, batch_id: str, functions: Dict[str, str]) -> Dict[str, Any]:
+        """Poll a submitted batch until it is final; returns custom_id -> completion text or {"error": ...}"""
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in BATCH_FINAL_STATES:
+            time.sleep(self.poll_seconds)
+            batch = self.client.batches.retrieve(batch_id)
+        print(f"📦 Batch {batch.id} {batch.status}")
+
+        results: Dict[str, Any] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code", 200) >= 400:
+                    results[record["custom_id"]] = {"error": record.get("error") or response.get("body")}
+                else:
+                    body = response.get("body") or {}
+                    results[record["custom_id"]] = completion_text(body)
+                    usage = response_usage(body)
+                    if usage is not None:
+                        prompt_cache_stats.record(functions.get(record["custom_id"], "unknown"), usage)
+        return results
+
+class BatchStore:
+    """
+    On-disk record of submitted batches and the custom_ids each one carries.
+
+    Lets a restarted BatchRunner re-attach to batches that are still queued at
+    the provider instead of submitting (and paying for) the same calls again.
+    A batch is forgotten once the runs waiting on it have been resumed.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS batches (batch_id TEXT PRIMARY KEY, submitted_at REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS batch_requests (custom_id TEXT PRIMARY KEY, batch_id TEXT NOT NULL, function TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def record(self, submitted: Dict[str, Dict[str, str]]):
+        with self._lock:
+            for batch_id, functions in submitted.items():
+                self._conn.execute("INSERT OR REPLACE INTO batches (batch_id, submitted_at) VALUES (?, ?)", (batch_id, time.time()))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO batch_requests (custom_id, batch_id, function) VALUES (?, ?, ?)",
+                    [(custom_id, batch_id, function) for custom_id, function in functions.items()],
+                )
+            self._conn.commit()
+
+    def submitted(self, custom_ids: List[str]) -> Dict[str, Dict[str, str]]:
+        """Batches already carrying some of these custom_ids: batch id -> {custom_id: BAML function}"""
+        found: Dict[str, Dict[str, str]] = {}
+        with self._lock:
+            for custom_id in custom_ids:
+                row = self._conn.execute("SELECT batch_id, function FROM batch_requests WHERE custom_id = ?", (custom_id,)).fetchone()
+                if row:
+                    found.setdefault(row[0], {})[custom_id] = row[1]
+        return found
+
+    def forget(self, batch_ids: List[str]):
+        with self._lock:
+            for batch_id in batch_ids:
+                self._conn.execute("DELETE FROM batch_requests WHERE batch_id = ?", (batch_id,))
+                self._conn.execute("DELETE FROM batches WHERE batch_id = ?", (batch_id,))
+            self._conn.commit()
+
+class BatchRunner:
+    """
+    Drives many research threads in lockstep rounds of batched LLM calls.
+
+    Each round advances every pending thread until all of its branches are
+    waiting on an LLM call, submits those calls as one provider batch, and
+    resumes each thread from its checkpoint with the results. Calls that are
+    independent across runs at the same stage (all CreateAnalysts, all
+    WriteSection, the reduce phase) therefore share a batch.
+
+    With a persistent checkpointer and a BatchStore, run() can be called again
+    after a restart with the same thread ids: finished threads are returned from
+    their checkpoints, paused ones re-attach to the batches already submitted.
+    """
+
+    def __init__(
+        self,
+        graph: CompiledStateGraph,
+        batch_client: Optional[OpenAIBatchClient] = None,
+        max_workers: int = 16,
+        store: Optional[BatchStore] = None,
+    ):
+        if graph.checkpointer is None:
+            raise ValueError("BatchRunner needs a graph compiled with a checkpointer")
+        self.graph = graph
+        self.batch_client = batch_client or OpenAIBatchClient()
+        self.max_workers = max_workers
+        self.store = store
+        self.rounds = 0
+
+    def config(self, thread_id: str) -> dict:
+        return {"configurable": {"thread_id": thread_id, "batch_llm": True}, "recursion_limit": 50}
+
+    def run(self, inputs: Dict[str, dict]) -> Dict[str, dict]:
+        """Run thread_id -> graph input to completion; returns thread_id -> final state or {"error": ...}"""
+        results: Dict[str, dict] = {}
+        pending: Dict[str, Any] = {}
+        # Threads already paused on batch calls, from an earlier process
+        outputs: Dict[str, Any] = {}
+        for thread_id, graph_input in inputs.items():
+            snapshot = self.graph.get_state(self.config(thread_id))
+            if not snapshot.created_at:
+                pending[thread_id] = graph_input
+            elif snapshot.interrupts:
+                outputs[thread_id] = {"__interrupt__": list(snapshot.interrupts)}
+            elif snapshot.next:
+                # Stopped between nodes; continue from the last checkpoint
+                pending[thread_id] = None
+            else:
+                results[thread_id] = snapshot.values
+        if outputs or results:
+            print(f"♻️  Resuming: {len(results)} runs finished, {len(outputs)} waiting on batches, {len(pending)} to advance")
+
+        consumed: List[str] = []
+        while pending or outputs:
+            if pending:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    outputs.update(zip(pending, executor.map(self._advance, pending.items())))
+            # The runs waiting on these batches have been resumed from their results
+            if self.store is not None and consumed:
+                self.store.forget(consumed)
+
+            requests: Dict[str, BatchRequest] = {}
+            waiting: Dict[str, List[str]] = {}
+            for thread_id, output in outputs.items():
+                if isinstance(output, Exception):
+                    results[thread_id] = {"error": str(output)}
+                    continue
+                interrupts = output.get("__interrupt__", [])
+                if not interrupts:
+                    results[thread_id] = output
+                    continue
+                if any(not (isinstance(item.value, dict) and "batch_request" in item.value) for item in interrupts):
+                    results[thread_id] = {"error": "run paused on an interrupt the batch runner cannot answer"}
+                    continue
+                waiting[thread_id] = [item.id for item in interrupts]
+                for item in interrupts:
+                    requests[f"{thread_id}|{item.id}"] = item.value["batch_request"]
+
+            if not requests:
+                break
+            self.rounds += 1
+            print(f"🔁 Round {self.rounds}: {len(requests)} LLM calls from {len(waiting)} runs")
+            responses, consumed = self._run_batches(requests)
+            pending = {
+                thread_id: Command(resume={interrupt_id: responses[f"{thread_id}|{interrupt_id}"] for interrupt_id in interrupt_ids})
+                for thread_id, interrupt_ids in waiting.items()
+            }
+            outputs = {}
+
+        return results
+
+    def _run_batches(self, requests: Dict[str, BatchRequest]) -> Tuple[Dict[str, Any], List[str]]:
+        """Results of the requests, re-attaching to batches submitted before a restart; also returns the batch ids"""
+        submitted = self.store.submitted(list(requests)) if self.store is not None else {}
+        if submitted:
+            print(f"📦 Re-attaching to {len(submitted)} submitted batches")
+
+        already_submitted = {custom_id for functions in submitted.values() for custom_id in functions}
+        remaining = {custom_id: request for custom_id, request in requests.items() if custom_id not in already_submitted}
+        if remaining:
+            new_batches = self.batch_client.submit(remaining)
+            # Recorded before polling, so a restart while waiting does not submit them again
+            if self.store is not None:
+                self.store.record(new_batches)
+            submitted.update(new_batches)
+
+        responses: Dict[str, Any] = {}
+        for batch_id, functions in submitted.items():
+            responses.update(self.batch_client.wait(batch_id, functions))
+        # Requests the provider dropped without an error line
+        for custom_id in requests:
+            responses.setdefault(custom_id, {"error": "no result returned"})
+        return responses, list(submitted)
+
+    def _advance(self, item: Tuple[str, Any]) -> Any:
+        thread_id, graph_input = item
+        try:
+            return self.graph.invoke(graph_input, self.config(thread_id))
+        except Exception as e:
+            return e
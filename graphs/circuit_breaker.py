@@ -0,0 +1,159 @@
+# Circuit breakers - per-backend health tracking for the retrieval upstreams
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from graphs.settings import env_float, env_int
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Retrieval backends with a breaker each
+RETRIEVAL_BACKENDS = ("web", "wikipedia")
+
+# Live backend calls run here so a timed-out call can be abandoned. Separate from the
+# retrieval executor, whose tasks wait on these calls and would otherwise starve it.
+_backend_executor: Optional[ThreadPoolExecutor] = None
+# One breaker per retrieval backend, shared by every analyst and run in the process
+_retrieval_breakers: Dict[str, "CircuitBreaker"] = {}
+_shared_lock = threading.Lock()
+
+def get_backend_executor() -> ThreadPoolExecutor:
+    """Shared pool for live backend calls, RESEARCH_BREAKER_THREADS workers (default 16)"""
+    global _backend_executor
+    with _shared_lock:
+        if _backend_executor is None:
+            _backend_executor = ThreadPoolExecutor(
+                max_workers=env_int("RESEARCH_BREAKER_THREADS", 16),
+                thread_name_prefix="backend",
+            )
+        return _backend_executor
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose circuit is open"""
+
+class CircuitBreaker:
+    """
+    Error-rate and latency circuit breaker with half-open probing.
+
+    The breaker opens when, over the last `window` calls (at least `min_calls`),
+    the failure rate or the slow-call rate reaches its threshold. Timeouts count
+    as failures. After `open_seconds` one probe call is let through: success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_rate_threshold: float = 0.5,
+        timeout_seconds: float = 30.0,
+        open_seconds: float = 30.0,
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate_threshold = slow_rate_threshold
+        self.timeout_seconds = timeout_seconds
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """True while calls are being rejected (does not consume a half-open probe)"""
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self._opened_at < self.open_seconds
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; in half-open state only one probe at a time"""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record(self, success: bool, seconds: float):
+        """Record the outcome of a call and update the circuit state"""
+        slow = seconds >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if success and not slow:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._trip()
+                return
+
+            self._outcomes.append((success, slow))
+            if len(self._outcomes) < self.min_calls:
+                return
+            failure_rate = sum(1 for ok, _ in self._outcomes if not ok) / len(self._outcomes)
+            slow_rate = sum(1 for _, is_slow in self._outcomes if is_slow) / len(self._outcomes)
+            if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_rate_threshold:
+                self._trip()
+
+    def _trip(self):
+        if self.state != OPEN:
+            print(f"Circuit for {self.name} opened")
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def call(self, fn: Callable, *args) -> Any:
+        """Call fn through the breaker, bounded by timeout_seconds"""
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        start = time.monotonic()
+        future = get_backend_executor().submit(copy_context().run, fn, *args)
+        try:
+            result = future.result(timeout=self.timeout_seconds)
+        except FutureTimeoutError:
+            # The call keeps running in the background; its result is dropped
+            self.record(False, time.monotonic() - start)
+            raise TimeoutError(f"{self.name} did not answer within {self.timeout_seconds}s")
+        except Exception:
+            self.record(False, time.monotonic() - start)
+            raise
+        self.record(True, time.monotonic() - start)
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self.state, "recent_calls": len(self._outcomes)}
+
+def make_breaker(name: str) -> CircuitBreaker:
+    """Breaker configured from RESEARCH_BREAKER_* settings"""
+    return CircuitBreaker(
+        name,
+        window=env_int("RESEARCH_BREAKER_WINDOW", 20),
+        min_calls=env_int("RESEARCH_BREAKER_MIN_CALLS", 5),
+        failure_rate_threshold=env_float("RESEARCH_BREAKER_FAILURE_RATE", 0.5),
+        slow_call_seconds=env_float("RESEARCH_BREAKER_SLOW_SECONDS", 10.0),
+        slow_rate_threshold=env_float("RESEARCH_BREAKER_SLOW_RATE", 0.5),
+        timeout_seconds=env_float("RESEARCH_BREAKER_TIMEOUT_SECONDS", 30.0),
+        open_seconds=env_float("RESEARCH_BREAKER_OPEN_SECONDS", 30.0),
+    )
+
+def get_retrieval_breaker(backend: str) -> CircuitBreaker:
+    """Shared breaker of a retrieval backend, created on first use so .env is loaded by then"""
+    with _shared_lock:
+        if backend not in _retrieval_breakers:
+            _retrieval_breakers[backend] = make_breaker(backend)
+        return _retrieval_breakers[backend]
@@ -0,0 +1,128 @@
+# Citation engine - merges per-section source lists and renumbers citations in code
+import re
+from typing import Dict, List, Tuple, TypedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# "### Sources", "**Sources:**" or a bare "Sources:" line
+SOURCES_HEADER = re.compile(r"^\s*(?:#{2,4}\s*)?(?:\*\*|__)?\s*Sources\s*:?\s*(?:\*\*|__)?\s*:?\s*$", re.IGNORECASE | re.MULTILINE)
+SOURCE_LINE = re.compile(r"^\s*(?:[-*]\s*)?(?:\[(\d+)\]|(\d+)[.)])\s*(.+?)\s*$")
+# Citation numbers start at 1 and have at most three digits, so [0] or [2019] are never citations
+CITATION = re.compile(r"([ \t]*)\[([1-9]\d{0,2}(?:\s*[,;]\s*[1-9]\d{0,2})*)\]")
+URL = re.compile(r"https?://[^\s<>()\]]+", re.IGNORECASE)
+TRACKING_PARAM_PREFIX = "utm_"
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src"}
+
+class ConsolidatedReport(TypedDict):
+    sections: List[str] # Section bodies with globally numbered citations and no source lists
+    sources: List[str] # Final de-duplicated sources; sources[i] is citation [i + 1]
+
+def split_sources(section: str) -> Tuple[str, Dict[int, str]]:
+    """Split a section into its body and its {local number: source} list"""
+    match = SOURCES_HEADER.search(section)
+    if match is None:
+        return section.strip(), {}
+
+    body = section[:match.start()].rstrip()
+    sources = {}
+    for line in section[match.end():].splitlines():
+        source_match = SOURCE_LINE.match(line)
+        if source_match:
+            number = int(source_match.group(1) or source_match.group(2))
+            sources.setdefault(number, source_match.group(3).strip())
+    if not sources:
+        # A header with no list we can read: keep the section as written
+        return section.strip(), {}
+    return body, sources
+
+def is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key.startswith(TRACKING_PARAM_PREFIX) or key in TRACKING_PARAMS
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL: lower-cased host, no fragment, tracking params or trailing slash"""
+    parts = urlsplit(url.rstrip(".,;"))
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    # Mobile wikipedia pages are the same article
+    host = host.replace(".m.wikipedia.org", ".wikipedia.org")
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not is_tracking_param(key)
+    ])
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, query, ""))
+
+def source_key(source: str) -> str:
+    """De-duplication key: the normalized URL if there is one, otherwise the folded text"""
+    url = URL.search(source)
+    if url:
+        return normalize_url(url.group(0))
+    return re.sub(r"\s+", " ", source).strip().lower()
+
+def display_source(source: str) -> str:
+    """How a source is listed: its normalized URL, or the document name as written"""
+    url = URL.search(source)
+    if url:
+        return normalize_url(url.group(0))
+    return re.sub(r"\s+", " ", source).strip()
+
+def renumber_citations(text: str, mapping: Dict[int, int]) -> str:
+    """
+    Rewrite [n] / [n, m] citations with the global numbers.
+
+    Without a parsed source list there is nothing to map to, so the text is
+    left as written. Otherwise numbers without a source in the list would
+    collide with another section's global numbers, so they are dropped; a
+    citation left with no number is removed entirely.
+    """
+    if not mapping:
+        return text
+
+    def replace(match: re.Match) -> str:
+        numbers = [int(number) for number in re.split(r"\s*[,;]\s*", match.group(2))]
+        renumbered = sorted({mapping[number] for number in numbers if number in mapping})
+        if not renumbered:
+            return ""
+        return match.group(1) + "[" + ", ".join(str(number) for number in renumbered) + "]"
+    return CITATION.sub(replace, text)
+
+def citation_mappings(sections: List[str]) -> Tuple[List[Dict[int, int]], List[str]]:
+    """Per-section {local number: global number} mappings and the merged source list"""
+    numbers: Dict[str, int] = {}
+    sources: List[str] = []
+    mappings: List[Dict[int, int]] = []
+
+    for section in sections:
+        _, local_sources = split_sources(section)
+        mapping = {}
+        for local_number, source in sorted(local_sources.items()):
+            key = source_key(source)
+            if key not in numbers:
+                sources.append(display_source(source))
+                numbers[key] = len(sources)
+            mapping[local_number] = numbers[key]
+        mappings.append(mapping)
+
+    return mappings, sources
+
+def consolidate_sections(sections: List[str]) -> ConsolidatedReport:
+    """Merge the source lists of every section and renumber their citations consistently"""
+    mappings, sources = citation_mappings(sections)
+    bodies = [
+        renumber_citations(split_sources(section)[0], mapping)
+        for section, mapping in zip(sections, mappings)
+    ]
+    return {"sections": bodies, "sources": sources}
+
+def format_sources(sources: List[str]) -> str:
+    """Markdown source list; two trailing spaces force line breaks"""
+    return "\n".join(f"[{number}] {source}  " for number, source in enumerate(sources, 1))
+
+def strip_report_headers(content: str) -> str:
+    """Drop the leading ## Insights header and any Sources section the model added anyway"""
+    content = re.sub(r"^\s*##\s*Insights\s*\n", "", content, count=1, flags=re.IGNORECASE)
+    match = SOURCES_HEADER.search(content)
+    if match:
+        content = content[:match.start()]
+    return content.strip()
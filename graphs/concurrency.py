@@ -0,0 +1,234 @@
+# Process-wide resources shared by every research run served from one worker
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, Hashable, Optional, Union
+from graphs.settings import env_float, env_int
+
+class ConcurrencyLimiter:
+    """
+    Bounded slot counter shared by sync and async callers, reporting how many slots are in use.
+
+    Waiters queue in arrival order. A released slot is handed to the next waiter
+    directly: a thread is woken through its Event, a coroutine through its future
+    on its own loop, so waiting coroutines hold no thread.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._available = limit
+        self._in_flight = 0
+        self._waiters: "deque[Union[threading.Event, asyncio.Future]]" = deque()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def __enter__(self):
+        with self._lock:
+            if self._available > 0 and not self._waiters:
+                self._available -= 1
+                self._in_flight += 1
+                return self
+            granted = threading.Event()
+            self._waiters.append(granted)
+        # The releasing caller counts the slot as ours before setting the event
+        granted.wait()
+        return self
+
+    def __exit__(self, *exc):
+        self._release()
+        return False
+
+    async def __aenter__(self):
+        with self._lock:
+            if self._available > 0 and not self._waiters:
+                self._available -= 1
+                self._in_flight += 1
+                return self
+            granted = asyncio.get_running_loop().create_future()
+            self._waiters.append(granted)
+        try:
+            await granted
+        except asyncio.CancelledError:
+            with self._lock:
+                if granted in self._waiters:
+                    self._waiters.remove(granted)
+                    raise
+            # The slot was handed over before the cancellation landed; pass it on
+            if granted.done() and not granted.cancelled():
+                self._release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        return self.__exit__(*exc)
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+            if not self._waiters:
+                self._available += 1
+                return
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+
+    def _grant(self, waiter: asyncio.Future):
+        # Runs on the waiter's loop; a waiter cancelled meanwhile passes the slot on
+        if waiter.cancelled():
+            self._release()
+        else:
+            waiter.set_result(None)
+
+class RateLimiter:
+    """
+    Requests- and tokens-per-minute limits shared by every caller in the process.
+
+    Each limit is a token bucket refilled continuously and holding at most one
+    minute of budget. reserve() takes the budget up front, going into debt when
+    it is short, and returns how long the caller has to wait before sending, so
+    sync callers sleep and async callers await without holding a lock.
+    A limit of 0 disables it.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = threading.Lock()
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self.waited_seconds = 0.0
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Take one request and tokens from the budget; returns the seconds to wait first"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            delay = 0.0
+            if self.requests_per_minute > 0:
+                self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60) - 1
+                delay = max(delay, -self._requests * 60 / self.requests_per_minute)
+            if self.tokens_per_minute > 0:
+                # A single call larger than the whole budget waits for one full minute, not forever
+                tokens = min(tokens, self.tokens_per_minute)
+                self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60) - tokens
+                delay = max(delay, -self._tokens * 60 / self.tokens_per_minute)
+            self.waited_seconds += delay
+            return delay
+
+    def debit(self, tokens: int):
+        """Charge tokens only known after the call (completion tokens) to the next callers"""
+        if self.tokens_per_minute > 0 and tokens > 0:
+            with self._lock:
+                self._tokens -= tokens
+
+    def wait(self, tokens: int = 0):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_wait(self, tokens: int = 0):
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class RetrievalCache:
+    """Thread-safe LRU cache with a TTL for retrieval results, keyed by (backend, query)"""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Shared by every run in the process, created on first use so .env is loaded by then
+_llm_limiter: Optional[ConcurrencyLimiter] = None
+_llm_rate_limiter: Optional[RateLimiter] = None
+_retrieval_cache: Optional[RetrievalCache] = None
+# Retrieval started from inside a node (e.g. while a question is still streaming)
+_retrieval_executor: Optional[ThreadPoolExecutor] = None
+_shared_lock = threading.Lock()
+
+def get_llm_limiter() -> ConcurrencyLimiter:
+    """Shared LLM call limiter, RESEARCH_MAX_INFLIGHT_LLM slots (default 16)"""
+    global _llm_limiter
+    with _shared_lock:
+        if _llm_limiter is None:
+            _llm_limiter = ConcurrencyLimiter(env_int("RESEARCH_MAX_INFLIGHT_LLM", 16))
+        return _llm_limiter
+
+def get_llm_rate_limiter() -> RateLimiter:
+    """Shared provider rate limit, RESEARCH_LLM_REQUESTS_PER_MINUTE / RESEARCH_LLM_TOKENS_PER_MINUTE (0 = off)"""
+    global _llm_rate_limiter
+    with _shared_lock:
+        if _llm_rate_limiter is None:
+            _llm_rate_limiter = RateLimiter(
+                requests_per_minute=env_float("RESEARCH_LLM_REQUESTS_PER_MINUTE", 0),
+                tokens_per_minute=env_float("RESEARCH_LLM_TOKENS_PER_MINUTE", 0),
+            )
+        return _llm_rate_limiter
+
+def get_retrieval_cache() -> RetrievalCache:
+    """Shared retrieval cache, sized by RESEARCH_RETRIEVAL_CACHE_SIZE / RESEARCH_RETRIEVAL_CACHE_TTL"""
+    global _retrieval_cache
+    with _shared_lock:
+        if _retrieval_cache is None:
+            _retrieval_cache = RetrievalCache(
+                max_entries=env_int("RESEARCH_RETRIEVAL_CACHE_SIZE", 1024),
+                ttl_seconds=env_float("RESEARCH_RETRIEVAL_CACHE_TTL", 3600.0),
+            )
+        return _retrieval_cache
+
+def get_retrieval_executor() -> ThreadPoolExecutor:
+    """Shared retrieval pool, RESEARCH_RETRIEVAL_THREADS workers (default 16)"""
+    global _retrieval_executor
+    with _shared_lock:
+        if _retrieval_executor is None:
+            _retrieval_executor = ThreadPoolExecutor(
+                max_workers=env_int("RESEARCH_RETRIEVAL_THREADS", 16),
+                thread_name_prefix="retrieval",
+            )
+        return _retrieval_executor
+
+def submit_retrieval(fn: Callable, *args) -> Future:
+    """Run a retrieval on the shared executor, keeping the caller's context (profiling branch)"""
+    return get_retrieval_executor().submit(copy_context().run, fn, *args)
+
+async def run_retrieval(fn: Callable, *args) -> Any:
+    """Await a retrieval on the shared executor from an async node"""
+    return await asyncio.wrap_future(submit_retrieval(fn, *args))
@@ -0,0 +1,291 @@
+# Simulated LLM and search backends for offline load tests (RESEARCH_FAKE_BACKENDS=true)
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from baml_client.types import Analyst, DigestedSection, InterviewTurn, Perspectives, ReportSection, SearchQuery, SectionDigest
+from graphs.settings import env_float, env_int
+
+class FakeBackendError(Exception):
+    """Simulated upstream failure"""
+
+    def __init__(self, message: str, status_code: int = 500):
+        super().__init__(message)
+        self.status_code = status_code
+
+class LatencyProfile:
+    """
+    Log-normal latency with random failures and 429s, read from the environment.
+
+    RESEARCH_FAKE_<NAME>_LATENCY_MS is the median latency, RESEARCH_FAKE_<NAME>_ERROR_RATE
+    and RESEARCH_FAKE_<NAME>_RATE_LIMIT_RATE the probability of a 500 / 429 per attempt.
+    429s are retried with exponential backoff like the BAML Exponential retry policy.
+    """
+
+    def __init__(self, name: str, median_ms: float, sigma: float = 0.5):
+        prefix = f"RESEARCH_FAKE_{name.upper()}"
+        self.median_ms = env_float(f"{prefix}_LATENCY_MS", median_ms)
+        self.sigma = env_float(f"{prefix}_LATENCY_SIGMA", sigma)
+        self.error_rate = env_float(f"{prefix}_ERROR_RATE", 0.0)
+        self.rate_limit_rate = env_float(f"{prefix}_RATE_LIMIT_RATE", 0.0)
+        self.max_retries = env_int(f"{prefix}_MAX_RETRIES", 2)
+        self._random = random.Random()
+        self._lock = threading.Lock()
+
+    def _draw(self) -> tuple:
+        with self._lock:
+            latency = self._random.lognormvariate(0, self.sigma) * self.median_ms / 1000
+            outcome = self._random.random()
+        return latency, outcome
+
+    def _delays(self, what: str):
+        """Sleeps of one simulated call, raising on simulated failures once they are slept"""
+        delay = 0.3
+        for attempt in range(self.max_retries + 1):
+            latency, outcome = self._draw()
+            if outcome < self.rate_limit_rate:
+                # A 429 answers fast, then the client backs off
+                yield min(latency, 0.05)
+                if attempt == self.max_retries:
+                    raise FakeBackendError(f"{what}: rate limited", status_code=429)
+                yield delay
+                delay *= 1.5
+                continue
+            yield latency
+            if outcome < self.rate_limit_rate + self.error_rate:
+                raise FakeBackendError(f"{what}: upstream error", status_code=500)
+            return
+
+    def wait(self, what: str):
+        """Sleep for one simulated call, raising on simulated failures"""
+        for seconds in self._delays(what):
+            time.sleep(seconds)
+
+    async def async_wait(self, what: str):
+        """wait() for async callers, without holding a thread"""
+        for seconds in self._delays(what):
+            await asyncio.sleep(seconds)
+
+llm_profile = LatencyProfile("llm", median_ms=1500)
+web_profile = LatencyProfile("web", median_ms=800)
+wikipedia_profile = LatencyProfile("wikipedia", median_ms=600)
+
+def fake_text(seed: str, words: int) -> str:
+    """Deterministic filler text so reports look alike across runs"""
+    vocabulary = ["research", "analysis", "evidence", "adoption", "growth", "risk", "model", "market",
+                  "policy", "impact", "study", "trend", "cost", "latency", "quality", "users"]
+    digest = hashlib.sha1(seed.encode("utf-8")).digest()
+    return " ".join(vocabulary[digest[i % len(digest)] % len(vocabulary)] for i in range(words))
+
+def fake_section(analyst_description: str, context: str) -> str:
+    """Section markdown with a local source list, like WriteSection produces"""
+    return (
+        f"## {fake_text(analyst_description, 4).title()}\n\n### Summary\n{fake_text(context[:200], 200)} [1] [2]\n\n"
+        "### Sources\n[1] https://example.com/source  \n[2] https://en.wikipedia.org/wiki/Example"
+    )
+
+class FakeStream:
+    """Mimics a BAML sync stream: iterate partials, then get_final_response()"""
+
+    def __init__(self, partials: List[Any], final: Any):
+        self._partials = partials
+        self._final = final
+
+    def __iter__(self):
+        for partial in self._partials:
+            yield partial
+
+    def get_final_response(self) -> Any:
+        return self._final
+
+class FakeAsyncStream(FakeStream):
+    """Mimics a BAML async stream: async-iterate partials, then await get_final_response()"""
+
+    def __init__(self, partials: List[Any], final: Any, what: str):
+        super().__init__(partials, final)
+        self._what = what
+        self._waited = False
+
+    async def _wait(self):
+        # The simulated latency is spent once, before the first partial arrives
+        if not self._waited:
+            self._waited = True
+            await llm_profile.async_wait(self._what)
+
+    async def __aiter__(self):
+        await self._wait()
+        for partial in self._partials:
+            yield partial
+
+    async def get_final_response(self) -> Any:
+        await self._wait()
+        return self._final
+
+# Structured return types, for parsing fake outputs; the other functions return strings
+FAKE_RETURN_TYPES = {
+    "CreateAnalysts": Perspectives,
+    "GenerateSearchQuery": SearchQuery,
+    "GenerateQuestionWithQuery": InterviewTurn,
+    "WriteSection": ReportSection,
+    "WriteDigestedSection": DigestedSection,
+}
+
+def encode_fake_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [encode_fake_value(item) for item in value]
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return value
+
+class FakeRequests:
+    """Mimics b.request: renders a call as a chat completions body that fake_completion() can answer"""
+
+    def __getattr__(self, function_name: str):
+        if function_name.startswith("_"):
+            raise AttributeError(function_name)
+
+        def build(*args, **kwargs):
+            call = {"function": function_name, "kwargs": {key: encode_fake_value(value) for key, value in kwargs.items()}}
+            body = {"model": "fake", "messages": [{"role": "user", "content": json.dumps(call)}]}
+            return SimpleNamespace(url="http://fake-llm/v1/chat/completions", body=SimpleNamespace(json=lambda: body))
+        return build
+
+class FakeParser:
+    """Mimics b.parse: turns fake completion text back into the function's return type"""
+
+    def __getattr__(self, function_name: str):
+        if function_name.startswith("_"):
+            raise AttributeError(function_name)
+        return_type = FAKE_RETURN_TYPES.get(function_name)
+        return lambda text: return_type.model_validate_json(text) if return_type else text
+
+class FakeBamlClient:
+    """Drop-in stand-in for the generated BAML sync client, with simulated latency unless latency=False"""
+
+    def __init__(self, latency: bool = True):
+        self.latency = latency
+        self.stream = SimpleNamespace(GenerateQuestionWithQuery=self._stream_question_with_query)
+        self.request = FakeRequests()
+        self.parse = FakeParser()
+
+    def _wait(self, function_name: str):
+        if self.latency:
+            llm_profile.wait(function_name)
+
+    def CreateAnalysts(self, topic: str, human_analyst_feedback: str, max_analysts: int, baml_options: Optional[Dict] = None) -> Perspectives:
+        self._wait("CreateAnalysts")
+        return Perspectives(analysts=[
+            Analyst(
+                affiliation=f"Institute {i + 1}",
+                name=f"Analyst {i + 1}",
+                role=f"Specialist in {topic} theme {i + 1}",
+                description=fake_text(f"{topic}-{i}", 30),
+            )
+            for i in range(max_analysts)
+        ])
+
+    def GenerateQuestion(self, analyst_persona: str, messages: List, baml_options: Optional[Dict] = None) -> str:
+        self._wait("GenerateQuestion")
+        return f"{fake_text(analyst_persona + str(len(messages)), 25)}?"
+
+    def GenerateSearchQuery(self, messages: List, baml_options: Optional[Dict] = None) -> SearchQuery:
+        self._wait("GenerateSearchQuery")
+        return SearchQuery(search_query=fake_text(messages[-1].content if messages else "", 6))
+
+    def _stream_question_with_query(self, analyst_persona: str, messages: List, baml_options: Optional[Dict] = None) -> FakeStream:
+        self._wait("GenerateQuestionWithQuery")
+        seed = analyst_persona + str(len(messages))
+        turn = InterviewTurn(search_query=fake_text(seed, 6), question=f"{fake_text(seed, 25)}?")
+        partial = SimpleNamespace(search_query=turn.search_query, question=None)
+        return FakeStream([partial], turn)
+
+    def GenerateAnswer(self, analyst_persona: str, context: str, messages: List, baml_options: Optional[Dict] = None) -> str:
+        self._wait("GenerateAnswer")
+        return f"{fake_text(context[:200], 120)} [1]\n\n[1] https://example.com/source"
+
+    def WriteSection(self, analyst_description: str, context: str, baml_options: Optional[Dict] = None) -> ReportSection:
+        self._wait("WriteSection")
+        return ReportSection(content=fake_section(analyst_description, context))
+
+    def WriteDigestedSection(self, analyst_description: str, context: str, baml_options: Optional[Dict] = None) -> DigestedSection:
+        self._wait("WriteDigestedSection")
+        section = fake_section(analyst_description, context)
+        return DigestedSection(content=section, digest=SectionDigest(
+            title=fake_text(analyst_description, 4).title(),
+            summary=fake_text(section, 50),
+            insights=f"{fake_text(context[:200], 120)} [1] [2]",
+        ))
+
+    def WriteReport(self, topic: str, sections: str, baml_options: Optional[Dict] = None) -> str:
+        self._wait("WriteReport")
+        return f"## Insights\n{fake_text(sections[:500], 300)} [1] [2]"
+
+    def WriteIntroduction(self, topic: str, sections: str, baml_options: Optional[Dict] = None) -> str:
+        self._wait("WriteIntroduction")
+        return f"# {topic}\n\n## Introduction\n{fake_text(sections[:200], 100)}"
+
+    def WriteConclusion(self, topic: str, sections: str, baml_options: Optional[Dict] = None) -> str:
+        self._wait("WriteConclusion")
+        return f"## Conclusion\n{fake_text(sections[:200], 100)}"
+
+class FakeAsyncBamlClient:
+    """
+    Stand-in for the generated BAML async client.
+
+    Waits on the event loop, then builds the same outputs as FakeBamlClient.
+    """
+
+    def __init__(self):
+        self._outputs = FakeBamlClient(latency=False)
+        self.stream = SimpleNamespace(GenerateQuestionWithQuery=self._stream_question_with_query)
+
+    def __getattr__(self, function_name: str):
+        if function_name.startswith("_"):
+            raise AttributeError(function_name)
+        build = getattr(self._outputs, function_name)
+
+        async def call(*args, **kwargs):
+            await llm_profile.async_wait(function_name)
+            return build(*args, **kwargs)
+        return call
+
+    def _stream_question_with_query(self, *args, **kwargs) -> FakeAsyncStream:
+        stream = self._outputs.stream.GenerateQuestionWithQuery(*args, **kwargs)
+        return FakeAsyncStream(list(stream), stream.get_final_response(), "GenerateQuestionWithQuery")
+
+def fake_completion(body: dict) -> str:
+    """Completion text for a request rendered by FakeRequests (stand-in batch server)"""
+    call = json.loads(body["messages"][-1]["content"])
+    kwargs = {
+        key: [SimpleNamespace(**message) for message in value] if key == "messages" else value
+        for key, value in call["kwargs"].items()
+    }
+    client = FakeBamlClient()
+    if call["function"] == "GenerateQuestionWithQuery":
+        result = client.stream.GenerateQuestionWithQuery(**kwargs).get_final_response()
+    else:
+        result = getattr(client, call["function"])(**kwargs)
+    return result.model_dump_json() if hasattr(result, "model_dump_json") else result
+
+def fake_web_search(query: str) -> List[dict]:
+    """Tavily-shaped results"""
+    web_profile.wait("web search")
+    return [
+        {"url": f"https://example.com/{hashlib.sha1(f'{query}-{i}'.encode()).hexdigest()[:10]}", "content": fake_text(f"{query}-{i}", 150)}
+        for i in range(3)
+    ]
+
+def fake_wikipedia_search(query: str) -> List[SimpleNamespace]:
+    """WikipediaLoader-shaped documents"""
+    wikipedia_profile.wait("wikipedia search")
+    return [
+        SimpleNamespace(
+            metadata={"source": f"https://en.wikipedia.org/wiki/{query.split()[0].title() if query else 'Example'}_{i}", "title": query},
+            page_content=fake_text(f"{query}-wiki-{i}", 600),
+        )
+        for i in range(2)
+    ]
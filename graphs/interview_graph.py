@@ -1,137 +1,267 @@
+import asyncio
 from baml_client.types import Analyst
-from graphs.types import GenerateAnalystsState, InterviewState
+from graphs.types import GenerateAnalystsState, InterviewState, RetrievedDocument
 from graphs.traced_client import traced_client
 from graphs.utils import langchain_messages_to_baml
-from langchain_core.messages import AIMessage, get_buffer_string
+from graphs.passage_index import get_passage_index, index_documents, lookup_fallback_passages, lookup_local_passages
+from graphs.retrieval import format_context, make_document, passages_to_documents, select_relevant_sections
+from graphs.settings import compact_retrieval_enabled, fake_backends_enabled, fused_turns_enabled, wikipedia_max_chars
+from graphs.fakes import fake_web_search, fake_wikipedia_search
+from graphs.profiling import profiled_node, span
+from graphs.concurrency import get_retrieval_cache, run_retrieval, submit_retrieval
+from graphs.circuit_breaker import get_retrieval_breaker
+from typing import Callable, List, Optional
+from langchain_core.messages import AIMessage, HumanMessage, get_buffer_string
 from langchain_community.document_loaders import WikipediaLoader
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+# WikipediaLoader's default page size
+WIKIPEDIA_LOADER_CHARS = 4000
+# Raw page size fetched in compact mode, as a multiple of the size kept: enough sections
+# to choose from without parsing, holding and indexing whole articles
+WIKIPEDIA_RAW_CHARS_FACTOR = 4
+
 def get_analyst_persona(analyst: Analyst) -> str:
     """Get analyst persona string"""
     return f"Name: {analyst.name}\nRole: {analyst.role}\nAffiliation: {analyst.affiliation}\nDescription: {analyst.description}\n"
 
+def get_interview_opening(topic: str) -> HumanMessage:
+    """First message of every interview"""
+    return HumanMessage(content=f"So you said you were writing an article on {topic}?")
+
 ### Nodes and edges
 
+# Each LLM node builds its BAML arguments and state update with the helpers below,
+# so the sync node and its async twin (for the service graph) differ only at the await
+
+def analysts_args(state: GenerateAnalystsState) -> dict:
+    return {
+        "topic": state['topic'],
+        "human_analyst_feedback": state.get('human_analyst_feedback', ''),
+        "max_analysts": state['max_analysts'],
+    }
+
 def create_analysts(state: GenerateAnalystsState):
     """Create analysts using BAML"""
-    
-    topic = state['topic']
-    max_analysts = state['max_analysts']
-    human_analyst_feedback = state.get('human_analyst_feedback', '')
-    
-    # Use BAML function to generate analysts with automatic tracing
-    perspectives = traced_client.CreateAnalysts(
-        topic=topic,
-        human_analyst_feedback=human_analyst_feedback,
-        max_analysts=max_analysts
-    )
-    
+    perspectives = traced_client.llm_call("CreateAnalysts", **analysts_args(state))
+
     # Write the list of analysts to state
     return {"analysts": perspectives.analysts}
 
+async def acreate_analysts(state: GenerateAnalystsState):
+    """Async create_analysts, for the service graph"""
+    perspectives = await traced_client.allm_call("CreateAnalysts", **analysts_args(state))
+    return {"analysts": perspectives.analysts}
+
 def human_feedback(state: GenerateAnalystsState):
     """No-op node that should be interrupted on"""
     pass
 
+def question_args(state: InterviewState) -> dict:
+    """Analyst persona and the conversation so far, in BAML format"""
+    return {
+        "analyst_persona": get_analyst_persona(state["analyst"]),
+        "messages": langchain_messages_to_baml(state["messages"]),
+    }
+
 def generate_question(state: InterviewState):
     """Node to generate a question using BAML"""
+    question_content = traced_client.llm_call("GenerateQuestion", **question_args(state))
 
-    # Get state
-    analyst = state["analyst"]
-    messages = state["messages"]
-    
-    # Convert messages to BAML format
-    baml_messages = langchain_messages_to_baml(messages)
-    
-    # Generate question using BAML
-    analyst_persona = get_analyst_persona(analyst)
-    question_content = traced_client.GenerateQuestion(
-        analyst_persona=analyst_persona,
-        messages=baml_messages
-    )
-    
-    # Create AI message
-    question = AIMessage(content=question_content)
-    
     # Write messages to state
-    return {"messages": [question]}
+    return {"messages": [AIMessage(content=question_content)]}
 
-def search_web(state: InterviewState):
-    """Retrieve docs from web search"""
+async def agenerate_question(state: InterviewState):
+    """Async generate_question, for the service graph"""
+    question_content = await traced_client.allm_call("GenerateQuestion", **question_args(state))
+    return {"messages": [AIMessage(content=question_content)]}
 
-    tavily_search = TavilySearchResults(max_results=3)
+def degraded_documents(search_query: str, backend: str, error: Exception) -> List[RetrievedDocument]:
+    """Best-effort local documents when a backend's circuit is open or its call failed"""
+    print(f"{backend} retrieval degraded ({error}); falling back to local passages")
+    with span(f"retrieval.{backend}_fallback", "retrieval"):
+        passages = lookup_fallback_passages(search_query, backend)
 
-    # Convert messages to BAML format
-    baml_messages = langchain_messages_to_baml(state['messages'])
-    
-    # Generate search query using BAML
-    search_query_result = traced_client.GenerateSearchQuery(messages=baml_messages)
+    # An empty list leaves the answer to the other retriever's context
+    return passages_to_documents(passages)
+
+def search_tavily(search_query: str) -> list:
+    if fake_backends_enabled():
+        return fake_web_search(search_query)
+    return TavilySearchResults(max_results=3).invoke(search_query)
+
+def search_wikipedia_pages(search_query: str, loader_options: dict) -> list:
+    if fake_backends_enabled():
+        return fake_wikipedia_search(search_query)
+    return WikipediaLoader(query=search_query, load_max_docs=2, **loader_options).load()
+
+def retrieve_web(search_query: str) -> List[RetrievedDocument]:
+    """Web search for a query: retrieval cache, then local index, then Tavily behind its circuit breaker"""
+
+    # Reuse results another run fetched for the same query
+    cached_documents = get_retrieval_cache().get(("web", search_query))
+    if cached_documents is not None:
+        return cached_documents
+
+    # Skip the live search when the local index already holds strong passages
+    with span("retrieval.local_index", "retrieval"):
+        local_passages = lookup_local_passages(search_query, backend="web")
+    if local_passages:
+        return passages_to_documents(local_passages)
     
     # Search
-    search_docs = tavily_search.invoke(search_query_result.search_query)
+    try:
+        with span("retrieval.tavily", "retrieval"):
+            search_docs = get_retrieval_breaker("web").call(search_tavily, search_query)
+    except Exception as e:
+        return degraded_documents(search_query, "web", e)
+    with span("retrieval.index_documents", "retrieval"):
+        index_documents("web", [(doc["url"], "", doc["content"]) for doc in search_docs])
+
+    # Keep compact documents; they are formatted lazily at prompt time
+    documents = [make_document(doc["url"], doc["content"]) for doc in search_docs]
+    get_retrieval_cache().put(("web", search_query), documents)
+
+    return documents
+
+def retrieve_wikipedia(search_query: str) -> List[RetrievedDocument]:
+    """Wikipedia search for a query: retrieval cache, then local index, then WikipediaLoader behind its circuit breaker"""
+
+    # Reuse results another run fetched for the same query
+    cached_documents = get_retrieval_cache().get(("wikipedia", search_query))
+    if cached_documents is not None:
+        return cached_documents
 
-    # Format
-    formatted_search_docs = "\n\n---\n\n".join(
-        [
-            f'<Document href="{doc["url"]}"/>\n{doc["content"]}\n</Document>'
+    # Skip the live search when the local index already holds strong passages
+    with span("retrieval.local_index", "retrieval"):
+        local_passages = lookup_local_passages(search_query, backend="wikipedia")
+    if local_passages:
+        return passages_to_documents(local_passages)
+
+    # Search
+    compact = compact_retrieval_enabled()
+    raw_chars = max(WIKIPEDIA_LOADER_CHARS, WIKIPEDIA_RAW_CHARS_FACTOR * wikipedia_max_chars())
+    loader_options = {"doc_content_chars_max": raw_chars} if compact else {}
+    try:
+        with span("retrieval.wikipedia", "retrieval"):
+            search_docs = get_retrieval_breaker("wikipedia").call(search_wikipedia_pages, search_query, loader_options)
+    except Exception as e:
+        return degraded_documents(search_query, "wikipedia", e)
+    with span("retrieval.index_documents", "retrieval"):
+        index_documents("wikipedia", [
+            (doc.metadata["source"], doc.metadata.get("page", ""), doc.page_content)
             for doc in search_docs
-        ]
-    )
+        ])
+
+    # Keep only the lead and the sections relevant to the query
+    documents = []
+    for doc in search_docs:
+        content = doc.page_content
+        if compact:
+            content = select_relevant_sections(content, search_query, wikipedia_max_chars())
+        documents.append(make_document(doc.metadata["source"], content, doc.metadata.get("page", "")))
+    get_retrieval_cache().put(("wikipedia", search_query), documents)
+
+    return documents
 
-    return {"context": [formatted_search_docs]} 
+# Blocking retrieval of each backend, by breaker name
+RETRIEVERS = {"web": retrieve_web, "wikipedia": retrieve_wikipedia}
+
+def search_skipped(backend: str) -> bool:
+    """Nothing to fall back on: skip the query generation while the backend is down"""
+    return get_retrieval_breaker(backend).is_open() and get_passage_index() is None
+
+def search_query_args(state: InterviewState) -> dict:
+    return {"messages": langchain_messages_to_baml(state['messages'])}
+
+def search(state: InterviewState, backend: str):
+    """Generate a search query with BAML and retrieve docs from the backend"""
+    if search_skipped(backend):
+        return {"context": []}
+    search_query_result = traced_client.llm_call("GenerateSearchQuery", **search_query_args(state))
+    return {"context": [RETRIEVERS[backend](search_query_result.search_query)]}
+
+async def asearch(state: InterviewState, backend: str):
+    """Async search; the blocking retrieval runs on the shared retrieval executor"""
+    if search_skipped(backend):
+        return {"context": []}
+    search_query_result = await traced_client.allm_call("GenerateSearchQuery", **search_query_args(state))
+    return {"context": [await run_retrieval(RETRIEVERS[backend], search_query_result.search_query)]}
+
+def search_web(state: InterviewState):
+    """Retrieve docs from web search"""
+    return search(state, "web")
 
 def search_wikipedia(state: InterviewState):
     """Retrieve docs from wikipedia"""
+    return search(state, "wikipedia")
 
-    # Convert messages to BAML format
-    baml_messages = langchain_messages_to_baml(state['messages'])
-    
-    # Generate search query using BAML
-    search_query_result = traced_client.GenerateSearchQuery(messages=baml_messages)
-    
-    # Search
-    search_docs = WikipediaLoader(
-        query=search_query_result.search_query, 
-        load_max_docs=2
-    ).load()
-
-    # Format
-    formatted_search_docs = "\n\n---\n\n".join(
-        [
-            f'<Document source="{doc.metadata["source"]}" page="{doc.metadata.get("page", "")}"/>\n{doc.page_content}\n</Document>'
-            for doc in search_docs
-        ]
-    )
+async def asearch_web(state: InterviewState):
+    """Async search_web, for the service graph"""
+    return await asearch(state, "web")
 
-    return {"context": [formatted_search_docs]} 
+async def asearch_wikipedia(state: InterviewState):
+    """Async search_wikipedia, for the service graph"""
+    return await asearch(state, "wikipedia")
 
-def generate_answer(state: InterviewState):
-    """Node to answer a question using BAML"""
+class TurnSearches:
+    """Starts both retrievers as soon as the streamed search query is complete"""
 
-    # Get state
-    analyst = state["analyst"]
-    baml_messages = langchain_messages_to_baml(state['messages'])
-    context = state["context"]
+    def __init__(self, submit: Callable):
+        self.submit = submit
+        self.searches: list = []
 
-    # Generate answer using BAML
-    analyst_persona = get_analyst_persona(analyst)
-    context_str = "\n\n".join(context)
-    
-    answer_content = traced_client.GenerateAnswer(
-        analyst_persona=analyst_persona,
-        context=context_str,
-        messages=baml_messages
-    )
-    
-    # Create AI message
+    def start(self, search_query: str):
+        # Both retrievers run while the rest of the question is still streaming
+        if not self.searches:
+            self.searches = [self.submit(retrieve_web, search_query), self.submit(retrieve_wikipedia, search_query)]
+
+    def on_partial(self, partial):
+        # search_query is @stream.done, so it only shows up once complete
+        if partial.search_query:
+            self.start(partial.search_query)
+
+def ask_question_and_search(state: InterviewState):
+    """Node to generate a question and its search query in one streamed BAML call"""
+    turn_searches = TurnSearches(submit_retrieval)
+    turn = traced_client.stream_call("GenerateQuestionWithQuery", **question_args(state), on_partial=turn_searches.on_partial)
+    turn_searches.start(turn.search_query)
+
+    # Write the question and the retrieved documents to state
+    context = [search.result() for search in turn_searches.searches]
+    return {"messages": [AIMessage(content=turn.question)], "context": context}
+
+async def aask_question_and_search(state: InterviewState):
+    """Async ask_question_and_search, for the service graph"""
+    turn_searches = TurnSearches(lambda fn, search_query: asyncio.ensure_future(run_retrieval(fn, search_query)))
+    turn = await traced_client.astream_call("GenerateQuestionWithQuery", **question_args(state), on_partial=turn_searches.on_partial)
+    turn_searches.start(turn.search_query)
+
+    context = list(await asyncio.gather(*turn_searches.searches))
+    return {"messages": [AIMessage(content=turn.question)], "context": context}
+
+def answer_args(state: InterviewState) -> dict:
+    return {**question_args(state), "context": format_context(state["context"])}
+
+def expert_answer(answer_content: str) -> dict:
     answer = AIMessage(content=answer_content)
     answer.name = "expert"
-    
-    # Append it to state
     return {"messages": [answer]}
 
+def generate_answer(state: InterviewState):
+    """Node to answer a question using BAML"""
+    answer_content = traced_client.llm_call("GenerateAnswer", **answer_args(state))
+
+    # Append it to state
+    return expert_answer(answer_content)
+
+async def agenerate_answer(state: InterviewState):
+    """Async generate_answer, for the service graph"""
+    answer_content = await traced_client.allm_call("GenerateAnswer", **answer_args(state))
+    return expert_answer(answer_content)
+
 def save_interview(state: InterviewState):
     """Save interviews"""
 
@@ -139,7 +269,8 @@ def save_interview(state: InterviewState):
     messages = state["messages"]
     
     # Convert interview to a string
-    interview = get_buffer_string(messages)
+    with span("get_buffer_string", "cpu"):
+        interview = get_buffer_string(messages)
     
     # Save to interviews key
     return {"interview": interview}
@@ -168,42 +299,74 @@ def route_messages(state: InterviewState, name: str = "expert"):
         return 'save_interview'
     return "ask_question"
 
+def route_start(state: InterviewState):
+    """Resume after a turn that was already run (speculatively), otherwise start asking"""
+
+    messages = state["messages"]
+    if any(isinstance(m, AIMessage) and m.name == "expert" for m in messages):
+        return route_messages(state)
+    return "ask_question"
+
+def section_args(state: InterviewState) -> dict:
+    return {"analyst_description": state["analyst"].description, "context": format_context(state["context"])}
+
 def write_section(state: InterviewState):
     """Node to write a section using BAML"""
+    section_result = traced_client.llm_call("WriteSection", **section_args(state))
 
-    # Get state
-    interview = state["interview"]
-    context = state["context"]
-    analyst = state["analyst"]
-   
-    # Write section using BAML
-    context_str = "\n\n".join(context)
-    section_result = traced_client.WriteSection(
-        analyst_description=analyst.description,
-        context=context_str
-    )
-    
     # Append it to state
     return {"sections": [section_result.content]}
 
-def get_interview_graph() -> CompiledStateGraph:
+def digested_section(section_result) -> dict:
+    # Written in one update so sections and digests stay aligned in the parent state
+    return {"sections": [section_result.content], "digests": [section_result.digest]}
+
+def write_digested_section(state: InterviewState):
+    """Node to write a section and its digest for the final report in one BAML call"""
+    # The digest comes with the section, so the branch ends after a single call
+    section_result = traced_client.llm_call("WriteDigestedSection", **section_args(state))
+    return digested_section(section_result)
+
+async def awrite_section(state: InterviewState):
+    """Async write_section, for the service graph"""
+    section_result = await traced_client.allm_call("WriteSection", **section_args(state))
+    return {"sections": [section_result.content]}
+
+async def awrite_digested_section(state: InterviewState):
+    """Async write_digested_section, for the service graph"""
+    section_result = await traced_client.allm_call("WriteDigestedSection", **section_args(state))
+    return digested_section(section_result)
+
+def get_interview_graph(incremental_reduce: bool = False, fused_turns: Optional[bool] = None, async_llm: bool = False) -> CompiledStateGraph:
+  """Interview subgraph; async_llm uses the async nodes, for graphs run with ainvoke/astream"""
+  if fused_turns is None:
+    fused_turns = fused_turns_enabled()
     
 
   # Add nodes and edges 
   interview_builder = StateGraph(InterviewState)
-  interview_builder.add_node("ask_question", generate_question)
-  interview_builder.add_node("search_web", search_web)
-  interview_builder.add_node("search_wikipedia", search_wikipedia)
-  interview_builder.add_node("answer_question", generate_answer)
-  interview_builder.add_node("save_interview", save_interview)
-  interview_builder.add_node("write_section", write_section)
+  if fused_turns:
+    interview_builder.add_node("ask_question", profiled_node("ask_question", aask_question_and_search if async_llm else ask_question_and_search))
+  else:
+    interview_builder.add_node("ask_question", profiled_node("ask_question", agenerate_question if async_llm else generate_question))
+    interview_builder.add_node("search_web", profiled_node("search_web", asearch_web if async_llm else search_web))
+    interview_builder.add_node("search_wikipedia", profiled_node("search_wikipedia", asearch_wikipedia if async_llm else search_wikipedia))
+  interview_builder.add_node("answer_question", profiled_node("answer_question", agenerate_answer if async_llm else generate_answer))
+  interview_builder.add_node("save_interview", profiled_node("save_interview", save_interview))
+  if incremental_reduce:
+    interview_builder.add_node("write_section", profiled_node("write_section", awrite_digested_section if async_llm else write_digested_section))
+  else:
+    interview_builder.add_node("write_section", profiled_node("write_section", awrite_section if async_llm else write_section))
 
   # Flow
-  interview_builder.add_edge(START, "ask_question")
-  interview_builder.add_edge("ask_question", "search_web")
-  interview_builder.add_edge("ask_question", "search_wikipedia")
-  interview_builder.add_edge("search_web", "answer_question")
-  interview_builder.add_edge("search_wikipedia", "answer_question")
+  interview_builder.add_conditional_edges(START, route_start, ['ask_question', 'save_interview'])
+  if fused_turns:
+    interview_builder.add_edge("ask_question", "answer_question")
+  else:
+    interview_builder.add_edge("ask_question", "search_web")
+    interview_builder.add_edge("ask_question", "search_wikipedia")
+    interview_builder.add_edge("search_web", "answer_question")
+    interview_builder.add_edge("search_wikipedia", "answer_question")
   interview_builder.add_conditional_edges("answer_question", route_messages, ['ask_question', 'save_interview'])
   interview_builder.add_edge("save_interview", "write_section")
   interview_builder.add_edge("write_section", END)
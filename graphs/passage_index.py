@@ -0,0 +1,192 @@
+# Local passage index - BM25 full-text index of every document retrieved across runs
+import hashlib
+import re
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from graphs.settings import env_float, env_int, env_str
+
+PASSAGE_MAX_CHARS = 1000
+
+# Terms ignored when measuring how much of a query a passage covers
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "is", "it", "of",
+    "on", "or", "the", "to", "was", "what", "when", "which", "who", "why", "with",
+}
+
+class Passage(NamedTuple):
+    backend: str # Retriever that originally fetched the document ("web" or "wikipedia")
+    source: str # URL or wikipedia source
+    page: str # Page title, empty for web results
+    content: str # Passage text
+    score: float # BM25 score, higher is better
+
+def split_passages(text: str, max_chars: int = PASSAGE_MAX_CHARS) -> List[str]:
+    """Split a document into paragraph-aligned passages of at most max_chars"""
+    passages = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        # Hard-wrap paragraphs that are larger than a passage on their own
+        while len(paragraph) > max_chars:
+            if current:
+                passages.append(current)
+                current = ""
+            passages.append(paragraph[:max_chars])
+            paragraph = paragraph[max_chars:]
+        if current and len(current) + len(paragraph) + 2 > max_chars:
+            passages.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        passages.append(current)
+    return passages
+
+def fold_terms(text: str) -> set:
+    """Lower-cased terms without diacritics, like the FTS5 tokenizer sees them"""
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return set(re.findall(r"\w+", folded))
+
+def query_coverage(query: str, content: str) -> float:
+    """Share of the query's content terms that appear in a passage"""
+    terms = {term for term in fold_terms(query) if len(term) > 1 and term not in STOPWORDS}
+    if not terms:
+        return 0.0
+    return len(terms & fold_terms(content)) / len(terms)
+
+def to_match_query(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression that ORs every term"""
+    terms = {term.lower() for term in re.findall(r"\w+", query) if len(term) > 1}
+    return " OR ".join(f'"{term}"' for term in sorted(terms))
+
+class PassageIndex:
+    """
+    On-disk BM25 index of retrieved passages backed by SQLite FTS5.
+
+    The database file is memory-mapped, so repeated lookups across runs are
+    served from the page cache instead of the network.
+    """
+
+    def __init__(self, path: str, mmap_size: int = 256 * 1024 * 1024):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS passages USING fts5("
+            "content, backend UNINDEXED, source UNINDEXED, page UNINDEXED, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (digest TEXT PRIMARY KEY)")
+        self._conn.commit()
+
+    def add(self, backend: str, documents: Iterable[Tuple[str, str, str]]) -> int:
+        """Index (source, page, content) documents, skipping passages already stored"""
+        added = 0
+        with self._lock:
+            for source, page, content in documents:
+                for passage in split_passages(content or ""):
+                    digest = hashlib.sha1(f"{source}\x00{passage}".encode("utf-8")).hexdigest()
+                    cursor = self._conn.execute("INSERT OR IGNORE INTO seen (digest) VALUES (?)", (digest,))
+                    if cursor.rowcount == 0:
+                        continue
+                    self._conn.execute(
+                        "INSERT INTO passages (content, backend, source, page) VALUES (?, ?, ?, ?)",
+                        (passage, backend, source, page or ""),
+                    )
+                    added += 1
+            self._conn.commit()
+        return added
+
+    def search(self, query: str, backend: Optional[str] = None, limit: int = 3) -> List[Passage]:
+        """Return the best passages for a query, optionally restricted to one backend"""
+        match = to_match_query(query)
+        if not match:
+            return []
+
+        sql = "SELECT backend, source, page, content, -bm25(passages) FROM passages WHERE passages MATCH ?"
+        params: list = [match]
+        if backend:
+            sql += " AND backend = ?"
+            params.append(backend)
+        sql += " ORDER BY bm25(passages) LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [Passage(*row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_index: Optional[PassageIndex] = None
+_index_lock = threading.Lock()
+
+def get_passage_index() -> Optional[PassageIndex]:
+    """Shared index instance, or None when RESEARCH_LOCAL_INDEX_PATH is not set"""
+    global _index
+    path = env_str("RESEARCH_LOCAL_INDEX_PATH")
+    if not path:
+        return None
+    with _index_lock:
+        if _index is None or _index.path != path:
+            _index = PassageIndex(path)
+        return _index
+
+def lookup_local_passages(query: str, backend: str) -> List[Passage]:
+    """
+    Return local passages when they are strong enough to skip the live search.
+
+    A passage is strong when its BM25 score is at least RESEARCH_LOCAL_INDEX_MIN_SCORE
+    and it contains at least RESEARCH_LOCAL_INDEX_MIN_COVERAGE of the query's content
+    terms, so one rare shared term is not enough. Unless RESEARCH_LOCAL_INDEX_MIN_HITS
+    passages are strong, an empty list is returned.
+    """
+    index = get_passage_index()
+    if index is None:
+        return []
+
+    min_hits = env_int("RESEARCH_LOCAL_INDEX_MIN_HITS", 2)
+    min_score = env_float("RESEARCH_LOCAL_INDEX_MIN_SCORE", 5.0)
+    min_coverage = env_float("RESEARCH_LOCAL_INDEX_MIN_COVERAGE", 0.6)
+
+    # Look past the top hits: the best BM25 scores may come from a single rare term
+    passages = index.search(query, backend=backend, limit=max(min_hits, 3) * 4)
+    strong = [
+        passage for passage in passages
+        if passage.score >= min_score and query_coverage(query, passage.content) >= min_coverage
+    ]
+    return strong[:max(min_hits, 3)] if len(strong) >= min_hits else []
+
+def lookup_fallback_passages(query: str, backend: str, limit: int = 3) -> List[Passage]:
+    """
+    Best local passages regardless of strength, for when a live backend is unavailable.
+
+    Prefers passages from the same backend and tops up with any other backend's.
+    """
+    index = get_passage_index()
+    if index is None:
+        return []
+
+    passages = index.search(query, backend=backend, limit=limit)
+    if len(passages) < limit:
+        seen = {(passage.source, passage.content) for passage in passages}
+        passages += [
+            passage for passage in index.search(query, limit=limit)
+            if (passage.source, passage.content) not in seen
+        ][:limit - len(passages)]
+    return passages
+
+def index_documents(backend: str, documents: Iterable[Tuple[str, str, str]]) -> int:
+    """Store freshly retrieved (source, page, content) documents in the local index"""
+    index = get_passage_index()
+    if index is None:
+        return 0
+    return index.add(backend, documents)
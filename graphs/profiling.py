@@ -0,0 +1,181 @@
+# Opt-in profiling - nested timing spans per node, exported as Chrome trace JSON
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+from graphs.settings import env_str
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Analyst branch the current span belongs to; every Send() branch gets its own trace lane
+_current_branch: ContextVar[str] = ContextVar("profile_branch", default="main")
+
+class Profiler:
+    """
+    Collects timing spans from every node of both graphs.
+
+    Spans are recorded as Chrome trace "complete" events, with trace lanes named
+    after the analyst branch, so parallel Send() branches and the critical path line up.
+    The output loads in chrome://tracing, Perfetto and speedscope.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self._lanes: Dict[tuple, int] = {}
+
+    def _lane(self, branch: str) -> int:
+        # Parallel nodes of one branch run on different threads; give each its own lane
+        key = (branch, threading.get_ident())
+        if key not in self._lanes:
+            self._lanes[key] = len(self._lanes) + 1
+        return self._lanes[key]
+
+    def record(self, name: str, category: str, start: float, end: float, branch: str, args: Optional[dict] = None):
+        """Record a finished span; start and end are time.perf_counter() values"""
+        with self._lock:
+            self._events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1_000_000,
+                "dur": (end - start) * 1_000_000,
+                "pid": os.getpid(),
+                "tid": self._lane(branch),
+                "args": args or {},
+            })
+
+    def to_chrome_trace(self) -> dict:
+        """Trace events plus lane names, in the Chrome trace event format"""
+        with self._lock:
+            lane_names = [
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": f"{branch} #{tid}"}}
+                for (branch, _), tid in self._lanes.items()
+            ]
+            return {"traceEvents": lane_names + list(self._events), "displayTimeUnit": "ms"}
+
+    def export(self, path: str):
+        """Write the collected spans to a JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def reset(self):
+        with self._lock:
+            self._origin = time.perf_counter()
+            self._events = []
+            self._lanes = {}
+
+_profiler: Optional[Profiler] = None
+_profiler_lock = threading.Lock()
+
+# Callbacks notified with (name, category, seconds) for every span, e.g. service metrics
+_span_listeners: List[Callable[[str, str, float], None]] = []
+
+def add_span_listener(listener: Callable[[str, str, float], None]):
+    """Receive every finished span, even when no trace file is being written"""
+    _span_listeners.append(listener)
+
+def remove_span_listener(listener: Callable[[str, str, float], None]):
+    if listener in _span_listeners:
+        _span_listeners.remove(listener)
+
+def get_profiler() -> Optional[Profiler]:
+    """Shared profiler, or None when RESEARCH_PROFILE_PATH is not set"""
+    global _profiler
+    path = env_str("RESEARCH_PROFILE_PATH")
+    if not path:
+        return None
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = Profiler()
+            atexit.register(export_profile)
+        return _profiler
+
+def export_profile(path: Optional[str] = None) -> Optional[str]:
+    """Export the collected trace to path (defaults to RESEARCH_PROFILE_PATH)"""
+    path = path or env_str("RESEARCH_PROFILE_PATH")
+    if _profiler is None or not path:
+        return None
+    _profiler.export(path)
+    return path
+
+@contextmanager
+def span(name: str, category: str = "cpu", **args):
+    """Time a block of work; categories are node, llm, retrieval, serialization and cpu"""
+    profiler = get_profiler()
+    if profiler is None and not _span_listeners:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        if profiler is not None:
+            profiler.record(name, category, start, end, _current_branch.get(), args)
+        for listener in list(_span_listeners):
+            listener(name, category, end - start)
+
+def profiled(category: str, name: Optional[str] = None):
+    """Decorator that times every call of a helper function"""
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name, category):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def profiled_node(name: str, node: Callable) -> Callable:
+    """
+    Wrap a graph node so its run is recorded and attributed to its analyst branch.
+
+    Returns the node unchanged when profiling is disabled and nobody listens for spans.
+    """
+    if get_profiler() is None and not _span_listeners:
+        return node
+
+    def branch_of(state) -> str:
+        analyst = state.get("analyst") if isinstance(state, dict) else None
+        return analyst.name if analyst is not None else _current_branch.get()
+
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state):
+            token = _current_branch.set(branch_of(state))
+            try:
+                with span(name, "node"):
+                    return await node(state)
+            finally:
+                _current_branch.reset(token)
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(state):
+        token = _current_branch.set(branch_of(state))
+        try:
+            with span(name, "node"):
+                return node(state)
+        finally:
+            _current_branch.reset(token)
+    return wrapper
+
+class ProfiledSerializer(JsonPlusSerializer):
+    """Checkpoint serializer that records (de)serialization time"""
+
+    def dumps_typed(self, obj: Any) -> tuple:
+        with span("checkpoint.dumps", "serialization"):
+            return super().dumps_typed(obj)
+
+    def loads_typed(self, data: tuple) -> Any:
+        with span("checkpoint.loads", "serialization"):
+            return super().loads_typed(data)
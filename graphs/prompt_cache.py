@@ -0,0 +1,87 @@
+# Prompt cache accounting - cached input tokens reported by the provider, per BAML function
+import threading
+from typing import Any, Dict, Optional, TypedDict
+
+class TokenUsage(TypedDict):
+    input_tokens: int # Prompt tokens billed for the call
+    output_tokens: int # Completion tokens
+    cached_input_tokens: int # Prompt tokens served from the provider's prompt cache
+
+def response_usage(body: dict) -> Optional[TokenUsage]:
+    """Token usage of an OpenAI chat/responses or Anthropic response body"""
+    usage = body.get("usage") if isinstance(body, dict) else None
+    if not usage:
+        return None
+
+    if "prompt_tokens" in usage:
+        # OpenAI chat completions
+        details = usage.get("prompt_tokens_details") or {}
+        return {
+            "input_tokens": usage.get("prompt_tokens", 0),
+            "output_tokens": usage.get("completion_tokens", 0),
+            "cached_input_tokens": details.get("cached_tokens", 0) or 0,
+        }
+    if "input_tokens_details" in usage:
+        # OpenAI responses API
+        return {
+            "input_tokens": usage.get("input_tokens", 0),
+            "output_tokens": usage.get("output_tokens", 0),
+            "cached_input_tokens": (usage.get("input_tokens_details") or {}).get("cached_tokens", 0) or 0,
+        }
+    # Anthropic reports cache reads separately from the uncached input tokens
+    cache_read = usage.get("cache_read_input_tokens", 0) or 0
+    return {
+        "input_tokens": usage.get("input_tokens", 0) + cache_read + (usage.get("cache_creation_input_tokens", 0) or 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "cached_input_tokens": cache_read,
+    }
+
+def collector_usage(collector: Any) -> Optional[TokenUsage]:
+    """Token usage of the last call a BAML Collector saw, preferring the raw provider response"""
+    last = getattr(collector, "last", None)
+    if last is None:
+        return None
+
+    for call in getattr(last, "calls", None) or []:
+        http_response = getattr(call, "http_response", None)
+        body = getattr(http_response, "body", None)
+        if body is not None and hasattr(body, "json"):
+            usage = response_usage(body.json())
+            if usage is not None:
+                return usage
+
+    usage = getattr(last, "usage", None)
+    if usage is None:
+        return None
+    return {
+        "input_tokens": getattr(usage, "input_tokens", None) or 0,
+        "output_tokens": getattr(usage, "output_tokens", None) or 0,
+        "cached_input_tokens": getattr(usage, "cached_input_tokens", None) or 0,
+    }
+
+class PromptCacheStats:
+    """Running cached/total input token counts per BAML function"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def record(self, function_name: str, usage: TokenUsage):
+        with self._lock:
+            totals = self._totals.setdefault(function_name, {"calls": 0, "input_tokens": 0, "cached_input_tokens": 0})
+            totals["calls"] += 1
+            totals["input_tokens"] += usage["input_tokens"]
+            totals["cached_input_tokens"] += usage["cached_input_tokens"]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-function totals plus hit_rate, the share of input tokens served from cache"""
+        with self._lock:
+            return {
+                function_name: {
+                    **totals,
+                    "hit_rate": round(totals["cached_input_tokens"] / totals["input_tokens"], 4) if totals["input_tokens"] else 0.0,
+                }
+                for function_name, totals in self._totals.items()
+            }
+
+prompt_cache_stats = PromptCacheStats()
@@ -1,12 +1,49 @@
 from graphs.types import ResearchGraphState
-from graphs.interview_graph import create_analysts, human_feedback, get_interview_graph
+from graphs.interview_graph import acreate_analysts, create_analysts, human_feedback, get_interview_graph, get_interview_opening
 from graphs.traced_client import traced_client
+from graphs.citations import citation_mappings, consolidate_sections, format_sources, renumber_citations, strip_report_headers
+from graphs.settings import incremental_reduce_enabled, speculative_interviews_enabled, topic_reuse_enabled
+from graphs.profiling import ProfiledSerializer, get_profiler, profiled, profiled_node, span
+from typing import List, Optional
+from baml_client.types import SectionDigest
+from graphs.speculation import claim_speculative_turn, create_analysts_and_speculate
+from graphs.topic_index import find_similar_run, record_run, report_reusable
 from langgraph.types import Send
 from langgraph.graph import END, START, StateGraph
-from langchain_core.messages import HumanMessage
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.checkpoint.memory import MemorySaver
 
+# Nodes that only need the sections; a run reusing prior sections starts here
+REPORT_WRITERS = ["write_report", "write_introduction", "write_conclusion"]
+
+def match_topic(state: ResearchGraphState):
+    """Node to reuse the analysts and sections, or the report, of a prior run on a near-identical topic"""
+
+    # Analysts revised from feedback belong to this run only
+    if state.get('human_analyst_feedback', 'approve').lower() != 'approve':
+        return {"reuse": ""}
+
+    with span("topic_index.find", "cpu"):
+        match = find_similar_run(state["topic"], state["max_analysts"])
+    if match is None:
+        return {"reuse": ""}
+
+    reuse = "report" if report_reusable(match) else "sections"
+    print(f"♻️  Reusing {reuse} of '{match.topic}' (similarity {match.similarity:.2f})")
+    update = {"analysts": match.analysts, "sections": match.sections, "reuse": reuse}
+    if reuse == "report":
+        update["final_report"] = match.final_report
+    return update
+
+def route_topic_match(state: ResearchGraphState):
+    """Conditional edge: finish with the reused report, write a new one from reused sections, or start from scratch"""
+    reuse = state.get("reuse", "")
+    if reuse == "report":
+        return END
+    if reuse == "sections":
+        return REPORT_WRITERS
+    return "create_analysts"
+
 def initiate_all_interviews(state: ResearchGraphState):
     """Conditional edge to initiate all interviews via Send() API or return to create_analysts"""    
 
@@ -19,100 +56,168 @@ def initiate_all_interviews(state: ResearchGraphState):
     # Otherwise kick off interviews in parallel via Send() API
     else:
         topic = state["topic"]
-        return [Send("conduct_interview", {
-            "analyst": analyst,
-            "messages": [HumanMessage(
-                content=f"So you said you were writing an article on {topic}?"
-            )]
-        }) for analyst in state["analysts"]]
+        sends = []
+        for analyst in state["analysts"]:
+            # Resume from the first turn run while approval was pending, if any;
+            # blocks while that turn is still in flight (RESEARCH_SPECULATION_WAIT_SECONDS)
+            speculative_turn = claim_speculative_turn(topic, analyst)
+            if speculative_turn:
+                sends.append(Send("conduct_interview", {"analyst": analyst, **speculative_turn}))
+            else:
+                sends.append(Send("conduct_interview", {
+                    "analyst": analyst,
+                    "messages": [get_interview_opening(topic)]
+                }))
+        return sends
+
+@profiled("cpu")
+def format_outline(digests: List[SectionDigest]) -> str:
+    """Format the running outline built from section digests"""
+    return "\n\n".join([f"## {digest.title}\n{digest.summary}" for digest in digests])
+
+@profiled("cpu")
+def merge_digested_insights(sections: List[str], digests: List[SectionDigest]) -> str:
+    """
+    Report body from the per-section insights, with citations numbered like the merged source list.
+
+    Unlike WriteReport's single narrative, the sections' insights follow each other
+    in section order without transitions between them.
+    """
+    mappings, _ = citation_mappings(sections)
+    paragraphs = [renumber_citations(digest.insights, mapping) for digest, mapping in zip(digests, mappings)]
+    return "## Insights\n\n" + "\n\n".join(paragraphs)
+
+def framing_sections(state: ResearchGraphState) -> str:
+    """What the introduction and conclusion are written from: the digest outline if complete, else all sections"""
+    sections = state["sections"]
+
+    # Prefer the pre-digested outline when sections were folded in incrementally
+    digests = state.get("digests") or []
+    if digests and len(digests) == len(sections):
+        return format_outline(digests)
+
+    # Concat all sections together
+    with span("join_sections", "cpu"):
+        return "\n\n".join([f"{section}" for section in sections])
+
+def merged_report(state: ResearchGraphState) -> Optional[dict]:
+    """Report body merged from the section digests, when every branch drafted its insights"""
+    sections = state["sections"]
+    digests = state.get("digests") or []
+    if digests and len(digests) == len(sections):
+        return {"content": merge_digested_insights(sections, digests)}
+    return None
+
+def report_args(state: ResearchGraphState) -> dict:
+    # Renumber citations across sections and drop their source lists; sources are merged in code
+    with span("consolidate_citations", "cpu"):
+        consolidated = consolidate_sections(state["sections"])
+        return {"topic": state["topic"], "sections": "\n\n".join(consolidated["sections"])}
+
+def framing_args(state: ResearchGraphState) -> dict:
+    return {"topic": state["topic"], "sections": framing_sections(state)}
 
 def write_report(state: ResearchGraphState):
     """Node to write the final report body using BAML"""
 
-    # Full set of sections
-    sections = state["sections"]
-    topic = state["topic"]
+    # Each branch already drafted its insights; merge them locally instead of calling the LLM
+    merged = merged_report(state)
+    if merged is not None:
+        return merged
 
-    # Concat all sections together
-    formatted_str_sections = "\n\n".join([f"{section}" for section in sections])
-    
-    # Generate report using BAML
-    report_content = traced_client.WriteReport(
-        topic=topic,
-        sections=formatted_str_sections
-    )
-    
+    report_content = traced_client.llm_call("WriteReport", **report_args(state))
+    return {"content": report_content}
+
+async def awrite_report(state: ResearchGraphState):
+    """Async write_report, for the service graph"""
+    merged = merged_report(state)
+    if merged is not None:
+        return merged
+
+    report_content = await traced_client.allm_call("WriteReport", **report_args(state))
     return {"content": report_content}
 
 def write_introduction(state: ResearchGraphState):
     """Node to write the introduction using BAML"""
+    intro_content = traced_client.llm_call("WriteIntroduction", **framing_args(state))
+    return {"introduction": intro_content}
 
-    # Full set of sections
-    sections = state["sections"]
-    topic = state["topic"]
-
-    # Concat all sections together
-    formatted_str_sections = "\n\n".join([f"{section}" for section in sections])
-    
-    # Generate introduction using BAML
-    intro_content = traced_client.WriteIntroduction(
-        topic=topic,
-        sections=formatted_str_sections
-    )
-    
+async def awrite_introduction(state: ResearchGraphState):
+    """Async write_introduction, for the service graph"""
+    intro_content = await traced_client.allm_call("WriteIntroduction", **framing_args(state))
     return {"introduction": intro_content}
 
 def write_conclusion(state: ResearchGraphState):
     """Node to write the conclusion using BAML"""
+    conclusion_content = traced_client.llm_call("WriteConclusion", **framing_args(state))
+    return {"conclusion": conclusion_content}
 
-    # Full set of sections
-    sections = state["sections"]
-    topic = state["topic"]
-
-    # Concat all sections together
-    formatted_str_sections = "\n\n".join([f"{section}" for section in sections])
-    
-    # Generate conclusion using BAML
-    conclusion_content = traced_client.WriteConclusion(
-        topic=topic,
-        sections=formatted_str_sections
-    )
-    
+async def awrite_conclusion(state: ResearchGraphState):
+    """Async write_conclusion, for the service graph"""
+    conclusion_content = await traced_client.allm_call("WriteConclusion", **framing_args(state))
     return {"conclusion": conclusion_content}
 
 def finalize_report(state: ResearchGraphState):
     """The is the "reduce" step where we gather all the sections, combine them, and reflect on them to write the intro/conclusion"""
 
-    # Save full final report
-    content = state["content"]
-    if content.startswith("## Insights"):
-        content = content.strip("## Insights")
-    if "## Sources" in content:
-        try:
-            content, sources = content.split("\n## Sources\n")
-        except:
-            sources = None
-    else:
-        sources = None
+    # Report body without its ## Insights header
+    content = strip_report_headers(state["content"])
+
+    # Build the consolidated source list locally, numbered like the citations write_report saw
+    with span("consolidate_citations", "cpu"):
+        sources = consolidate_sections(state["sections"])["sources"]
 
+    # Save full final report
     final_report = state["introduction"] + "\n\n---\n\n" + content + "\n\n---\n\n" + state["conclusion"]
-    if sources is not None:
-        final_report += "\n\n## Sources\n" + sources
+    if sources:
+        final_report += "\n\n## Sources\n" + format_sources(sources)
+
+    # Make this run reusable for near-identical topics
+    if not state.get("reuse"):
+        with span("topic_index.record", "cpu"):
+            record_run(state["topic"], state["max_analysts"], state["analysts"], state["sections"], final_report)
     return {"final_report": final_report}
     #return {"final_report": "El dulce de leche es lo mas rico que hay."}
 
-def get_research_graph_builder() -> StateGraph:
+def get_research_graph_builder(
+    incremental_reduce: Optional[bool] = None,
+    speculative: Optional[bool] = None,
+    topic_reuse: Optional[bool] = None,
+    async_llm: bool = False,
+) -> StateGraph:
+    """
+    Research graph builder.
+
+    With async_llm the LLM nodes await the async BAML client instead of blocking
+    a thread each; such graphs must be run with ainvoke/astream (see graphs/service.py).
+    """
+    if incremental_reduce is None:
+        incremental_reduce = incremental_reduce_enabled()
+    if speculative is None:
+        speculative = speculative_interviews_enabled()
+    if topic_reuse is None:
+        topic_reuse = topic_reuse_enabled()
+
     builder = StateGraph(ResearchGraphState)
-    builder.add_node("create_analysts", create_analysts)
-    builder.add_node("human_feedback", human_feedback)
-    builder.add_node("conduct_interview", get_interview_graph())
-    builder.add_node("write_report", write_report)
-    builder.add_node("write_introduction", write_introduction)
-    builder.add_node("write_conclusion", write_conclusion)
-    builder.add_node("finalize_report", finalize_report)
+    if speculative:
+        builder.add_node("create_analysts", profiled_node("create_analysts", create_analysts_and_speculate))
+    else:
+        builder.add_node("create_analysts", profiled_node("create_analysts", acreate_analysts if async_llm else create_analysts))
+    builder.add_node("human_feedback", profiled_node("human_feedback", human_feedback))
+    builder.add_node("conduct_interview", get_interview_graph(incremental_reduce=incremental_reduce, async_llm=async_llm))
+    builder.add_node("write_report", profiled_node("write_report", awrite_report if async_llm else write_report))
+    builder.add_node("write_introduction", profiled_node("write_introduction", awrite_introduction if async_llm else write_introduction))
+    builder.add_node("write_conclusion", profiled_node("write_conclusion", awrite_conclusion if async_llm else write_conclusion))
+    builder.add_node("finalize_report", profiled_node("finalize_report", finalize_report))
+    if topic_reuse:
+        builder.add_node("match_topic", profiled_node("match_topic", match_topic))
 
     # Logic
-    builder.add_edge(START, "create_analysts")
+    if topic_reuse:
+        builder.add_edge(START, "match_topic")
+        builder.add_conditional_edges("match_topic", route_topic_match, ["create_analysts", *REPORT_WRITERS, END])
+    else:
+        builder.add_edge(START, "create_analysts")
     builder.add_edge("create_analysts", "human_feedback")
     builder.add_conditional_edges("human_feedback", initiate_all_interviews, ["create_analysts", "conduct_interview"])
     builder.add_edge("conduct_interview", "write_report")
@@ -128,7 +233,8 @@ def get_research_graph() -> CompiledStateGraph:
     #return get_research_graph_builder().compile(interrupt_before=['human_feedback'])
     return get_research_graph_builder().compile()
 
-def get_research_graph_with_memory() -> CompiledStateGraph:
-    memory = MemorySaver()
-    builder = get_research_graph_builder()
+def get_research_graph_with_memory(async_llm: bool = False) -> CompiledStateGraph:
+    # Record checkpoint serialization time when profiling
+    memory = MemorySaver(serde=ProfiledSerializer()) if get_profiler() is not None else MemorySaver()
+    builder = get_research_graph_builder(async_llm=async_llm)
     return builder.compile(checkpointer=memory)
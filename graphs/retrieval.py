@@ -0,0 +1,88 @@
+# Retrieval helpers - compact document storage and lazy <Document> formatting
+import re
+import sys
+from typing import Iterable, List, Optional
+from graphs.passage_index import Passage
+from graphs.profiling import profiled
+from graphs.types import RetrievedDocument
+
+def make_document(source: str, content: str, page: Optional[str] = None) -> RetrievedDocument:
+    """Build a compact document, interning the metadata shared across turns and branches"""
+    return {
+        "source": sys.intern(source),
+        "page": sys.intern(page) if page is not None else None,
+        "content": content,
+    }
+
+def query_terms(query: str) -> set:
+    """Lower-cased query terms used to score section relevance"""
+    return {term.lower() for term in re.findall(r"\w+", query) if len(term) > 2}
+
+def split_wikipedia_sections(text: str) -> List[tuple]:
+    """Split wikipedia page text into (heading, body) pairs; the lead has an empty heading"""
+    parts = re.split(r"\n\s*(={2,})\s*(.+?)\s*\1\s*\n", "\n" + text)
+    sections = [("", parts[0].strip())]
+    # re.split yields [lead, markers, heading, body, markers, heading, body, ...]
+    for i in range(1, len(parts) - 2, 3):
+        sections.append((parts[i + 1], parts[i + 2].strip()))
+    return [(heading, body) for heading, body in sections if body]
+
+@profiled("cpu")
+def select_relevant_sections(text: str, query: str, max_chars: int) -> str:
+    """Keep the lead plus the sections that best match the query, within max_chars"""
+    sections = split_wikipedia_sections(text)
+    if not sections:
+        return ""
+
+    terms = query_terms(query)
+    lead = sections[0] if sections[0][0] == "" else None
+    candidates = [section for section in sections if section is not lead]
+
+    def relevance(section: tuple) -> float:
+        heading, body = section
+        words = re.findall(r"\w+", f"{heading} {body}".lower())
+        if not words:
+            return 0.0
+        hits = sum(1 for word in words if word in terms)
+        heading_hits = sum(1 for word in re.findall(r"\w+", heading.lower()) if word in terms)
+        return hits / len(words) + heading_hits
+
+    ranked = sorted(candidates, key=relevance, reverse=True)
+    chosen = [lead] if lead else []
+    budget = max_chars - (len(lead[1]) if lead else 0)
+    for section in ranked:
+        if budget <= 0 or relevance(section) == 0:
+            break
+        chosen.append(section)
+        budget -= len(section[0]) + len(section[1]) + 8
+
+    # Keep the chosen sections in page order
+    chosen.sort(key=sections.index)
+    selected = "\n\n".join(
+        body if not heading else f"== {heading} ==\n{body}" for heading, body in chosen
+    )
+    return selected[:max_chars]
+
+def passages_to_documents(passages: Iterable[Passage]) -> List[RetrievedDocument]:
+    """Convert passages served from the local index into compact documents"""
+    return [
+        make_document(passage.source, passage.content, None if passage.backend == "web" else passage.page)
+        for passage in passages
+    ]
+
+def format_document(document: RetrievedDocument) -> str:
+    """Render one compact document in the <Document> layout the prompts expect"""
+    if document["page"] is None:
+        return f'<Document href="{document["source"]}"/>\n{document["content"]}\n</Document>'
+    return f'<Document source="{document["source"]}" page="{document["page"]}"/>\n{document["content"]}\n</Document>'
+
+def format_documents(documents: Iterable[RetrievedDocument]) -> str:
+    """Render one retrieval batch"""
+    return "\n\n---\n\n".join([format_document(document) for document in documents])
+
+@profiled("cpu")
+def format_context(context: list) -> str:
+    """Render the accumulated context at prompt time; pre-formatted strings pass through"""
+    return "\n\n".join(
+        [batch if isinstance(batch, str) else format_documents(batch) for batch in context]
+    )
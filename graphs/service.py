@@ -0,0 +1,194 @@
+# Research service - multiplexes many research runs over one long-lived worker process
+import asyncio
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, TypedDict
+from langgraph.graph.state import CompiledStateGraph
+from graphs.circuit_breaker import RETRIEVAL_BACKENDS, get_retrieval_breaker
+from graphs.concurrency import get_llm_limiter, get_llm_rate_limiter, get_retrieval_cache
+from graphs.prompt_cache import prompt_cache_stats
+from graphs.profiling import add_span_listener, remove_span_listener
+from graphs.researcher_graph import get_research_graph_with_memory
+from graphs.settings import env_int
+
+# Latency samples kept per stage for the percentile metrics
+LATENCY_WINDOW = 1000
+
+class QueueFullError(Exception):
+    """Raised when a run is submitted while the admission queue is full"""
+
+class RunRecord(TypedDict):
+    run_id: str # Also used as the checkpointer thread id
+    topic: str # Research topic
+    max_analysts: int # Number of analysts
+    status: str # queued, running, done or error
+    submitted_at: float # Wall-clock submission time
+    started_at: Optional[float] # Wall-clock start time
+    finished_at: Optional[float] # Wall-clock finish time
+    final_report: Optional[str] # Final report once done
+    error: Optional[str] # Error message if the run failed
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+class ResearchService:
+    """
+    Runs many research threads concurrently on one event loop.
+
+    Runs share the process-wide LLM limiter and retrieval cache and one
+    checkpointer. Admission is bounded by the queue size: when it is full,
+    submit() raises QueueFullError so callers can apply backpressure.
+    """
+
+    def __init__(
+        self,
+        graph: Optional[CompiledStateGraph] = None,
+        max_queue: Optional[int] = None,
+        workers: Optional[int] = None,
+    ):
+        self.max_queue = max_queue or env_int("RESEARCH_SERVICE_MAX_QUEUE", 64)
+        self.workers = workers or env_int("RESEARCH_SERVICE_WORKERS", 8)
+        self.run_history = env_int("RESEARCH_SERVICE_RUN_HISTORY", 1000)
+        self.node_threads = env_int("RESEARCH_SERVICE_NODE_THREADS", 64)
+        self.runs: Dict[str, RunRecord] = {}
+        self.stage_latencies: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+        # Spans are recorded from node and retrieval threads while metrics() reads them
+        self._latency_lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+        # Listen before compiling so every node is instrumented
+        add_span_listener(self._record_span)
+        # LLM nodes await the async BAML client on the loop instead of holding executor threads
+        self.graph = graph or get_research_graph_with_memory(async_llm=True)
+
+    def _record_span(self, name: str, category: str, seconds: float):
+        if category in ("node", "llm"):
+            self._record_latency(name, seconds)
+
+    def _record_latency(self, stage: str, seconds: float):
+        with self._latency_lock:
+            self.stage_latencies[stage].append(seconds)
+
+    async def start(self):
+        """Start the worker tasks on the running event loop"""
+        # Remaining sync nodes and edges (e.g. speculation) run on the loop's default executor
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=self.node_threads))
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Cancel the workers; queued runs are dropped"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        remove_span_listener(self._record_span)
+
+    def submit(self, topic: str, max_analysts: int = 2) -> RunRecord:
+        """Queue a research run, or raise QueueFullError when the service is saturated"""
+        if self._queue is None:
+            raise RuntimeError("ResearchService.start() has not been awaited")
+
+        run: RunRecord = {
+            "run_id": str(uuid.uuid4()),
+            "topic": topic,
+            "max_analysts": max_analysts,
+            "status": "queued",
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "final_report": None,
+            "error": None,
+        }
+        try:
+            self._queue.put_nowait(run["run_id"])
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(f"Queue is full ({self.max_queue} runs waiting)")
+
+        self.runs[run["run_id"]] = run
+        return run
+
+    async def _worker(self):
+        while True:
+            run_id = await self._queue.get()
+            run = self.runs[run_id]
+            run["status"] = "running"
+            run["started_at"] = time.time()
+            try:
+                result = await self.graph.ainvoke(
+                    {
+                        "topic": run["topic"],
+                        "max_analysts": run["max_analysts"],
+                        "human_analyst_feedback": "approve",
+                    },
+                    {"configurable": {"thread_id": run_id}, "recursion_limit": 50},
+                )
+                run["final_report"] = result.get("final_report", "")
+                run["status"] = "done"
+                self.completed += 1
+            except Exception as e:
+                run["error"] = str(e)
+                run["status"] = "error"
+                self.failed += 1
+            finally:
+                run["finished_at"] = time.time()
+                self._record_latency("run", run["finished_at"] - run["started_at"])
+                self._queue.task_done()
+                self._prune_runs()
+
+    def _prune_runs(self):
+        """Forget the oldest finished runs and their checkpoints beyond the history limit"""
+        finished = [run_id for run_id, run in self.runs.items() if run["status"] in ("done", "error")]
+        for run_id in finished[:max(0, len(finished) - self.run_history)]:
+            del self.runs[run_id]
+            if self.graph.checkpointer is not None:
+                self.graph.checkpointer.delete_thread(run_id)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, in-flight work and per-stage latency percentiles in seconds"""
+        with self._latency_lock:
+            latencies = {stage: list(samples) for stage, samples in self.stage_latencies.items()}
+        llm_limiter = get_llm_limiter()
+        retrieval_cache = get_retrieval_cache()
+
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+            "in_flight_runs": sum(1 for run in self.runs.values() if run["status"] == "running"),
+            "in_flight_llm_calls": llm_limiter.in_flight,
+            "max_inflight_llm_calls": llm_limiter.limit,
+            "llm_rate_limit_wait_s": round(get_llm_rate_limiter().waited_seconds, 3),
+            "completed_runs": self.completed,
+            "failed_runs": self.failed,
+            "rejected_runs": self.rejected,
+            "retrieval_cache": {
+                "entries": len(retrieval_cache),
+                "hits": retrieval_cache.hits,
+                "misses": retrieval_cache.misses,
+            },
+            "prompt_cache": prompt_cache_stats.snapshot(),
+            "retrieval_breakers": {backend: get_retrieval_breaker(backend).status() for backend in RETRIEVAL_BACKENDS},
+            "stage_latency": {
+                stage: {
+                    "count": len(samples),
+                    "p50": percentile(samples, 50),
+                    "p95": percentile(samples, 95),
+                    "p99": percentile(samples, 99),
+                }
+                for stage, samples in latencies.items()
+            },
+        }
@@ -0,0 +1,51 @@
+# Runtime settings read from the environment (.env is loaded by main.py / langgraph dev)
+import os
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment"""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer from the environment"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+def env_float(name: str, default: float) -> float:
+    """Read a float from the environment"""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+def env_str(name: str, default: str = "") -> str:
+    """Read a string from the environment"""
+    return os.getenv(name) or default
+
+def incremental_reduce_enabled() -> bool:
+    """Fold each finished section into a digest as soon as its interview ends"""
+    return env_flag("RESEARCH_INCREMENTAL_REDUCE")
+
+def compact_retrieval_enabled() -> bool:
+    """Store only the lead and query-relevant sections of wikipedia pages"""
+    return env_flag("RESEARCH_COMPACT_RETRIEVAL")
+
+def wikipedia_max_chars() -> int:
+    """Maximum characters kept per wikipedia document in compact retrieval mode"""
+    return env_int("RESEARCH_WIKIPEDIA_MAX_CHARS", 3000)
+
+def fused_turns_enabled() -> bool:
+    """Generate question and search query in one streamed call, starting retrieval early"""
+    return env_flag("RESEARCH_FUSED_TURNS")
+
+def speculative_interviews_enabled() -> bool:
+    """Run each proposed analyst's first interview turn while human feedback is pending"""
+    return env_flag("RESEARCH_SPECULATIVE_INTERVIEWS")
+
+def fake_backends_enabled() -> bool:
+    """Swap the LLM and search backends for simulated ones (load tests)"""
+    return env_flag("RESEARCH_FAKE_BACKENDS")
+
+def topic_reuse_enabled() -> bool:
+    """Reuse prior runs on near-identical topics (RESEARCH_TOPIC_INDEX_PATH is set)"""
+    return bool(env_str("RESEARCH_TOPIC_INDEX_PATH"))
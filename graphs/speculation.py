@@ -0,0 +1,150 @@
+# Speculative interviews - run the first interview turn while analyst approval is pending
+import hashlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from typing import Dict, List, Optional
+from langgraph.config import get_config
+from baml_client.types import Analyst
+from graphs.concurrency import submit_retrieval
+from graphs.interview_graph import (
+    ask_question_and_search,
+    create_analysts,
+    generate_answer,
+    generate_question,
+    get_interview_opening,
+    search_web,
+    search_wikipedia,
+)
+from graphs.settings import env_float, env_int, fused_turns_enabled
+from graphs.types import GenerateAnalystsState
+
+def speculation_key(topic: str, analyst: Analyst) -> str:
+    """Identify a speculative interview by topic and the full analyst persona"""
+    persona = "\x00".join([topic, analyst.name, analyst.role, analyst.affiliation, analyst.description])
+    return hashlib.sha1(persona.encode("utf-8")).hexdigest()
+
+def current_thread_id(topic: str) -> str:
+    """Thread id of the current graph run; the topic outside of one"""
+    try:
+        config = get_config()
+    except RuntimeError:
+        return topic
+    return str(config.get("configurable", {}).get("thread_id") or topic)
+
+def run_first_turn(topic: str, analyst: Analyst) -> dict:
+    """Run question, retrieval and answer for one analyst, outside the graph"""
+    state = {"analyst": analyst, "messages": [get_interview_opening(topic)], "context": []}
+
+    if fused_turns_enabled():
+        update = ask_question_and_search(state)
+        state["messages"] = state["messages"] + update["messages"]
+        state["context"] = state["context"] + update["context"]
+    else:
+        update = generate_question(state)
+        state["messages"] = state["messages"] + update["messages"]
+        searches = [submit_retrieval(search_web, state), submit_retrieval(search_wikipedia, state)]
+        for search in searches:
+            state["context"] = state["context"] + search.result()["context"]
+
+    answer = generate_answer(state)
+    state["messages"] = state["messages"] + answer["messages"]
+
+    return {"messages": state["messages"], "context": state["context"]}
+
+class SpeculativeInterviews:
+    """
+    Background first turns for proposed analysts, per research thread.
+
+    start() is called as soon as analysts are proposed. claim() hands a finished
+    turn to the Send() fan-out once the analysts are approved. Turns for analysts
+    that did not survive the feedback are discarded; unchanged analysts are reused.
+    Turns of threads that never claim them (e.g. abandoned at the approval step)
+    are evicted after ttl_seconds.
+    """
+
+    def __init__(self, max_workers: int = 8, ttl_seconds: float = 1800.0):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculation")
+        self._lock = threading.Lock()
+        self._turns: Dict[str, Dict[str, Future]] = {}
+        self._started: Dict[str, float] = {}
+        self.ttl_seconds = ttl_seconds
+
+    def start(self, thread_id: str, topic: str, analysts: List[Analyst]):
+        """Start first turns for the proposed analysts and drop those of replaced ones"""
+        keys = {speculation_key(topic, analyst): analyst for analyst in analysts}
+        with self._lock:
+            self._evict_expired()
+            turns = self._turns.setdefault(thread_id, {})
+            self._started[thread_id] = time.monotonic()
+            for key in list(turns):
+                if key not in keys:
+                    turns.pop(key).cancel()
+            for key, analyst in keys.items():
+                if key not in turns:
+                    turns[key] = self._executor.submit(copy_context().run, run_first_turn, topic, analyst)
+
+    def claim(self, thread_id: str, topic: str, analyst: Analyst, timeout: float) -> Optional[dict]:
+        """
+        Take the speculative turn for an approved analyst, or None if unavailable.
+
+        A turn still in flight is waited for up to timeout seconds; 0 only takes finished turns.
+        """
+        with self._lock:
+            self._evict_expired()
+            turn = self._turns.get(thread_id, {}).pop(speculation_key(topic, analyst), None)
+            if thread_id in self._turns and not self._turns[thread_id]:
+                del self._turns[thread_id]
+                del self._started[thread_id]
+        if turn is None:
+            return None
+        try:
+            return turn.result(timeout=timeout)
+        except FutureTimeoutError:
+            # The interview branch starts from scratch; the late result is ignored
+            return None
+        except Exception as e:
+            print(f"Speculative interview failed, running it in the graph: {e}")
+            return None
+
+    def _evict_expired(self):
+        cutoff = time.monotonic() - self.ttl_seconds
+        for thread_id in [thread_id for thread_id, started in self._started.items() if started < cutoff]:
+            for turn in self._turns.pop(thread_id).values():
+                turn.cancel()
+            del self._started[thread_id]
+
+_speculative_interviews: Optional[SpeculativeInterviews] = None
+_speculative_interviews_lock = threading.Lock()
+
+def get_speculative_interviews() -> SpeculativeInterviews:
+    """Shared instance, created on first use so .env is loaded by then"""
+    global _speculative_interviews
+    with _speculative_interviews_lock:
+        if _speculative_interviews is None:
+            _speculative_interviews = SpeculativeInterviews(
+                max_workers=env_int("RESEARCH_SPECULATION_THREADS", 8),
+                ttl_seconds=env_float("RESEARCH_SPECULATION_TTL_SECONDS", 1800.0),
+            )
+        return _speculative_interviews
+
+def create_analysts_and_speculate(state: GenerateAnalystsState):
+    """Create analysts, then start their first interview turn while feedback is pending"""
+    update = create_analysts(state)
+    topic = state["topic"]
+    get_speculative_interviews().start(current_thread_id(topic), topic, update["analysts"])
+    return update
+
+def claim_speculative_turn(topic: str, analyst: Analyst) -> Optional[dict]:
+    """
+    Speculative first turn for an approved analyst, waiting for it if still in flight.
+
+    Called from the initiate_all_interviews conditional edge, which blocks until
+    the turn is done or RESEARCH_SPECULATION_WAIT_SECONDS (default 120) have passed
+    for it. Since the turns run in parallel, later analysts' turns are usually
+    done by then. Set it to 0 to only take finished turns and never delay the fan-out.
+    """
+    return get_speculative_interviews().claim(
+        current_thread_id(topic), topic, analyst, timeout=env_float("RESEARCH_SPECULATION_WAIT_SECONDS", 120.0)
+    )
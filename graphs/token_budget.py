@@ -0,0 +1,146 @@
+# Prompt budget guard - counts rendered prompt tokens locally before a BAML call is sent
+import json
+from typing import Any, Dict, Optional, Tuple, TypedDict
+import tiktoken
+from graphs.settings import env_int, env_str
+
+# Context windows of the models used in baml_src/clients.baml
+MODEL_CONTEXT_TOKENS = {
+    "gpt-4o": 128_000,
+    "gpt-5": 400_000,
+    "gpt-5-mini": 400_000,
+    "claude-opus-4-1-20250805": 200_000,
+    "claude-sonnet-4-20250514": 200_000,
+    "claude-3-5-haiku-20241022": 200_000,
+}
+DEFAULT_CONTEXT_TOKENS = 128_000
+
+# Argument each BAML function can give up when its prompt is over budget, and which end to keep
+TRIMMABLE_ARGS = {
+    "GenerateQuestion": ("messages", "tail"),
+    "GenerateQuestionWithQuery": ("messages", "tail"),
+    "GenerateSearchQuery": ("messages", "tail"),
+    "GenerateAnswer": ("context", "tail"),
+    "WriteSection": ("context", "tail"),
+    "WriteDigestedSection": ("context", "tail"),
+    "WriteReport": ("sections", "head"),
+    "WriteIntroduction": ("sections", "head"),
+    "WriteConclusion": ("sections", "head"),
+}
+
+# Render and trim at most this many times before giving up
+MAX_TRIM_ROUNDS = 4
+
+class PromptBudgetExceeded(Exception):
+    """Raised when a prompt is over budget and the overflow policy is "error" or trimming failed"""
+
+class PreflightReport(TypedDict):
+    model: str # Model named in the rendered request
+    budget_tokens: int # Effective input budget for this call
+    tokens_before: int # Prompt tokens as rendered from the caller's arguments
+    tokens_after: int # Prompt tokens actually sent
+    trimmed_arg: Optional[str] # Argument that was trimmed, if any
+
+# Encoding per model, or None when it could not be loaded
+_encodings: Dict[str, Any] = {}
+
+def load_encoding(model: str) -> Optional[Any]:
+    """
+    tiktoken encoding for the model, o200k_base for unknown models.
+
+    tiktoken downloads the BPE file on first use; when that fails (offline, no
+    TIKTOKEN_CACHE_DIR) None is returned and cached so the download is not retried per call.
+    """
+    if model not in _encodings:
+        try:
+            try:
+                _encodings[model] = tiktoken.encoding_for_model(model)
+            except KeyError:
+                _encodings[model] = tiktoken.get_encoding("o200k_base")
+        except (OSError, ValueError) as error:
+            print(f"⚠️  tiktoken encoding for {model or 'unknown model'} unavailable ({error}), estimating tokens from characters")
+            _encodings[model] = None
+    return _encodings[model]
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """Count tokens offline with tiktoken, or estimate them at ~4 characters per token"""
+    encoding = load_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+def count_request_tokens(body: dict) -> int:
+    """Tokens of a rendered chat/responses request body, with a small per-message overhead"""
+    messages = body.get("messages") or body.get("input") or []
+    if isinstance(messages, str):
+        return count_tokens(messages, body.get("model", ""))
+
+    total = 0
+    for message in messages:
+        content = message.get("content", "")
+        if isinstance(content, list):
+            content = "".join(part.get("text", "") for part in content if isinstance(part, dict))
+        total += count_tokens(str(content), body.get("model", "")) + 4
+    if body.get("system"):
+        total += count_tokens(json.dumps(body["system"]), body.get("model", ""))
+    return total
+
+def input_budget(model: str) -> int:
+    """Context window minus reserved output tokens, capped by the optional latency budget"""
+    context_tokens = MODEL_CONTEXT_TOKENS.get(model, DEFAULT_CONTEXT_TOKENS)
+    budget = context_tokens - env_int("RESEARCH_RESERVED_OUTPUT_TOKENS", 4096)
+    latency_budget = env_int("RESEARCH_PROMPT_TOKEN_BUDGET", 0)
+    return min(budget, latency_budget) if latency_budget > 0 else budget
+
+def trim_value(value: Any, ratio: float, keep: str) -> Any:
+    """Shrink a string or message list to roughly ratio of its size"""
+    if isinstance(value, str):
+        size = max(0, int(len(value) * ratio))
+        return value[-size:] if keep == "tail" and size else value[:size]
+    if isinstance(value, list) and len(value) > 1:
+        # Keep the opening message and the most recent ones
+        size = max(1, int(len(value) * ratio))
+        return [value[0]] + value[len(value) - size + 1:] if size > 1 else value[-1:]
+    return value
+
+def preflight(client: Any, function_name: str, args: tuple, kwargs: dict) -> Tuple[dict, Optional[PreflightReport]]:
+    """
+    Render the request locally, count its tokens and enforce the budget.
+
+    The overflow policy comes from RESEARCH_PROMPT_OVERFLOW_POLICY: "trim" (default)
+    shrinks the function's trimmable argument, "error" raises PromptBudgetExceeded
+    and "off" skips the check. Returns the kwargs to send and a token report.
+    """
+    policy = env_str("RESEARCH_PROMPT_OVERFLOW_POLICY", "trim").lower()
+    request_builder = getattr(getattr(client, "request", None), function_name, None)
+    if policy == "off" or request_builder is None:
+        return kwargs, None
+
+    body = request_builder(*args, **kwargs).body.json()
+    model = body.get("model", "")
+    budget = input_budget(model)
+    tokens_before = tokens = count_request_tokens(body)
+    trimmed_arg = None
+
+    for _ in range(MAX_TRIM_ROUNDS):
+        if tokens <= budget:
+            break
+        trimmable = TRIMMABLE_ARGS.get(function_name)
+        if policy != "trim" or trimmable is None or trimmable[0] not in kwargs:
+            raise PromptBudgetExceeded(f"{function_name} prompt has {tokens} tokens, budget is {budget} for {model}")
+
+        trimmed_arg, keep = trimmable
+        # Aim slightly under budget; the fixed template does not shrink
+        kwargs = {**kwargs, trimmed_arg: trim_value(kwargs[trimmed_arg], budget / tokens * 0.9, keep)}
+        tokens = count_request_tokens(request_builder(*args, **kwargs).body.json())
+    else:
+        if tokens > budget:
+            raise PromptBudgetExceeded(f"{function_name} prompt still has {tokens} tokens after trimming, budget is {budget}")
+
+    return kwargs, {
+        "model": model,
+        "budget_tokens": budget,
+        "tokens_before": tokens_before,
+        "tokens_after": tokens,
+        "trimmed_arg": trimmed_arg,
+    }
@@ -0,0 +1,249 @@
+# Topic index - finds earlier runs on near-identical topics so their analysts, sections or report can be reused
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import uuid
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Set
+from baml_client.types import Analyst
+from graphs.settings import env_float, env_str
+
+# MinHash signature size, split into LSH bands of ROWS_PER_BAND values
+NUM_PERMUTATIONS = 64
+ROWS_PER_BAND = 4
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Words that do not change what a topic is about
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "into", "is", "its", "of",
+    "on", "or", "the", "their", "to", "what", "with",
+}
+
+def _permutation(i: int) -> tuple:
+    digest = hashlib.sha256(f"minhash-{i}".encode("utf-8")).digest()
+    a = int.from_bytes(digest[:8], "big") % MERSENNE_PRIME or 1
+    b = int.from_bytes(digest[8:16], "big") % MERSENNE_PRIME
+    return a, b
+
+PERMUTATIONS = [_permutation(i) for i in range(NUM_PERMUTATIONS)]
+
+class TopicMatch(NamedTuple):
+    run_id: str # Matched run
+    topic: str # Topic of the matched run
+    similarity: float # Jaccard similarity of the shingle sets, 0-1
+    sequence_similarity: float # Order-aware similarity of the topics' word sequences, 0-1
+    unmatched_words: List[str] # Content words of either topic with no counterpart in the other
+    analysts: List[Analyst] # Analysts of the matched run
+    sections: List[str] # Sections written by its interviews
+    final_report: str # Its final report
+
+def topic_words(topic: str) -> List[str]:
+    """Lower-cased words without accents or punctuation, in order"""
+    text = unicodedata.normalize("NFKD", topic).encode("ascii", "ignore").decode("ascii").lower()
+    return re.findall(r"[a-z0-9]+", text)
+
+def normalize_topic(topic: str) -> str:
+    """Lowercase, strip accents, punctuation and stopwords; word order is kept"""
+    return " ".join(word for word in topic_words(topic) if word not in STOPWORDS)
+
+def topic_shingles(normalized: str, n: int = 3) -> Set[str]:
+    """
+    Character n-grams of each word plus word bigrams.
+
+    The n-grams make matching robust to small edits and plurals; the bigrams
+    keep word order, so "Python 2 vs Python 3" and "Python 3 vs Python 2" differ.
+    """
+    words = normalized.split()
+    shingles = set()
+    for word in words:
+        padded = f"^{word}$"
+        shingles.update(padded[i:i + n] for i in range(max(1, len(padded) - n + 1)))
+    shingles.update(f"{left} {right}" for left, right in zip(words, words[1:]))
+    return shingles
+
+def sequence_similarity(left: str, right: str) -> float:
+    """Order-aware similarity of two topics' full word sequences, stopwords included"""
+    return SequenceMatcher(None, topic_words(left), topic_words(right), autojunk=False).ratio()
+
+def unmatched_words(left: str, right: str, min_ratio: float = 0.8) -> List[str]:
+    """
+    Non-stopword words of either topic with no counterpart in the other.
+
+    A word counts as matched when the other topic has it or a close spelling of it
+    (plural, British spelling), so "in Germany" against "in France" is unmatched.
+    """
+    left_words, right_words = set(normalize_topic(left).split()), set(normalize_topic(right).split())
+
+    def unmatched(words: Set[str], others: Set[str]) -> Set[str]:
+        candidates = others - words
+        return {
+            word for word in words - others
+            if not any(SequenceMatcher(None, word, other).ratio() >= min_ratio for other in candidates)
+        }
+
+    return sorted(unmatched(left_words, right_words) | unmatched(right_words, left_words))
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+def minhash(shingles: Set[str]) -> List[int]:
+    """MinHash signature of a shingle set"""
+    hashes = [int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big") for shingle in shingles]
+    if not hashes:
+        return [MERSENNE_PRIME] * NUM_PERMUTATIONS
+    return [min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in PERMUTATIONS]
+
+def lsh_buckets(signature: List[int]) -> List[str]:
+    """One bucket key per band; topics sharing any bucket are compared exactly"""
+    return [
+        f"{band}:" + hashlib.sha1(",".join(map(str, signature[start:start + ROWS_PER_BAND])).encode("utf-8")).hexdigest()[:16]
+        for band, start in enumerate(range(0, NUM_PERMUTATIONS, ROWS_PER_BAND))
+    ]
+
+class TopicIndex:
+    """
+    On-disk index of finished runs, keyed by MinHash/LSH signatures of their topics.
+
+    Candidates come from the LSH buckets and are confirmed with the exact
+    Jaccard similarity of their shingle sets. Runs older than the TTL are
+    ignored and pruned.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, topic TEXT NOT NULL, normalized TEXT NOT NULL, max_analysts INTEGER NOT NULL, "
+            "analysts TEXT NOT NULL, sections TEXT NOT NULL, final_report TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS buckets (bucket TEXT NOT NULL, run_id TEXT NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS buckets_by_key ON buckets (bucket)")
+        self._conn.commit()
+
+    def add(self, topic: str, max_analysts: int, analysts: List[Analyst], sections: List[str], final_report: str, ttl_seconds: float) -> str:
+        """Record a finished run and prune expired ones; returns the new run id"""
+        run_id = uuid.uuid4().hex
+        normalized = normalize_topic(topic)
+        buckets = lsh_buckets(minhash(topic_shingles(normalized)))
+
+        with self._lock:
+            self._prune(ttl_seconds)
+            self._conn.execute(
+                "INSERT INTO runs (run_id, topic, normalized, max_analysts, analysts, sections, final_report, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run_id, topic, normalized, max_analysts,
+                    json.dumps([analyst.model_dump() for analyst in analysts]),
+                    json.dumps(sections), final_report, time.time(),
+                ),
+            )
+            self._conn.executemany("INSERT INTO buckets (bucket, run_id) VALUES (?, ?)", [(bucket, run_id) for bucket in buckets])
+            self._conn.commit()
+        return run_id
+
+    def find(self, topic: str, max_analysts: int, min_similarity: float, ttl_seconds: float) -> Optional[TopicMatch]:
+        """Most similar fresh run with the same number of analysts, if it reaches min_similarity"""
+        normalized = normalize_topic(topic)
+        shingles = topic_shingles(normalized)
+        buckets = lsh_buckets(minhash(shingles))
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT run_id, topic, normalized, analysts, sections, final_report FROM runs "
+                f"WHERE run_id IN (SELECT run_id FROM buckets WHERE bucket IN ({','.join('?' * len(buckets))})) "
+                "AND max_analysts = ? AND created_at >= ? ORDER BY created_at DESC",
+                (*buckets, max_analysts, time.time() - ttl_seconds),
+            ).fetchall()
+
+        best: Optional[TopicMatch] = None
+        for run_id, prior_topic, prior_normalized, analysts, sections, final_report in rows:
+            similarity = jaccard(shingles, topic_shingles(prior_normalized))
+            if similarity >= min_similarity and (best is None or similarity > best.similarity):
+                best = TopicMatch(
+                    run_id=run_id,
+                    topic=prior_topic,
+                    similarity=similarity,
+                    sequence_similarity=sequence_similarity(topic, prior_topic),
+                    unmatched_words=unmatched_words(topic, prior_topic),
+                    analysts=[Analyst(**analyst) for analyst in json.loads(analysts)],
+                    sections=json.loads(sections),
+                    final_report=final_report,
+                )
+        return best
+
+    def _prune(self, ttl_seconds: float):
+        expired = "SELECT run_id FROM runs WHERE created_at < ?"
+        cutoff = time.time() - ttl_seconds
+        self._conn.execute(f"DELETE FROM buckets WHERE run_id IN ({expired})", (cutoff,))
+        self._conn.execute("DELETE FROM runs WHERE created_at < ?", (cutoff,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_index: Optional[TopicIndex] = None
+_index_lock = threading.Lock()
+
+def get_topic_index() -> Optional[TopicIndex]:
+    """Shared index instance, or None when RESEARCH_TOPIC_INDEX_PATH is not set"""
+    global _index
+    path = env_str("RESEARCH_TOPIC_INDEX_PATH")
+    if not path:
+        return None
+    with _index_lock:
+        if _index is None or _index.path != path:
+            _index = TopicIndex(path)
+        return _index
+
+def topic_ttl_seconds() -> float:
+    """Freshness window for reuse, RESEARCH_TOPIC_TTL_HOURS (default one week)"""
+    return env_float("RESEARCH_TOPIC_TTL_HOURS", 168.0) * 3600
+
+def sections_reusable(match: TopicMatch, threshold: float) -> bool:
+    """
+    Whether the match is about the same thing, so its sections can be reused.
+
+    The shingle similarity alone scores "X in Germany" against "X in France", or
+    "A vs B" against "B vs A", above 0.8. The word sequence must also reach the
+    threshold and every content word must have a counterpart on the other side.
+    """
+    return match.similarity >= threshold and match.sequence_similarity >= threshold and not match.unmatched_words
+
+def find_similar_run(topic: str, max_analysts: int) -> Optional[TopicMatch]:
+    """Prior run whose sections can be reused, at RESEARCH_TOPIC_SIMILARITY or above"""
+    index = get_topic_index()
+    if index is None:
+        return None
+    threshold = env_float("RESEARCH_TOPIC_SIMILARITY", 0.8)
+    match = index.find(topic, max_analysts, threshold, topic_ttl_seconds())
+    if match is None or not sections_reusable(match, threshold):
+        return None
+    return match
+
+def report_reusable(match: TopicMatch) -> bool:
+    """
+    Whether the match is close enough to return its final report as is.
+
+    Both the shingle similarity and the order-aware word-sequence similarity must
+    reach RESEARCH_TOPIC_REPORT_SIMILARITY, so "X on Y" never gets the report for "Y on X".
+    """
+    threshold = env_float("RESEARCH_TOPIC_REPORT_SIMILARITY", 0.95)
+    return match.similarity >= threshold and match.sequence_similarity >= threshold
+
+def record_run(topic: str, max_analysts: int, analysts: List[Analyst], sections: List[str], final_report: str) -> Optional[str]:
+    """Store a finished run in the topic index, if enabled"""
+    index = get_topic_index()
+    if index is None:
+        return None
+    return index.add(topic, max_analysts, analysts, sections, final_report, topic_ttl_seconds())
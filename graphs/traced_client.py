@@ -1,9 +1,20 @@
 # Traced BAML Client - A wrapper that adds tracing to BAML functions
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from baml_py import Collector
 from langsmith import traceable, get_current_run_tree
 from baml_client.sync_client import BamlSyncClient
+from baml_client.async_client import BamlAsyncClient, b as async_b
 from baml_client import b
+from graphs.profiling import span
+from graphs.concurrency import get_llm_limiter, get_llm_rate_limiter
+from graphs.token_budget import PreflightReport, preflight
+from graphs.batch import batch_requested, batched_llm_call
+from graphs.prompt_cache import TokenUsage, collector_usage, prompt_cache_stats
+from graphs.settings import fake_backends_enabled
+
+def prompt_tokens(preflight_report: Optional[PreflightReport]) -> int:
+    """Prompt tokens counted by the budget guard, 0 when the check is off"""
+    return preflight_report["tokens_after"] if preflight_report else 0
 
 class TracedBamlClient:
     """
@@ -11,10 +22,13 @@ class TracedBamlClient:
     
     This client automatically wraps ALL methods from the underlying BamlSyncClient
     with tracing, so it adapts automatically when new BAML functions are added.
+    Async nodes call allm_call / astream_call, which go through the BamlAsyncClient
+    so a waiting call holds no thread.
     """
     
-    def __init__(self, client: Optional[BamlSyncClient] = None):
+    def __init__(self, client: Optional[BamlSyncClient] = None, async_client: Optional[BamlAsyncClient] = None):
         self.client = client or b
+        self.async_client = async_client or async_b
     
     def __getattr__(self, name: str):
         """
@@ -39,12 +53,126 @@ class TracedBamlClient:
     
     def llm_call(self, function_name: str, *args, **kwargs) -> Any:
         """Internal method that handles tracing for all BAML calls"""
+        # Count prompt tokens locally and trim over-budget inputs before sending
+        with span(f"preflight.{function_name}", "cpu"):
+            kwargs, preflight_report = preflight(self.client, function_name, args, kwargs)
+
+        # Batch runs pause here until the batch runner resumes them with the provider's output
+        if batch_requested():
+            return self._batched_call(function_name, args, kwargs, preflight_report)
+
         collector = Collector(name=f"{function_name.lower()}-collector")
         kwargs["baml_options"] = {"collector": collector}
         
         baml_function = getattr(self.client, function_name)
-        result = baml_function(*args, **kwargs)
+        # Shared limiters keep concurrent runs within the provider's rate limits
+        get_llm_rate_limiter().wait(prompt_tokens(preflight_report))
+        with get_llm_limiter(), span(f"llm.{function_name}", "llm"):
+            result = baml_function(*args, **kwargs)
+
+        self._trace_collected_call(function_name, collector, preflight_report)
         
+        return result
+
+    def stream_call(self, function_name: str, *args, on_partial: Optional[Callable[[Any], None]] = None, **kwargs) -> Any:
+        """
+        Stream a BAML function, handing every partial result to on_partial.
+
+        Lets callers act on fields as soon as they are complete (see @stream.done)
+        while the rest of the output is still being generated.
+        """
+        with span(f"preflight.{function_name}", "cpu"):
+            kwargs, preflight_report = preflight(self.client, function_name, args, kwargs)
+
+        # Batched calls are not streamed; the complete result is the only partial
+        if batch_requested():
+            result = self._batched_call(function_name, args, kwargs, preflight_report)
+            if on_partial is not None:
+                on_partial(result)
+            return result
+
+        collector = Collector(name=f"{function_name.lower()}-collector")
+        kwargs["baml_options"] = {"collector": collector}
+
+        baml_stream_function = getattr(self.client.stream, function_name)
+        get_llm_rate_limiter().wait(prompt_tokens(preflight_report))
+        with get_llm_limiter(), span(f"llm.{function_name}", "llm"):
+            stream = baml_stream_function(*args, **kwargs)
+            for partial in stream:
+                if on_partial is not None:
+                    on_partial(partial)
+            result = stream.get_final_response()
+
+        self._trace_collected_call(function_name, collector, preflight_report)
+
+        return result
+
+    async def allm_call(self, function_name: str, *args, **kwargs) -> Any:
+        """Async counterpart of llm_call, for nodes of the async service graph"""
+        # Rendering and token counting are local; the sync client does them without I/O
+        with span(f"preflight.{function_name}", "cpu"):
+            kwargs, preflight_report = preflight(self.client, function_name, args, kwargs)
+
+        if batch_requested():
+            return self._batched_call(function_name, args, kwargs, preflight_report)
+
+        collector = Collector(name=f"{function_name.lower()}-collector")
+        kwargs["baml_options"] = {"collector": collector}
+
+        baml_function = getattr(self.async_client, function_name)
+        await get_llm_rate_limiter().async_wait(prompt_tokens(preflight_report))
+        async with get_llm_limiter():
+            with span(f"llm.{function_name}", "llm"):
+                result = await baml_function(*args, **kwargs)
+
+        self._trace_collected_call(function_name, collector, preflight_report)
+
+        return result
+
+    async def astream_call(self, function_name: str, *args, on_partial: Optional[Callable[[Any], None]] = None, **kwargs) -> Any:
+        """Async counterpart of stream_call; on_partial is called on the event loop"""
+        with span(f"preflight.{function_name}", "cpu"):
+            kwargs, preflight_report = preflight(self.client, function_name, args, kwargs)
+
+        if batch_requested():
+            result = self._batched_call(function_name, args, kwargs, preflight_report)
+            if on_partial is not None:
+                on_partial(result)
+            return result
+
+        collector = Collector(name=f"{function_name.lower()}-collector")
+        kwargs["baml_options"] = {"collector": collector}
+
+        baml_stream_function = getattr(self.async_client.stream, function_name)
+        await get_llm_rate_limiter().async_wait(prompt_tokens(preflight_report))
+        async with get_llm_limiter():
+            with span(f"llm.{function_name}", "llm"):
+                stream = baml_stream_function(*args, **kwargs)
+                async for partial in stream:
+                    if on_partial is not None:
+                        on_partial(partial)
+                result = await stream.get_final_response()
+
+        self._trace_collected_call(function_name, collector, preflight_report)
+
+        return result
+
+    def _batched_call(self, function_name: str, args: tuple, kwargs: dict, preflight_report: Optional[PreflightReport] = None) -> Any:
+        """Send a call through the provider batch endpoint (see graphs/batch.py)"""
+        with span(f"llm.batch.{function_name}", "llm"):
+            result, request, output_text = batched_llm_call(self.client, function_name, args, kwargs)
+
+        self._trace_llm_call(
+            function_name=function_name,
+            raw_input=request["body"],
+            raw_output=output_text,
+            preflight_report=preflight_report,
+        )
+
+        return result
+
+    def _trace_collected_call(self, function_name: str, collector: Collector, preflight_report: Optional[PreflightReport] = None):
+        """Send the raw request/response captured by the collector to LangSmith"""
         llm_input_messages = None
         llm_output_messages = None
         
@@ -58,20 +186,26 @@ class TracedBamlClient:
             if http_response and hasattr(http_response, 'body') and http_response.body and hasattr(http_response.body, 'json'):
                 llm_output_messages = http_response.body.json()
                 print(llm_output_messages)
+
+        # Cached prompt tokens show whether the stable prompt prefixes hit the provider cache
+        usage = collector_usage(collector)
+        if usage is not None:
+            prompt_cache_stats.record(function_name, usage)
+            get_llm_rate_limiter().debit(usage["output_tokens"])
                 
         self._trace_llm_call(
             function_name=function_name,
             raw_input=llm_input_messages or [],
             raw_output=llm_output_messages or [],
+            preflight_report=preflight_report,
+            usage=usage,
         )
-        
-        return result
     
     @traceable(
         run_type="llm", 
         metadata={"ls_provider": "baml", "ls_model_name": "gpt-4o"}
     )
-    def _trace_llm_call(self, function_name: str, raw_input: List, raw_output: Any):
+    def _trace_llm_call(self, function_name: str, raw_input: List, raw_output: Any, preflight_report: Optional[PreflightReport] = None, usage: Optional[TokenUsage] = None):
         """Función traceada que recibe solo el raw input y output del LLM"""
         run = get_current_run_tree()
         if run:
@@ -87,7 +221,19 @@ class TracedBamlClient:
             run.extra = {"baml_function": function_name}
             run.tags = [f"baml:{function_name}", "llm:gpt-4o"]
             run.name = f"BAML {function_name}"
+
+            # Prompt tokens counted locally before and after the budget guard
+            if preflight_report:
+                run.metadata.update({f"preflight_{key}": value for key, value in preflight_report.items()})
+
+            # Provider-reported usage, including prompt tokens served from cache
+            if usage:
+                run.metadata.update(usage)
         return raw_output
 
 # Create a global traced client instance
-traced_client = TracedBamlClient()
\ No newline at end of file
+if fake_backends_enabled():
+    from graphs.fakes import FakeAsyncBamlClient, FakeBamlClient
+    traced_client = TracedBamlClient(FakeBamlClient(), FakeAsyncBamlClient())
+else:
+    traced_client = TracedBamlClient()
\ No newline at end of file
@@ -1,8 +1,13 @@
 from operator import add
-from baml_client.types import Analyst
-from typing import List, TypedDict, Annotated
+from baml_client.types import Analyst, SectionDigest
+from typing import List, Optional, TypedDict, Annotated
 from langgraph.graph import MessagesState
 
+class RetrievedDocument(TypedDict):
+    source: str # URL or document source
+    page: Optional[str] # Page title, None for web results
+    content: str # Trimmed document text
+
 class GenerateAnalystsState(TypedDict):
     topic: str # Research topic
     max_analysts: int # Number of analysts
@@ -11,10 +16,11 @@ class GenerateAnalystsState(TypedDict):
 
 class InterviewState(MessagesState):
     max_num_turns: int # Number turns of conversation
-    context: Annotated[list, add] # Source docs
+    context: Annotated[list, add] # Source docs, one list of RetrievedDocument per retrieval
     analyst: Analyst # Analyst asking questions
     interview: str # Interview transcript
     sections: list # Final key we duplicate in outer state for Send() API
+    digests: List[SectionDigest] # Digest written together with the section
 
 class ResearchGraphState(TypedDict):
     topic: str # Research topic
@@ -22,8 +28,10 @@ class ResearchGraphState(TypedDict):
     human_analyst_feedback: str # Human feedback
     analysts: List[Analyst] # Analyst asking questions
     sections: Annotated[list, add] # Send() API key
+    digests: Annotated[List[SectionDigest], add] # Running outline and report insights, one digest per section
     introduction: str # Introduction for the final report
     content: str # Content for the final report
     conclusion: str # Conclusion for the final report
     final_report: str # Final report
+    reuse: str # Reuse of a prior run on a near-identical topic: "", "sections" or "report"
 
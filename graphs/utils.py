@@ -3,7 +3,9 @@ from baml_client.types import Message as BAMLMessage
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from baml_py import Collector
 from langsmith import traceable, get_current_run_tree
+from graphs.profiling import profiled
 
+@profiled("cpu")
 def langchain_messages_to_baml(messages: List) -> List[BAMLMessage]:
     """Convert LangChain messages to BAML Message format"""
     baml_messages = []
@@ -1,10 +1,11 @@
 from datetime import datetime
 from dotenv import load_dotenv
-from graphs.researcher_graph import get_research_graph_with_memory
 
-# Load environment variables
+# Load environment variables before the graphs read their settings
 load_dotenv()
 
+from graphs.researcher_graph import get_research_graph_with_memory
+
 def main():
     """Run the research agent"""
     
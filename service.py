@@ -0,0 +1,60 @@
+# Long-lived research worker: `make serve`, then POST /runs and poll GET /runs/{run_id}
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+
+# Load environment variables before the graphs read their settings
+load_dotenv()
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from graphs.service import QueueFullError, ResearchService
+
+service = ResearchService()
+
+async def submit_run(request: Request) -> JSONResponse:
+    """Queue a research run; 429 when the admission queue is full"""
+    body = await request.json()
+    if not body.get("topic"):
+        return JSONResponse({"error": "topic is required"}, status_code=400)
+    try:
+        run = service.submit(body["topic"], int(body.get("max_analysts", 2)))
+    except QueueFullError as e:
+        return JSONResponse({"error": str(e)}, status_code=429, headers={"Retry-After": "5"})
+    return JSONResponse(run, status_code=202)
+
+async def get_run(request: Request) -> JSONResponse:
+    run = service.runs.get(request.path_params["run_id"])
+    if run is None:
+        return JSONResponse({"error": "run not found"}, status_code=404)
+    return JSONResponse(run)
+
+async def health(request: Request) -> JSONResponse:
+    """Liveness plus a saturation flag load balancers can use"""
+    metrics = service.metrics()
+    return JSONResponse({
+        "status": "ok",
+        "saturated": metrics["queue_depth"] >= metrics["max_queue"],
+        "queue_depth": metrics["queue_depth"],
+        "in_flight_llm_calls": metrics["in_flight_llm_calls"],
+    })
+
+async def metrics(request: Request) -> JSONResponse:
+    return JSONResponse(service.metrics())
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    await service.start()
+    yield
+    await service.stop()
+
+app = Starlette(
+    routes=[
+        Route("/runs", submit_run, methods=["POST"]),
+        Route("/runs/{run_id}", get_run, methods=["GET"]),
+        Route("/health", health, methods=["GET"]),
+        Route("/metrics", metrics, methods=["GET"]),
+    ],
+    lifespan=lifespan,
+)
@@ -0,0 +1,183 @@
+"""
+Local stand-in for the OpenAI Files + Batches API.
+
+Accepts batch input files, "processes" each batch after --delay seconds and
+serves the output file, so batch mode can be exercised without a provider
+batch queue. With --fake, requests rendered by the simulated BAML client are
+answered locally; otherwise every line is forwarded to --upstream one by one.
+
+    python tests/batch_server.py --fake --port 8100
+    RESEARCH_FAKE_BACKENDS=true RESEARCH_BATCH_BASE_URL=http://localhost:8100/v1 \\
+        RESEARCH_BATCH_POLL_SECONDS=1 OPENAI_API_KEY=local python batch_research.py topics.txt
+"""
+import argparse
+import asyncio
+import email
+import json
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Tuple
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+files: Dict[str, dict] = {}
+batches: Dict[str, dict] = {}
+args: argparse.Namespace
+
+def new_id(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:24]}"
+
+def store_file(filename: str, content: bytes, purpose: str) -> dict:
+    record = {
+        "id": new_id("file"),
+        "object": "file",
+        "bytes": len(content),
+        "created_at": int(time.time()),
+        "filename": filename,
+        "purpose": purpose,
+        "status": "processed",
+    }
+    files[record["id"]] = {**record, "content": content}
+    return record
+
+def parse_multipart(content_type: str, body: bytes) -> Tuple[str, bytes, str]:
+    """(filename, content, purpose) from a multipart upload, without python-multipart"""
+    message = email.message_from_bytes(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body)
+    filename, content, purpose = "batch.jsonl", b"", "batch"
+    for part in message.get_payload():
+        name = part.get_param("name", header="content-disposition")
+        if name == "file":
+            filename = part.get_filename() or filename
+            content = part.get_payload(decode=True) or b""
+        elif name == "purpose":
+            purpose = (part.get_payload(decode=True) or b"batch").decode("utf-8").strip()
+    return filename, content, purpose
+
+def complete(body: dict, endpoint: str) -> dict:
+    """Response body for one batch line"""
+    if args.fake:
+        from graphs.fakes import fake_completion
+        return {
+            "id": new_id("chatcmpl"),
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": fake_completion(body)}, "finish_reason": "stop"}],
+        }
+
+    import httpx
+    response = httpx.post(
+        args.upstream.rstrip("/") + endpoint.removeprefix("/v1"),
+        json=body,
+        headers={"Authorization": f"Bearer {os.getenv('OPENAI_API_KEY', '')}"},
+        timeout=300,
+    )
+    response.raise_for_status()
+    return response.json()
+
+def process_line(line: str, endpoint: str) -> Tuple[bool, dict]:
+    request = json.loads(line)
+    try:
+        body = complete(request["body"], endpoint)
+    except Exception as e:
+        status = getattr(e, "status_code", None) or getattr(getattr(e, "response", None), "status_code", 500)
+        return False, {"id": new_id("batch_req"), "custom_id": request["custom_id"], "response": None,
+                       "error": {"code": str(status), "message": str(e)}}
+    return True, {"id": new_id("batch_req"), "custom_id": request["custom_id"],
+                  "response": {"status_code": 200, "request_id": new_id("req"), "body": body}, "error": None}
+
+def process_batch(batch_id: str):
+    """Run every line of a batch and attach the output and error files"""
+    batch = batches[batch_id]
+    batch["status"] = "in_progress"
+    batch["in_progress_at"] = int(time.time())
+    lines = [line for line in files[batch["input_file_id"]]["content"].decode("utf-8").splitlines() if line.strip()]
+    batch["request_counts"]["total"] = len(lines)
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        outcomes = list(executor.map(lambda line: process_line(line, batch["endpoint"]), lines))
+
+    succeeded = [json.dumps(record) for ok, record in outcomes if ok]
+    failed = [json.dumps(record) for ok, record in outcomes if not ok]
+    if succeeded:
+        batch["output_file_id"] = store_file(f"{batch_id}_output.jsonl", "\n".join(succeeded).encode("utf-8"), "batch_output")["id"]
+    if failed:
+        batch["error_file_id"] = store_file(f"{batch_id}_errors.jsonl", "\n".join(failed).encode("utf-8"), "batch_output")["id"]
+    batch["request_counts"].update({"completed": len(succeeded), "failed": len(failed)})
+    batch["status"] = "completed"
+    batch["completed_at"] = int(time.time())
+
+async def run_batch_later(batch_id: str):
+    await asyncio.sleep(args.delay)
+    await asyncio.to_thread(process_batch, batch_id)
+
+async def upload_file(request: Request) -> JSONResponse:
+    filename, content, purpose = parse_multipart(request.headers["content-type"], await request.body())
+    return JSONResponse(store_file(filename, content, purpose))
+
+async def file_content(request: Request) -> Response:
+    record = files.get(request.path_params["file_id"])
+    if record is None:
+        return JSONResponse({"error": {"message": "file not found"}}, status_code=404)
+    return Response(record["content"], media_type="application/jsonl")
+
+async def create_batch(request: Request) -> JSONResponse:
+    body = await request.json()
+    if body.get("input_file_id") not in files:
+        return JSONResponse({"error": {"message": "input file not found"}}, status_code=400)
+
+    batch: Dict[str, Any] = {
+        "id": new_id("batch"),
+        "object": "batch",
+        "endpoint": body["endpoint"],
+        "input_file_id": body["input_file_id"],
+        "completion_window": body.get("completion_window", "24h"),
+        "status": "validating",
+        "created_at": int(time.time()),
+        "output_file_id": None,
+        "error_file_id": None,
+        "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        "metadata": body.get("metadata"),
+    }
+    batches[batch["id"]] = batch
+    asyncio.create_task(run_batch_later(batch["id"]))
+    return JSONResponse(batch)
+
+async def get_batch(request: Request) -> JSONResponse:
+    batch = batches.get(request.path_params["batch_id"])
+    if batch is None:
+        return JSONResponse({"error": {"message": "batch not found"}}, status_code=404)
+    return JSONResponse(batch)
+
+app = Starlette(routes=[
+    Route("/v1/files", upload_file, methods=["POST"]),
+    Route("/v1/files/{file_id}/content", file_content, methods=["GET"]),
+    Route("/v1/batches", create_batch, methods=["POST"]),
+    Route("/v1/batches/{batch_id}", get_batch, methods=["GET"]),
+])
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local stand-in for a provider batch API")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--delay", type=float, default=2.0, help="Seconds a batch waits in the queue before it is processed")
+    parser.add_argument("--workers", type=int, default=16, help="Lines processed concurrently per batch")
+    parser.add_argument("--fake", action="store_true", help="Answer requests from the simulated BAML client")
+    parser.add_argument("--upstream", default="https://api.openai.com/v1", help="Chat completions API to forward lines to")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    import uvicorn
+    args = parse_args()
+    load_dotenv()
+    print(f"📦 Stand-in batch server on :{args.port} ({'fake completions' if args.fake else 'forwarding to ' + args.upstream})")
+    uvicorn.run(app, host="0.0.0.0", port=args.port)
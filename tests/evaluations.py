@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict
@@ -12,6 +13,7 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from graphs.researcher_graph import get_research_graph_with_memory
+from judge import CachedJudge
 
 def evaluate_research_agent(inputs: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -332,47 +334,27 @@ correctness_evaluator = create_llm_as_judge(
     continuous=True  # 0.0 - 1.0 score
 )
 
-def check_content_correctness(run, example):
-    """Use LLM only for content quality evaluation"""
-    try:
-        inputs = run.inputs.get("topic", "")
-        outputs = run.outputs.get("final_report", "")
-        reference_outputs = ""
-        
-        if example and example.outputs:
-            reference_outputs = example.outputs.get("expected_content", "A comprehensive research report")
-        
-        # Skip evaluation if no meaningful output
-        if len(outputs) < 20 or outputs.startswith("Error:"):
-            return {
-                "key": "content_correctness",
-                "score": 0
-            }
-        
-        result = correctness_evaluator(
-            inputs=inputs,
-            outputs=outputs,
-            reference_outputs=reference_outputs
-        )
-        
-        if isinstance(result, dict) and "score" in result:
-            return {
-                "key": "content_correctness",
-                "score": result["score"],
-                "comment": result.get("comment", "")
-            }
-        return {
-            "key": "content_correctness",
-            "score": 0,
-            "comment": "LLM evaluation did not return a valid score."
-        }
-        
-    except Exception as e:
-        print(f"Error in content evaluation: {e}")
-        return {
-            "key": "content_correctness",
-            "score": 0
-        }
+# Bump when the judge prompt or model changes; cached judgments are keyed on it
+JUDGE_PROMPT_VERSION = "correctness-gpt-4o-v1"
+
+judge = CachedJudge(
+    correctness_evaluator,
+    prompt_version=JUDGE_PROMPT_VERSION,
+    cache_path=os.getenv("EVAL_JUDGE_CACHE", ".research_cache/judge_cache.sqlite"),
+    max_concurrency=int(os.getenv("EVAL_JUDGE_CONCURRENCY", "4")),
+)
+
+def judge_feedback(judgment):
+    """Correctness score plus judge cost, reported apart from the agent's own latency"""
+    return {
+        "results": [
+            {"key": "content_correctness", "score": judgment["score"], "comment": judgment["comment"]},
+            {"key": "judge_latency_s", "score": judgment["latency_s"]},
+            {"key": "judge_input_tokens", "score": judgment["input_tokens"]},
+            {"key": "judge_output_tokens", "score": judgment["output_tokens"]},
+            {"key": "judge_cache_hit", "score": 1 if judgment["cached"] else 0},
+        ]
+    }
 
 def check_substantial_content(run, example):
     """Check if the report has substantial content"""
@@ -401,7 +383,42 @@ def check_substantial_content(run, example):
         "comment": f"Report length: {len(final_report)} characters."
     }
 
+def judge_runs(runs_and_examples):
+    """
+    Judge the content of many (run, example) pairs in one concurrent batch and record the feedback.
+
+    Runs without a meaningful report score 0 without calling the judge.
+    """
+    judged = []
+    items = []
+    for run, example in runs_and_examples:
+        final_report = (run.outputs or {}).get("final_report", "")
+        if len(final_report) < 20 or final_report.startswith("Error:"):
+            client.create_feedback(run.id, key="content_correctness", score=0)
+            continue
+        reference_outputs = example.outputs.get("expected_content", "A comprehensive research report") if example and example.outputs else ""
+        judged.append(run)
+        items.append((run.inputs.get("topic", ""), final_report, reference_outputs))
+
+    # Cached by (prompt version, topic, report hash, reference hash)
+    for run, judgment in zip(judged, judge.judge_many(items)):
+        for result in judge_feedback(judgment)["results"]:
+            client.create_feedback(run.id, key=result["key"], score=result["score"], comment=result.get("comment"))
+    return len(judged)
+
+def rescore_experiment(experiment_name):
+    """Re-judge every run of an existing experiment in one concurrent batch"""
+    runs = [run for run in client.list_runs(project_name=experiment_name, is_root=True) if run.outputs]
+    examples = {run.reference_example_id: client.read_example(run.reference_example_id) for run in runs if run.reference_example_id}
+
+    judged = judge_runs([(run, examples.get(run.reference_example_id)) for run in runs])
+    print(f"📊 Re-scored {judged} runs. Judge stats: {judge.stats}")
+
 if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--rescore":
+        rescore_experiment(sys.argv[2])
+        sys.exit(0)
+
     print("🚀 Starting evaluation with logic-based trajectory analysis...")
     
     experiment_results = client.evaluate(  # type: ignore
@@ -416,13 +433,10 @@ if __name__ == "__main__":
             check_complete_workflow,
             check_error_free_execution,
             check_analyst_creation_efficiency,
-            
-            # ✅ LLM-based content evaluators (for quality assessment)
-            check_content_correctness,
             check_substantial_content,
         ],
         experiment_prefix="research_agent_evaluation_logic_trajectory",
-        max_concurrency=1,
+        max_concurrency=int(os.getenv("EVAL_MAX_CONCURRENCY", "1")),
         num_repetitions=1,
         description="Research agent evaluation with logic-based trajectory analysis and LLM content evaluation",
         metadata={
@@ -434,5 +448,10 @@ if __name__ == "__main__":
         }
     )
     
+    # ✅ LLM content judge: one deferred, concurrent pass over every run instead of one call per evaluator invocation
+    judged = judge_runs([(row["run"], row["example"]) for row in experiment_results])
+
     print("✅ Evaluation completed!")
     print(f"📊 Results: {experiment_results}")
+    print(f"⚖️ Judged {judged} reports in one batch")
+    print(f"⚖️ Judge stats (separate from agent latency): {judge.stats}")
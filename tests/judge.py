@@ -0,0 +1,110 @@
+# Cached and batched LLM-as-judge scoring for the evaluation suite
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from langchain_core.callbacks import get_usage_metadata_callback
+
+def sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class JudgeCache:
+    """On-disk cache of judge results keyed by prompt version, topic and content hashes"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS judgments (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM judgments WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, result: dict):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO judgments (key, result) VALUES (?, ?)", (key, json.dumps(result)))
+            self._conn.commit()
+
+class CachedJudge:
+    """
+    Wraps an openevals judge with a result cache and a concurrency cap.
+
+    Judge latency and token usage are tracked separately from the agent, so
+    eval reports can tell the two apart. Bump prompt_version whenever the
+    judge prompt or model changes to invalidate old results.
+    """
+
+    def __init__(self, evaluator: Callable[..., Any], prompt_version: str, cache_path: str, max_concurrency: int = 4):
+        self.evaluator = evaluator
+        self.prompt_version = prompt_version
+        self.cache = JudgeCache(cache_path)
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._stats_lock = threading.Lock()
+        self.stats = {"calls": 0, "cache_hits": 0, "latency_s": 0.0, "input_tokens": 0, "output_tokens": 0}
+
+    def key(self, topic: str, report: str, reference: str) -> str:
+        """Cache key: (prompt version, topic, report hash, reference hash)"""
+        return sha256("\x00".join([self.prompt_version, topic, sha256(report), sha256(reference)]))
+
+    def judge(self, topic: str, report: str, reference: str) -> dict:
+        """Score one report; returns score, comment, cached, latency_s and token counts"""
+        key = self.key(topic, report, reference)
+        cached = self.cache.get(key)
+        if cached is not None:
+            with self._stats_lock:
+                self.stats["cache_hits"] += 1
+            return {**cached, "cached": True, "latency_s": 0.0, "input_tokens": 0, "output_tokens": 0}
+
+        with self._slots:
+            start = time.perf_counter()
+            with get_usage_metadata_callback() as usage:
+                try:
+                    result = self.evaluator(inputs=topic, outputs=report, reference_outputs=reference)
+                except Exception as e:
+                    # One failed judgment must not abort a batch; it scores 0 and is retried next time
+                    result = e
+            latency = time.perf_counter() - start
+
+        input_tokens = sum(model_usage.get("input_tokens", 0) for model_usage in usage.usage_metadata.values())
+        output_tokens = sum(model_usage.get("output_tokens", 0) for model_usage in usage.usage_metadata.values())
+        valid = isinstance(result, dict) and isinstance(result.get("score"), (int, float))
+        judgment = {
+            "score": result["score"] if valid else 0,
+            "comment": result.get("comment", "") if valid else f"Judge returned no score: {result!r}",
+        }
+        # A malformed judgment would otherwise stick until the prompt version changes
+        if valid:
+            self.cache.put(key, judgment)
+
+        with self._stats_lock:
+            self.stats["calls"] += 1
+            self.stats["latency_s"] += latency
+            self.stats["input_tokens"] += input_tokens
+            self.stats["output_tokens"] += output_tokens
+        return {**judgment, "cached": False, "latency_s": latency, "input_tokens": input_tokens, "output_tokens": output_tokens}
+
+    def judge_many(self, items: List[Tuple[str, str, str]]) -> List[dict]:
+        """
+        Score many (topic, report, reference) items at once.
+
+        Cached items return immediately; identical pending items are judged once,
+        and the rest run concurrently up to max_concurrency.
+        """
+        keys = [self.key(*item) for item in items]
+        pending: Dict[str, Tuple[str, str, str]] = {}
+        for key, item in zip(keys, items):
+            if key not in pending and self.cache.get(key) is None:
+                pending[key] = item
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            fresh = dict(zip(pending, executor.map(lambda item: self.judge(*item), pending.values())))
+
+        return [fresh[key] if key in fresh else self.judge(*item) for key, item in zip(keys, items)]
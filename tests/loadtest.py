@@ -0,0 +1,192 @@
+"""
+Load generator for the research graph.
+
+Drives N research threads with Poisson arrivals, either in-process against
+simulated LLM/search backends (default) or against a served deployment
+(`make dev` / langgraph server) with --url. Reports throughput, end-to-end and
+per-node latency percentiles, error rates and memory growth.
+
+    python tests/loadtest.py --runs 50 --rate 2 --concurrency 20
+    python tests/loadtest.py --url http://localhost:2024 --runs 20 --rate 0.5 --server-pid 1234
+
+reduce_tail_s is the time from the last finished section to the final report;
+compare it with and without RESEARCH_INCREMENTAL_REDUCE=true.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+TOPICS = [
+    "The impact of AI on software development productivity",
+    "Quantum computing in drug discovery",
+    "Remote work and urban real estate",
+    "Battery recycling supply chains",
+    "Open source sustainability",
+]
+
+def rss_mb(pid: Optional[int] = None) -> Optional[float]:
+    """Resident memory of a process from /proc, in MB"""
+    try:
+        with open(f"/proc/{pid or os.getpid()}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    from graphs.service import percentile
+    return {
+        "count": len(samples),
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "p99": round(percentile(samples, 99), 3),
+    }
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.e2e: List[float] = []
+        self.node_latency: Dict[str, List[float]] = defaultdict(list)
+        self.reduce_tail: List[float] = []
+        self.errors: Counter = Counter()
+        self.completed = 0
+        self.slots = asyncio.Semaphore(args.concurrency)
+
+    def record_span(self, name: str, category: str, seconds: float):
+        if category == "node":
+            self.node_latency[name].append(seconds)
+
+    def initial_state(self, i: int) -> dict:
+        return {
+            "topic": TOPICS[i % len(TOPICS)] + f" #{i}",
+            "max_analysts": self.args.max_analysts,
+            "human_analyst_feedback": "approve",
+        }
+
+    def record_update(self, nodes, now: float, last_section: Optional[float]) -> Optional[float]:
+        """Track the last finished section; the reduce tail runs from there to finalize_report"""
+        if "write_section" in nodes:
+            return now
+        if "finalize_report" in nodes and last_section is not None:
+            self.reduce_tail.append(now - last_section)
+        return last_section
+
+    async def run_in_process(self, graph, i: int):
+        config = {"configurable": {"thread_id": f"load-{i}"}, "recursion_limit": 50}
+        last_section = None
+        async for _, update in graph.astream(self.initial_state(i), config, stream_mode="updates", subgraphs=True):
+            last_section = self.record_update(update, time.perf_counter(), last_section)
+
+    async def run_served(self, client, i: int):
+        # Per-node latency is approximated by the time since the previous update of the same thread
+        thread = await client.threads.create()
+        last = time.perf_counter()
+        last_section = None
+        async for chunk in client.runs.stream(
+            thread["thread_id"],
+            self.args.assistant,
+            input=self.initial_state(i),
+            stream_mode="updates",
+            stream_subgraphs=True,
+        ):
+            now = time.perf_counter()
+            if chunk.event.startswith("updates") and isinstance(chunk.data, dict):
+                for node in chunk.data:
+                    self.node_latency[node].append(now - last)
+                last_section = self.record_update(chunk.data, now, last_section)
+            elif chunk.event == "error":
+                raise RuntimeError(json.dumps(chunk.data))
+            last = now
+
+    async def one(self, runner, target, i: int):
+        async with self.slots:
+            start = time.perf_counter()
+            try:
+                await runner(target, i)
+                self.e2e.append(time.perf_counter() - start)
+                self.completed += 1
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                self.errors[f"{type(e).__name__}{f' {status}' if status else ''}"] += 1
+
+    async def main(self) -> dict:
+        if self.args.url:
+            from langgraph_sdk import get_client
+            runner, target = self.run_served, get_client(url=self.args.url)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            from graphs.profiling import add_span_listener
+            from graphs.researcher_graph import get_research_graph_with_memory
+            add_span_listener(self.record_span)
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=self.args.threads))
+            runner, target = self.run_in_process, get_research_graph_with_memory()
+
+        memory_pid = self.args.server_pid if self.args.url else None
+        memory_start = rss_mb(memory_pid)
+        if not self.args.url:
+            tracemalloc.start()
+
+        # Poisson arrivals at --rate runs per second
+        started = time.perf_counter()
+        tasks = []
+        for i in range(self.args.runs):
+            tasks.append(asyncio.create_task(self.one(runner, target, i)))
+            await asyncio.sleep(random.expovariate(self.args.rate))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+        report: Dict[str, Any] = {
+            "runs": self.args.runs,
+            "completed": self.completed,
+            "elapsed_s": round(elapsed, 2),
+            "throughput_runs_per_min": round(self.completed / elapsed * 60, 2),
+            "error_rate": round(sum(self.errors.values()) / self.args.runs, 4),
+            "errors": dict(self.errors),
+            "end_to_end_s": summarize(self.e2e),
+            "reduce_tail_s": summarize(self.reduce_tail),
+            "node_latency_s": {node: summarize(samples) for node, samples in sorted(self.node_latency.items())},
+            "memory": {"rss_start_mb": memory_start, "rss_end_mb": rss_mb(memory_pid)},
+        }
+        if not self.args.url:
+            current, peak = tracemalloc.get_traced_memory()
+            report["memory"].update({"python_heap_end_mb": round(current / 2**20, 1), "python_heap_peak_mb": round(peak / 2**20, 1)})
+        return report
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the research graph")
+    parser.add_argument("--runs", type=int, default=20, help="Number of research threads to start")
+    parser.add_argument("--rate", type=float, default=1.0, help="Mean arrival rate, runs per second")
+    parser.add_argument("--concurrency", type=int, default=10, help="Maximum runs in flight")
+    parser.add_argument("--max-analysts", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=64, help="Executor threads for sync nodes (in-process)")
+    parser.add_argument("--url", help="Served deployment URL, e.g. http://localhost:2024")
+    parser.add_argument("--assistant", default="research_assistant", help="Graph id from langgraph.json")
+    parser.add_argument("--server-pid", type=int, help="Server PID to sample memory from (served mode)")
+    parser.add_argument("--real-backends", action="store_true", help="In-process: call the real LLM and search APIs")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    load_dotenv()
+    if not args.url and not args.real_backends:
+        # Must be set before the graphs are imported
+        os.environ["RESEARCH_FAKE_BACKENDS"] = "true"
+
+    print(f"🚦 Load test: {args.runs} runs at {args.rate}/s, concurrency {args.concurrency}, "
+          f"{'served ' + args.url if args.url else 'in-process'}")
+    report = asyncio.run(LoadTest(args).main())
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,105 @@
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from graphs import fakes, token_budget
+from graphs.batch import BatchRequest, BatchRunner, BatchStore
+from graphs.fakes import FakeBamlClient, fake_completion
+from graphs.researcher_graph import get_research_graph_builder
+from graphs.traced_client import traced_client
+
+TOPICS = ["AI coding assistants", "Quantum error correction", "Heat pumps in cold climates"]
+
+class InProcessBatchProvider:
+    """Batches submitted so far, shared by the clients of every (re)started runner"""
+
+    def __init__(self):
+        self.batches: Dict[str, Dict[str, dict]] = {}
+        self.submitted: List[str] = []
+        self.round_sizes: List[int] = []
+
+class InProcessBatchClient:
+    """OpenAIBatchClient stand-in answering each request with the fake backend; can crash while waiting"""
+
+    def __init__(self, provider: InProcessBatchProvider, crash_at_wait: int = 0):
+        self.provider = provider
+        self.crash_at_wait = crash_at_wait
+        self.waited: List[str] = []
+
+    def submit(self, requests: Dict[str, BatchRequest]) -> Dict[str, Dict[str, str]]:
+        batch_id = f"batch-{len(self.provider.batches)}"
+        self.provider.batches[batch_id] = {custom_id: request["body"] for custom_id, request in requests.items()}
+        self.provider.submitted.extend(requests)
+        self.provider.round_sizes.append(len(requests))
+        return {batch_id: {custom_id: request["function"] for custom_id, request in requests.items()}}
+
+    def wait(self, batch_id: str, functions: Dict[str, str]) -> Dict[str, Any]:
+        self.waited.append(batch_id)
+        if len(self.waited) == self.crash_at_wait:
+            raise RuntimeError("worker restarted")
+        return {custom_id: fake_completion(body) for custom_id, body in self.provider.batches[batch_id].items()}
+
+@pytest.fixture(autouse=True)
+def fake_backends(monkeypatch):
+    monkeypatch.setenv("RESEARCH_FAKE_BACKENDS", "true")
+    for variable in ("RESEARCH_FUSED_TURNS", "RESEARCH_LOCAL_INDEX_PATH", "RESEARCH_TOPIC_INDEX_PATH"):
+        monkeypatch.delenv(variable, raising=False)
+    for profile in (fakes.llm_profile, fakes.web_profile, fakes.wikipedia_profile):
+        monkeypatch.setattr(profile, "median_ms", 0.0)
+    monkeypatch.setattr(traced_client, "client", FakeBamlClient(latency=False))
+    monkeypatch.setattr(token_budget, "_encodings", {"fake": None})
+
+def build_graph(checkpointer):
+    return get_research_graph_builder(incremental_reduce=False, speculative=False, topic_reuse=False).compile(checkpointer=checkpointer)
+
+def batch_inputs() -> Dict[str, dict]:
+    return {
+        f"batch_{i}": {"topic": topic, "max_analysts": 2, "human_analyst_feedback": "approve"}
+        for i, topic in enumerate(TOPICS)
+    }
+
+def direct_reports() -> Dict[str, str]:
+    """Final reports of the same runs with every LLM call made directly"""
+    graph = build_graph(MemorySaver())
+    return {
+        thread_id: graph.invoke(graph_input, {"configurable": {"thread_id": thread_id}})["final_report"]
+        for thread_id, graph_input in batch_inputs().items()
+    }
+
+def test_batch_runner_resumes_every_branch_with_its_own_output():
+    provider = InProcessBatchProvider()
+    runner = BatchRunner(build_graph(MemorySaver()), InProcessBatchClient(provider))
+
+    results = runner.run(batch_inputs())
+
+    assert {thread_id: result.get("final_report") for thread_id, result in results.items()} == direct_reports()
+    # Parallel interview branches of each run were answered from the same round
+    assert max(provider.round_sizes) > len(TOPICS)
+    assert runner.rounds == len(provider.round_sizes)
+
+def test_batch_runner_reattaches_to_submitted_batches_after_a_restart(tmp_path):
+    state_path = str(tmp_path / "batch.sqlite")
+    provider = InProcessBatchProvider()
+
+    first = InProcessBatchClient(provider, crash_at_wait=3)
+    with pytest.raises(RuntimeError, match="worker restarted"):
+        BatchRunner(build_graph(SqliteSaver(sqlite3.connect(state_path, check_same_thread=False))), first, store=BatchStore(state_path)).run(batch_inputs())
+    in_flight = first.waited[-1]
+
+    second = InProcessBatchClient(provider)
+    graph = build_graph(SqliteSaver(sqlite3.connect(state_path, check_same_thread=False)))
+    results = BatchRunner(graph, second, store=BatchStore(state_path)).run(batch_inputs())
+
+    assert {thread_id: result.get("final_report") for thread_id, result in results.items()} == direct_reports()
+    # The batch in flight at the crash was awaited again, not submitted again
+    assert second.waited[0] == in_flight
+    assert len(provider.submitted) == len(set(provider.submitted))
+    assert BatchStore(state_path).submitted(provider.submitted) == {}
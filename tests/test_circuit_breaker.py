@@ -0,0 +1,96 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from graphs.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, get_retrieval_breaker
+
+def make(**options) -> CircuitBreaker:
+    settings = {"window": 4, "min_calls": 4, "slow_call_seconds": 10.0, "timeout_seconds": 5.0, "open_seconds": 60.0}
+    return CircuitBreaker("test", **{**settings, **options})
+
+def fail():
+    raise ValueError("backend down")
+
+def trip(breaker: CircuitBreaker):
+    for _ in range(breaker.min_calls):
+        breaker.record(False, 0.0)
+    assert breaker.state == OPEN
+
+def test_opens_on_failure_rate_once_min_calls_are_reached():
+    breaker = make()
+    breaker.record(True, 0.0)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            breaker.call(fail)
+    # 2 of 3 failed, but fewer than min_calls
+    assert breaker.state == CLOSED
+    breaker.record(True, 0.0)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "not called")
+
+def test_stays_closed_below_the_failure_rate():
+    breaker = make(failure_rate_threshold=0.75)
+    for success in (True, False, True, False, True, False):
+        breaker.record(success, 0.0)
+    assert breaker.state == CLOSED
+
+def test_opens_on_slow_call_rate():
+    breaker = make(slow_call_seconds=1.0)
+    for seconds in (0.1, 2.0, 0.1, 2.0):
+        breaker.record(True, seconds)
+    assert breaker.state == OPEN
+
+def test_timeouts_count_as_failures():
+    breaker = make(min_calls=1, timeout_seconds=0.05)
+    release = threading.Event()
+    with pytest.raises(TimeoutError):
+        breaker.call(release.wait, 5)
+    release.set()
+    assert breaker.state == OPEN
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = make(open_seconds=0.05)
+    trip(breaker)
+    assert breaker.is_open() and not breaker.allow()
+    time.sleep(0.06)
+    assert not breaker.is_open()
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+def test_successful_probe_closes_the_circuit():
+    breaker = make(open_seconds=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+    assert breaker.allow() and breaker.allow()
+
+def test_failed_probe_opens_the_circuit_again():
+    breaker = make(open_seconds=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    with pytest.raises(ValueError):
+        breaker.call(fail)
+    assert breaker.state == OPEN and breaker.is_open()
+
+def test_slow_probe_opens_the_circuit_again():
+    breaker = make(open_seconds=0.05, slow_call_seconds=1.0)
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(True, 2.0)
+    assert breaker.state == OPEN
+
+def test_retrieval_breakers_read_settings_on_first_use(monkeypatch):
+    monkeypatch.setenv("RESEARCH_BREAKER_MIN_CALLS", "7")
+    monkeypatch.setattr("graphs.circuit_breaker._retrieval_breakers", {})
+    assert get_retrieval_breaker("web").min_calls == 7
+    assert get_retrieval_breaker("web") is get_retrieval_breaker("web")
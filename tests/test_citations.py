@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graphs.citations import consolidate_sections, normalize_url, renumber_citations, split_sources
+
+def test_normalize_url_strips_tracking_params_only():
+    url = "https://www.example.com/page/?utm_source=x&ref=feed&ref_src=twsrc&fbclid=1&reference=abc&refresh=1#top"
+    assert normalize_url(url) == "https://example.com/page?reference=abc&refresh=1"
+
+def test_renumber_citations_maps_local_numbers():
+    assert renumber_citations("A [1]. B [2, 1].", {1: 3, 2: 5}) == "A [3]. B [3, 5]."
+
+def test_renumber_citations_drops_unmapped_numbers():
+    assert renumber_citations("A [1, 4]. B [4]. C [2]", {1: 3, 2: 1}) == "A [3]. B. C [1]"
+
+def test_renumber_citations_leaves_years_alone():
+    assert renumber_citations("Growth since [2019] was fast [1]. See [0].", {1: 2}) == "Growth since [2019] was fast [2]. See [0]."
+
+def test_renumber_citations_without_a_source_list_keeps_the_text():
+    assert renumber_citations("Growth since [2019] was fast [1].", {}) == "Growth since [2019] was fast [1]."
+
+def test_split_sources_accepts_bold_and_bare_headers():
+    for header in ("**Sources**", "**Sources:**", "Sources:", "### Sources"):
+        body, sources = split_sources(f"## One\nFirst [1].\n{header}\n1. https://example.com/a\n2) https://example.com/b")
+        assert body == "## One\nFirst [1]."
+        assert sources == {1: "https://example.com/a", 2: "https://example.com/b"}
+
+def test_consolidate_sections_keeps_sections_whose_list_does_not_parse():
+    sections = [
+        "## One\nFirst [1].\n### Sources\n[1] https://example.com/a",
+        "## Two\nSince [2019] it grew [1].\n### Sources\nsee the interview transcript",
+    ]
+    report = consolidate_sections(sections)
+    assert report["sources"] == ["https://example.com/a"]
+    assert report["sections"] == [
+        "## One\nFirst [1].",
+        "## Two\nSince [2019] it grew [1].\n### Sources\nsee the interview transcript",
+    ]
+
+def test_consolidate_sections_merges_duplicate_sources():
+    sections = [
+        "## One\nFirst [1]. Second [2].\n### Sources\n[1] https://example.com/a?utm_medium=x\n[2] https://example.com/b",
+        "## Two\nThird [1]. Fourth [2].\n### Sources\n[1] https://www.example.com/b/\n[2] https://example.com/c",
+    ]
+    report = consolidate_sections(sections)
+    assert report["sources"] == ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+    assert report["sections"] == ["## One\nFirst [1]. Second [2].", "## Two\nThird [2]. Fourth [3]."]
@@ -0,0 +1,96 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graphs.concurrency import ConcurrencyLimiter, RateLimiter
+
+def test_async_waiters_hold_no_threads_and_run_in_arrival_order():
+    limiter = ConcurrencyLimiter(1)
+    order = []
+
+    async def call(i: int):
+        async with limiter:
+            order.append(i)
+            await asyncio.sleep(0)
+
+    async def main():
+        threads = threading.active_count()
+        async with limiter:
+            tasks = [asyncio.create_task(call(i)) for i in range(20)]
+            await asyncio.sleep(0.01)
+            assert threading.active_count() == threads
+            assert limiter.in_flight == 1
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == list(range(20))
+    assert limiter.in_flight == 0
+
+def test_slots_are_shared_between_threads_and_coroutines():
+    limiter = ConcurrencyLimiter(1)
+    events = []
+    limiter.__enter__()
+
+    def sync_caller():
+        with limiter:
+            events.append("thread")
+
+    async def async_caller():
+        async with limiter:
+            events.append("coroutine")
+
+    async def main():
+        task = asyncio.create_task(async_caller())
+        await asyncio.sleep(0.01)
+        thread = threading.Thread(target=sync_caller)
+        thread.start()
+        time.sleep(0.01)
+        assert events == []
+        limiter.__exit__(None, None, None)
+        await task
+        await asyncio.to_thread(thread.join)
+
+    asyncio.run(main())
+    assert events == ["coroutine", "thread"]
+    assert limiter.in_flight == 0
+
+def test_cancelled_waiter_does_not_leak_its_slot():
+    limiter = ConcurrencyLimiter(1)
+
+    async def main():
+        async with limiter:
+            waiter = asyncio.create_task(limiter.__aenter__())
+            await asyncio.sleep(0)
+        # The slot was handed to the waiter; cancelling it before it runs passes the slot on
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.wait_for(limiter.__aenter__(), timeout=1)
+        await limiter.__aexit__(None, None, None)
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+
+def test_rate_limiter_spaces_requests_beyond_the_burst():
+    limiter = RateLimiter(requests_per_minute=60)
+    delays = [limiter.reserve() for _ in range(62)]
+    assert all(delay == 0 for delay in delays[:60])
+    assert 0.9 < delays[60] <= 1.0
+    assert 1.9 < delays[61] <= 2.0
+
+def test_rate_limiter_charges_prompt_and_completion_tokens():
+    limiter = RateLimiter(tokens_per_minute=600)
+    assert limiter.reserve(500) == 0
+    limiter.debit(100)
+    # 100 tokens over budget at 10 tokens per second
+    assert 9.9 < limiter.reserve(100) <= 10.0
+
+def test_rate_limiter_is_off_by_default():
+    limiter = RateLimiter()
+    assert limiter.reserve(10_000) == 0
+    limiter.debit(10_000)
+    assert limiter.reserve(10_000) == 0
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from graphs.passage_index import get_passage_index, lookup_local_passages, split_passages
+
+QUERY = "zyxcorp battery recycling policy europe"
+
+# Unrelated passages, so that rare terms get a high BM25 idf
+FILLER = [
+    (f"https://example.com/filler-{i}", "", f"Report {i} on solar panels, wind turbines and grid storage markets in Asia.")
+    for i in range(500)
+]
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESEARCH_LOCAL_INDEX_PATH", str(tmp_path / "passages.sqlite"))
+    for variable in ("RESEARCH_LOCAL_INDEX_MIN_HITS", "RESEARCH_LOCAL_INDEX_MIN_SCORE", "RESEARCH_LOCAL_INDEX_MIN_COVERAGE"):
+        monkeypatch.delenv(variable, raising=False)
+    index = get_passage_index()
+    index.add("web", FILLER)
+    yield index
+    index.close()
+
+def test_single_rare_shared_term_does_not_skip_the_live_search(index):
+    index.add("web", [
+        ("https://example.com/zyxcorp-1", "", "Zyxcorp shares rose after the quarterly earnings call."),
+        ("https://example.com/zyxcorp-2", "", "Analysts expect zyxcorp to open new offices next year."),
+    ])
+    # The rare term alone scores above the BM25 threshold...
+    assert all(passage.score >= 5.0 for passage in index.search(QUERY, backend="web"))
+    # ...but covers a fifth of the query
+    assert lookup_local_passages(QUERY, backend="web") == []
+
+def test_passages_covering_the_query_skip_the_live_search(index):
+    index.add("web", [
+        ("https://example.com/recycling-1", "", "Zyxcorp backs the new battery recycling policy adopted across Europe."),
+        ("https://example.com/recycling-2", "", "Europe's battery recycling policy sets targets that zyxcorp must meet."),
+    ])
+    passages = lookup_local_passages(QUERY, backend="web")
+    assert {passage.source for passage in passages} == {"https://example.com/recycling-1", "https://example.com/recycling-2"}
+    assert lookup_local_passages(QUERY, backend="wikipedia") == []
+
+def test_a_single_strong_passage_is_not_enough(index):
+    index.add("web", [("https://example.com/recycling-1", "", "Zyxcorp backs the new battery recycling policy adopted across Europe.")])
+    assert lookup_local_passages(QUERY, backend="web") == []
+
+def test_split_passages_hard_wraps_long_paragraphs():
+    text = "Short intro.\n\n" + "x" * 250 + "\n\nTail paragraph."
+    passages = split_passages(text, max_chars=100)
+    assert passages == ["Short intro.", "x" * 100, "x" * 100, "x" * 50 + "\n\nTail paragraph."]
+    assert all(len(passage) <= 100 for passage in passages)
+
+def test_split_passages_packs_short_paragraphs():
+    assert split_passages("One.\n\nTwo.\n\n\nThree.", max_chars=12) == ["One.\n\nTwo.", "Three."]
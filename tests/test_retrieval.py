@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graphs.retrieval import select_relevant_sections, split_wikipedia_sections
+
+PAGE = "\n\n".join([
+    "Heat pumps move heat instead of generating it.",
+    "== History ==\nEarly designs date from the nineteenth century.",
+    "== Cold climates ==\nCold climate heat pumps keep working at low outdoor temperatures.",
+    "== Manufacturers ==\nSeveral companies build them.",
+    "== Efficiency in cold weather ==\nEfficiency drops as the outdoor temperature falls in cold weather.",
+])
+
+def test_split_wikipedia_sections_keeps_the_lead_first():
+    sections = split_wikipedia_sections(PAGE)
+    assert sections[0] == ("", "Heat pumps move heat instead of generating it.")
+    assert [heading for heading, _ in sections[1:]] == ["History", "Cold climates", "Manufacturers", "Efficiency in cold weather"]
+
+def test_select_relevant_sections_keeps_the_lead_and_relevant_sections_in_page_order():
+    selected = select_relevant_sections(PAGE, "heat pumps in cold weather", max_chars=1000)
+    assert selected == "\n\n".join([
+        "Heat pumps move heat instead of generating it.",
+        "== Cold climates ==\nCold climate heat pumps keep working at low outdoor temperatures.",
+        "== Efficiency in cold weather ==\nEfficiency drops as the outdoor temperature falls in cold weather.",
+    ])
+
+def test_select_relevant_sections_prefers_the_best_section_within_max_chars():
+    selected = select_relevant_sections(PAGE, "efficiency in cold weather", max_chars=130)
+    assert len(selected) <= 130
+    assert selected.startswith("Heat pumps move heat instead of generating it.")
+    assert "== Efficiency in cold weather ==" in selected
+    assert "== Cold climates ==" not in selected
+
+def test_select_relevant_sections_truncates_a_long_lead():
+    assert select_relevant_sections("x" * 500 + "\n== Cold ==\ncold", "cold", max_chars=100) == "x" * 100
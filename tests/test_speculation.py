@@ -0,0 +1,83 @@
+import sys
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from baml_client.types import Analyst
+from graphs.speculation import SpeculativeInterviews
+
+TOPIC = "AI coding assistants"
+ADA = Analyst(affiliation="Lab", name="Ada", role="Researcher", description="Studies adoption")
+GRACE = Analyst(affiliation="Lab", name="Grace", role="Engineer", description="Studies tooling")
+LINUS = Analyst(affiliation="Lab", name="Linus", role="Maintainer", description="Studies reviews")
+
+class StubExecutor:
+    """Hands out pending futures instead of running first turns"""
+
+    def __init__(self):
+        self.futures: List[Future] = []
+        self.analysts: List[Analyst] = []
+
+    def submit(self, run, fn, topic, analyst) -> Future:
+        future = Future()
+        self.futures.append(future)
+        self.analysts.append(analyst)
+        return future
+
+def speculation(ttl_seconds: float = 60.0) -> SpeculativeInterviews:
+    interviews = SpeculativeInterviews(max_workers=1, ttl_seconds=ttl_seconds)
+    interviews._executor = StubExecutor()
+    return interviews
+
+def test_threads_on_the_same_topic_do_not_share_turns():
+    interviews = speculation()
+    interviews.start("thread-1", TOPIC, [ADA])
+    interviews.start("thread-2", TOPIC, [ADA])
+    first, second = interviews._executor.futures
+    first.set_result({"messages": ["thread-1"]})
+    second.set_result({"messages": ["thread-2"]})
+
+    assert interviews.claim("thread-2", TOPIC, ADA, timeout=0) == {"messages": ["thread-2"]}
+    assert interviews.claim("thread-1", TOPIC, ADA, timeout=0) == {"messages": ["thread-1"]}
+    # A turn is handed out once
+    assert interviews.claim("thread-1", TOPIC, ADA, timeout=0) is None
+
+def test_changed_analysts_cancel_their_turns_and_unchanged_ones_are_kept():
+    interviews = speculation()
+    interviews.start("thread-1", TOPIC, [ADA, GRACE])
+    ada_turn, grace_turn = interviews._executor.futures
+
+    interviews.start("thread-1", TOPIC, [ADA, LINUS])
+
+    assert grace_turn.cancelled()
+    assert not ada_turn.cancelled()
+    assert interviews._executor.analysts == [ADA, GRACE, LINUS]
+    assert interviews.claim("thread-1", TOPIC, GRACE, timeout=0) is None
+
+def test_unfinished_turn_is_not_waited_for_beyond_the_timeout():
+    interviews = speculation()
+    interviews.start("thread-1", TOPIC, [ADA])
+    started = time.monotonic()
+    assert interviews.claim("thread-1", TOPIC, ADA, timeout=0.05) is None
+    assert time.monotonic() - started < 1
+
+def test_failed_turn_is_run_in_the_graph_instead():
+    interviews = speculation()
+    interviews.start("thread-1", TOPIC, [ADA])
+    interviews._executor.futures[0].set_exception(RuntimeError("search failed"))
+    assert interviews.claim("thread-1", TOPIC, ADA, timeout=0) is None
+
+def test_expired_threads_are_evicted():
+    interviews = speculation(ttl_seconds=0.05)
+    interviews.start("abandoned", TOPIC, [ADA, GRACE])
+    time.sleep(0.06)
+    interviews.start("thread-2", TOPIC, [ADA])
+
+    assert all(turn.cancelled() for turn in interviews._executor.futures[:2])
+    assert "abandoned" not in interviews._turns and "abandoned" not in interviews._started
+    assert interviews.claim("abandoned", TOPIC, ADA, timeout=0) is None
+    assert "thread-2" in interviews._turns
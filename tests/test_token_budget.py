@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from graphs import token_budget
+from graphs.fakes import FakeRequests
+from graphs.token_budget import PromptBudgetExceeded, count_tokens, preflight, trim_value
+
+CLIENT = SimpleNamespace(request=FakeRequests())
+
+@pytest.fixture
+def budget(monkeypatch):
+    """Small latency budget so short test prompts overflow; tokens estimated from characters"""
+    monkeypatch.setattr(token_budget, "_encodings", {"fake": None})
+    monkeypatch.setenv("RESEARCH_PROMPT_TOKEN_BUDGET", "200")
+    return 200
+
+def test_trim_value_keeps_the_requested_end_of_a_string():
+    assert trim_value("abcdefghij", 0.3, "tail") == "hij"
+    assert trim_value("abcdefghij", 0.3, "head") == "abc"
+    assert trim_value("abcdefghij", 0.0, "tail") == ""
+
+def test_trim_value_keeps_the_first_and_most_recent_messages():
+    messages = [f"m{i}" for i in range(10)]
+    assert trim_value(messages, 0.3, "tail") == ["m0", "m8", "m9"]
+    assert trim_value(messages, 0.1, "tail") == ["m9"]
+    assert trim_value(["only"], 0.1, "tail") == ["only"]
+
+def test_count_tokens_falls_back_when_the_encoding_cannot_be_downloaded(monkeypatch):
+    def offline(name):
+        raise OSError("no network")
+    monkeypatch.setattr(token_budget, "_encodings", {})
+    monkeypatch.setattr(token_budget.tiktoken, "encoding_for_model", offline)
+    monkeypatch.setattr(token_budget.tiktoken, "get_encoding", offline)
+    assert count_tokens("x" * 40, "gpt-4o") == 11
+    assert token_budget._encodings == {"gpt-4o": None}
+
+def test_trim_policy_shrinks_the_trimmable_argument(monkeypatch, budget):
+    monkeypatch.setenv("RESEARCH_PROMPT_OVERFLOW_POLICY", "trim")
+    kwargs, report = preflight(CLIENT, "GenerateAnswer", (), {"context": "evidence " * 200, "messages": []})
+    assert report["trimmed_arg"] == "context"
+    assert report["tokens_before"] > budget >= report["tokens_after"]
+    assert kwargs["context"].endswith("evidence ") and len(kwargs["context"]) < len("evidence " * 200)
+
+def test_trim_policy_leaves_prompts_within_budget_alone(monkeypatch, budget):
+    monkeypatch.setenv("RESEARCH_PROMPT_OVERFLOW_POLICY", "trim")
+    kwargs = {"context": "short", "messages": []}
+    sent, report = preflight(CLIENT, "GenerateAnswer", (), kwargs)
+    assert sent == kwargs and report["trimmed_arg"] is None
+
+def test_trim_policy_raises_for_functions_without_a_trimmable_argument(monkeypatch, budget):
+    monkeypatch.setenv("RESEARCH_PROMPT_OVERFLOW_POLICY", "trim")
+    with pytest.raises(PromptBudgetExceeded):
+        preflight(CLIENT, "CreateAnalysts", (), {"topic": "ai " * 500, "human_analyst_feedback": "", "max_analysts": 3})
+
+def test_error_policy_raises_instead_of_trimming(monkeypatch, budget):
+    monkeypatch.setenv("RESEARCH_PROMPT_OVERFLOW_POLICY", "error")
+    with pytest.raises(PromptBudgetExceeded):
+        preflight(CLIENT, "GenerateAnswer", (), {"context": "evidence " * 200, "messages": []})
+
+def test_off_policy_skips_the_check(monkeypatch, budget):
+    monkeypatch.setenv("RESEARCH_PROMPT_OVERFLOW_POLICY", "off")
+    kwargs = {"context": "evidence " * 200, "messages": []}
+    assert preflight(CLIENT, "GenerateAnswer", (), kwargs) == (kwargs, None)
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from baml_client.types import Analyst
+from graphs.topic_index import (
+    TopicIndex, find_similar_run, jaccard, normalize_topic, report_reusable, sequence_similarity,
+    topic_shingles, unmatched_words,
+)
+
+ANALYSTS = [Analyst(affiliation="Lab", name="Ada", role="Researcher", description="Studies the topic")]
+TTL = 3600.0
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = tmp_path / "topics.sqlite"
+    monkeypatch.setenv("RESEARCH_TOPIC_INDEX_PATH", str(path))
+    monkeypatch.delenv("RESEARCH_TOPIC_SIMILARITY", raising=False)
+    monkeypatch.delenv("RESEARCH_TOPIC_REPORT_SIMILARITY", raising=False)
+    return path
+
+def record(path, topic: str):
+    index = TopicIndex(str(path))
+    index.add(topic, len(ANALYSTS), ANALYSTS, [f"## {topic}\nBody"], f"# {topic}", TTL)
+    index.close()
+
+def shingle_similarity(left: str, right: str) -> float:
+    return jaccard(topic_shingles(normalize_topic(left)), topic_shingles(normalize_topic(right)))
+
+def test_unmatched_words_tolerates_plurals_but_not_other_entities():
+    assert unmatched_words("Impact of AI agents", "impact of the AI agent") == []
+    assert unmatched_words("Renewable energy policy in Germany", "Renewable energy policy in France") == ["france", "germany"]
+
+def test_different_country_is_not_reused_despite_high_shingle_similarity(index_path):
+    topic = "Economic impact of renewable energy subsidies on manufacturing employment in {}"
+    record(index_path, topic.format("Germany"))
+    assert shingle_similarity(topic.format("Germany"), topic.format("France")) >= 0.8
+    assert find_similar_run(topic.format("France"), len(ANALYSTS)) is None
+
+def test_reversed_comparison_is_not_reused(index_path):
+    record(index_path, "Python 2 vs Python 3")
+    assert shingle_similarity("Python 2 vs Python 3", "Python 3 vs Python 2") >= 0.8
+    assert sequence_similarity("Python 2 vs Python 3", "Python 3 vs Python 2") < 0.8
+    assert find_similar_run("Python 3 vs Python 2", len(ANALYSTS)) is None
+
+def test_rephrased_topic_reuses_sections_but_not_report(index_path):
+    record(index_path, "Impact of AI agents on software engineering")
+    match = find_similar_run("The impact of AI agents on software engineering", len(ANALYSTS))
+    assert match is not None
+    assert match.sections == ["## Impact of AI agents on software engineering\nBody"]
+    assert match.analysts == ANALYSTS
+    assert not report_reusable(match)
+
+def test_identical_topic_reuses_report(index_path):
+    record(index_path, "Impact of AI agents on software engineering")
+    match = find_similar_run("impact of AI agents on software engineering!", len(ANALYSTS))
+    assert match is not None and report_reusable(match)
+
+def test_different_analyst_count_is_not_reused(index_path):
+    record(index_path, "Impact of AI agents on software engineering")
+    assert find_similar_run("Impact of AI agents on software engineering", len(ANALYSTS) + 1) is None